@@ -7,17 +7,24 @@
 
 import os
 import json
-from typing import Dict, List, Optional
+import time
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional, Tuple
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
 
 from intelligent_requirement_analyzer import IntelligentRequirementAnalyzer, RequirementAnalysis
 from dynamic_agent_matcher import DynamicAgentMatcher, AgentSelection
-from smart_model_allocator import SmartModelAllocator, ModelAllocation
+from smart_model_allocator import get_model_allocator, ModelAllocation
 from quality_assurance_framework import QualityAssuranceFramework
 from minimal_documentation_generator import MinimalDocumentationGenerator
 
+# 단계별 메모이즈 결과 최대 보관 수
+STAGE_CACHE_SIZE = 64
+
 @dataclass
 class ScriptGenerationResult:
     """스크립트 생성 결과"""
@@ -28,15 +35,67 @@ class ScriptGenerationResult:
     generation_metadata: Dict
     is_production_ready: bool
 
+class StageCache:
+    """파이프라인 단계별 결과 캐시 - (단계, 입력 키) LRU"""
+
+    def __init__(self, max_entries: int = STAGE_CACHE_SIZE):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Tuple[str, Any], Any]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats: Dict[str, Dict[str, int]] = {}
+
+    def get_or_compute(self, stage: str, key: Any, compute: Callable[[], Any]) -> Tuple[Any, bool]:
+        """
+        캐시된 결과 반환, 없으면 compute 실행 후 저장
+
+        Returns:
+            Tuple[Any, bool]: (결과, 캐시 적중 여부)
+        """
+        cache_key = (stage, key)
+        with self._lock:
+            stats = self._stats.setdefault(stage, {'hits': 0, 'misses': 0})
+            if cache_key in self._entries:
+                self._entries.move_to_end(cache_key)
+                stats['hits'] += 1
+                return self._entries[cache_key], True
+            stats['misses'] += 1
+
+        value = compute()
+
+        with self._lock:
+            self._entries[cache_key] = value
+            self._entries.move_to_end(cache_key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return value, False
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def get_stats(self) -> Dict:
+        with self._lock:
+            return {'size': len(self._entries), 'stages': {stage: dict(s) for stage, s in self._stats.items()}}
+
+
+def _hash_text(*parts: str) -> str:
+    digest = hashlib.sha256()
+    for part in parts:
+        digest.update(part.encode('utf-8'))
+        digest.update(b'\0')
+    return digest.hexdigest()
+
+
 class AdaptiveScriptGenerator:
     """적응형 스크립트 생성 엔진"""
 
     def __init__(self, model_config_path: str = "model_config.json"):
         self.analyzer = IntelligentRequirementAnalyzer()
         self.matcher = DynamicAgentMatcher()
-        self.allocator = SmartModelAllocator(model_config_path)
+        self.allocator = get_model_allocator(model_config_path)
         self.qa_framework = QualityAssuranceFramework()
         self.doc_generator = MinimalDocumentationGenerator()
+        self.stage_cache = StageCache()
 
     def generate_optimal_script(self,
                               requirement: str,
@@ -48,50 +107,139 @@ class AdaptiveScriptGenerator:
         """최적화된 스크립트 생성"""
 
         print(f"🚀 적응형 스크립트 생성 시작 - {execution_id}")
+        return self._run_pipeline(
+            requirement, project_path, execution_id, budget, strategy, max_quality_iterations
+        )
+
+    def generate_optimal_script_with_manual_models(self,
+                                                   requirement: str,
+                                                   selected_models: dict,
+                                                   project_path: str,
+                                                   execution_id: str,
+                                                   budget: str = "medium",
+                                                   strategy: str = "balanced",
+                                                   max_quality_iterations: int = 2) -> ScriptGenerationResult:
+        """수동 모델 선택을 사용한 최적화된 스크립트 생성 (분석/에이전트 선택 단계는 캐시 재사용)"""
+
+        print(f"🚀 수동 모델 선택 적응형 스크립트 생성 시작 - {execution_id}")
+        print(f"   선택된 모델: {selected_models}")
+        return self._run_pipeline(
+            requirement, project_path, execution_id, budget, strategy, max_quality_iterations,
+            selected_models=selected_models
+        )
+
+    def _run_stage(self, timings: Dict, stage: str, key: Any, compute: Callable[[], Any]) -> Any:
+        """단계 실행 - key가 있으면 같은 입력의 이전 결과 재사용, 소요 시간 기록"""
+        started = time.perf_counter()
+        if key is None:
+            value, cached = compute(), False
+        else:
+            value, cached = self.stage_cache.get_or_compute(stage, key, compute)
+        timings[stage] = {'seconds': round(time.perf_counter() - started, 4), 'cached': cached}
+        return value
+
+    def _run_pipeline(self,
+                      requirement: str,
+                      project_path: str,
+                      execution_id: str,
+                      budget: str,
+                      strategy: str,
+                      max_quality_iterations: int,
+                      selected_models: Optional[dict] = None) -> ScriptGenerationResult:
+        """
+        분석 → 매칭 → 모델 할당 → 렌더링 → 품질 개선 → 파일 생성 → 문서 → 메타데이터
+
+        각 단계 키는 해당 단계 입력으로만 구성 (분석: 요구사항 해시, 선택: 분석 키,
+        할당: 선택 키 + 예산/전략/모델 설정 버전 또는 수동 모델, 렌더링/품질: 이전 단계 키 + 스크립트 입력).
+        파일을 쓰는 단계는 캐시하지 않음
+        """
+        timings: Dict[str, Dict] = {}
 
         # 1. 요구사항 분석
         print("📋 요구사항 분석 중...")
-        analysis = self.analyzer.analyze_requirement(requirement)
+        analysis_key = _hash_text(requirement)
+        analysis = self._run_stage(
+            timings, 'analysis', analysis_key,
+            lambda: self.analyzer.analyze_requirement(requirement)
+        )
         print(f"   도메인: {analysis.domain}, 복잡도: {analysis.complexity.value}, 에이전트 수: {analysis.agent_count}")
 
         # 2. 에이전트 매칭
         print("🎭 최적 에이전트 조합 선택 중...")
-        agent_selection = self.matcher.select_optimal_agents(analysis)
+        selection_key = analysis_key
+        agent_selection = self._run_stage(
+            timings, 'agent_selection', selection_key,
+            lambda: self.matcher.select_optimal_agents(analysis)
+        )
         print(f"   선택된 에이전트: {[agent.name for agent in agent_selection.agents]}")
 
         # 3. 모델 할당
-        print("🧠 LLM 모델 할당 중...")
-        model_allocation = self.allocator.allocate_models(agent_selection, analysis, budget, strategy)
-        print(f"   할당 전략: {strategy}, 예상 비용: {model_allocation.total_estimated_cost:.1f}")
+        if selected_models:
+            print("🧠 수동 선택 모델 할당 중...")
+            allocation_key = (selection_key, 'manual', tuple(sorted(selected_models.items())),
+                              self.allocator.get_stats()['config_version'])
+            model_allocation = self._run_stage(
+                timings, 'model_allocation', allocation_key,
+                lambda: self._create_manual_model_allocation(selected_models, agent_selection)
+            )
+            print(f"   수동 할당 완료, 에이전트-모델 매핑: {model_allocation.agent_model_mapping}")
+        else:
+            print("🧠 LLM 모델 할당 중...")
+            allocation_key = (selection_key, budget, strategy, self.allocator.get_stats()['config_version'])
+            model_allocation = self._run_stage(
+                timings, 'model_allocation', allocation_key,
+                lambda: self.allocator.allocate_models(agent_selection, analysis, budget, strategy)
+            )
+            print(f"   할당 전략: {strategy}, 예상 비용: {model_allocation.total_estimated_cost:.1f}")
 
         # 4. 스크립트 생성
         print("⚙️  CrewAI 스크립트 생성 중...")
-        script_content = self._generate_script_content(
-            requirement, analysis, agent_selection, model_allocation, project_path, execution_id
+        render_key = (allocation_key, project_path, execution_id)
+        script_content = self._run_stage(
+            timings, 'render', render_key,
+            lambda: self._generate_script_content(
+                requirement, analysis, agent_selection, model_allocation, project_path, execution_id
+            )
         )
 
         # 5. 품질 검증 및 개선
         print("🔍 품질 검증 및 개선 중...")
-        script_content, quality_report = self._improve_script_quality(
-            script_content, requirement, project_path, max_quality_iterations
+        quality_key = (_hash_text(script_content, requirement, project_path), max_quality_iterations)
+        script_content, quality_report = self._run_stage(
+            timings, 'quality', quality_key,
+            lambda: self._improve_script_quality(
+                script_content, requirement, project_path, max_quality_iterations
+            )
         )
 
         # 6. 프로젝트 구조 생성
         print("📁 프로젝트 구조 생성 중...")
-        project_structure = self._create_project_structure(
-            project_path, script_content, analysis.required_libraries
+        project_structure = self._run_stage(
+            timings, 'project_structure', None,
+            lambda: self._create_project_structure(project_path, script_content, analysis.required_libraries)
         )
 
         # 7. 문서화
         print("📝 문서 생성 중...")
-        readme_path = self._generate_documentation(
-            requirement, analysis, agent_selection, model_allocation, project_path
+        readme_path = self._run_stage(
+            timings, 'documentation', None,
+            lambda: self._generate_documentation(
+                requirement, analysis, agent_selection, model_allocation, project_path
+            )
         )
 
         # 8. 메타데이터 생성
         generation_metadata = self._create_generation_metadata(
             requirement, analysis, agent_selection, model_allocation, quality_report, execution_id
         )
+        if selected_models:
+            generation_metadata.update({
+                "generation_mode": "manual_models",
+                "selected_models": selected_models,
+                "budget": budget,
+                "strategy": strategy
+            })
+        generation_metadata["stage_timings"] = timings
 
         print(f"✅ 스크립트 생성 완료! 품질 점수: {quality_report.overall_score:.1f}/100")
 
@@ -667,83 +815,8 @@ crew = Crew(
             }
         }
 
-    def generate_optimal_script_with_manual_models(self,
-                                                   requirement: str,
-                                                   selected_models: dict,
-                                                   project_path: str,
-                                                   execution_id: str,
-                                                   budget: str = "medium",
-                                                   strategy: str = "balanced",
-                                                   max_quality_iterations: int = 2) -> ScriptGenerationResult:
-        """수동 모델 선택을 사용한 최적화된 스크립트 생성"""
-
-        print(f"🚀 수동 모델 선택 적응형 스크립트 생성 시작 - {execution_id}")
-        print(f"   선택된 모델: {selected_models}")
-
-        # 1. 요구사항 분석
-        print("📋 요구사항 분석 중...")
-        analysis = self.analyzer.analyze_requirement(requirement)
-        print(f"   도메인: {analysis.domain}, 복잡도: {analysis.complexity.value}, 에이전트 수: {analysis.agent_count}")
-
-        # 2. 에이전트 매칭 (고품질 에이전트 강제 사용)
-        print("🎭 고품질 에이전트 조합 선택 중...")
-        agent_selection = self.matcher.select_optimal_agents(analysis)
-        print(f"   선택된 에이전트: {[agent.name for agent in agent_selection.agents]}")
-
-        # 3. 수동 모델 할당 생성
-        print("🧠 수동 선택 모델 할당 중...")
-        model_allocation = self._create_manual_model_allocation(selected_models, agent_selection)
-        print(f"   수동 할당 완료, 에이전트-모델 매핑: {model_allocation.agent_model_mapping}")
-
-        # 4. 스크립트 생성
-        print("⚙️  CrewAI 스크립트 생성 중...")
-        script_content = self._generate_script_content(
-            requirement, analysis, agent_selection, model_allocation, project_path, execution_id
-        )
-
-        # 5. 프로젝트 구조 생성
-        print("📁 프로젝트 구조 생성 중...")
-        project_structure = self.doc_generator.create_project_structure(project_path)
-
-        # 6. README 생성
-        print("📄 README.md 생성 중...")
-        readme_path = self.doc_generator.generate_readme(
-            project_path, requirement, agent_selection, model_allocation, analysis
-        )
-
-        # 7. 품질 평가
-        print("🔍 품질 평가 중...")
-        quality_report = self.quality_framework.evaluate_script(script_content, analysis)
-
-        # 8. 메타데이터 생성
-        generation_metadata = {
-            "generation_mode": "manual_models",
-            "selected_models": selected_models,
-            "agent_count": len(agent_selection.agents),
-            "domain": analysis.domain,
-            "complexity": analysis.complexity.value,
-            "budget": budget,
-            "strategy": strategy,
-            "quality_score": quality_report.overall_score,
-            "generation_timestamp": datetime.now().isoformat(),
-            "execution_id": execution_id
-        }
-
-        print(f"✅ 수동 모델 스크립트 생성 완료! 품질 점수: {quality_report.overall_score:.1f}/100")
-
-        return ScriptGenerationResult(
-            script_content=script_content,
-            requirements_path=project_structure['requirements'],
-            readme_path=readme_path,
-            quality_score=quality_report.overall_score,
-            generation_metadata=generation_metadata,
-            is_production_ready=quality_report.is_production_ready
-        )
-
     def _create_manual_model_allocation(self, selected_models: dict, agent_selection: AgentSelection):
         """수동 선택된 모델을 ModelAllocation 객체로 변환"""
-        from smart_model_allocator import ModelAllocation
-
         # 수동 모델을 에이전트에 매핑
         agent_model_mapping = {}
         model_role_mapping = {
@@ -766,13 +839,43 @@ crew = Crew(
 
             agent_model_mapping[agent.name] = assigned_model
 
+        # 필요한 환경변수 수집
+        env_keys_required = set()
+        for model in agent_model_mapping.values():
+            model_info = self.allocator.get_model_info(model)
+            if model_info and model_info.get('env_key'):
+                env_keys_required.add(model_info['env_key'])
+
         return ModelAllocation(
-            agent_model_mapping=agent_model_mapping,
+            agent_model_mapping={
+                agent_name: self.allocator.get_litellm_model_name(model)
+                for agent_name, model in agent_model_mapping.items()
+            },
+            simple_model_mapping=agent_model_mapping,
             total_estimated_cost=1.0,  # 수동 선택이므로 비용 계산 생략
-            strategy="manual",
-            budget_utilization=0.5
+            allocation_reasoning="수동 모델 선택",
+            confidence_score=1.0,
+            backup_allocations={},
+            env_keys_required=list(env_keys_required),
+            missing_env_keys=[key for key in env_keys_required
+                              if key not in self.allocator.env_status['available_keys']]
         )
 
+# 모델 설정 경로별 공용 생성기 (에이전트 풀/단계 캐시를 요청 간 재사용)
+_generators: Dict[str, AdaptiveScriptGenerator] = {}
+_generators_lock = threading.Lock()
+
+
+def get_adaptive_script_generator(model_config_path: str = "model_config.json") -> AdaptiveScriptGenerator:
+    """공용 생성기 인스턴스 반환"""
+    key = os.path.abspath(model_config_path)
+    with _generators_lock:
+        generator = _generators.get(key)
+        if generator is None:
+            generator = AdaptiveScriptGenerator(model_config_path)
+            _generators[key] = generator
+        return generator
+
 def main():
     """테스트 함수"""
     generator = AdaptiveScriptGenerator()
@@ -11,6 +11,7 @@ from datetime import datetime, timedelta
 import json
 
 from admin_auth import admin_auth, admin_required, get_current_admin
+from auth_cache import token_cache
 from database import db
 from security_utils import validate_request_data
 
@@ -170,7 +171,10 @@ def verify_admin():
 @admin_required()
 def admin_logout():
     """관리자 로그아웃"""
-    # JWT는 stateless이므로 클라이언트에서 토큰 삭제
+    # JWT는 stateless이므로 클라이언트에서 토큰 삭제 + 서버 캐시에서 폐기
+    auth_header = request.headers.get('Authorization', '')
+    if ' ' in auth_header:
+        admin_auth.revoke_token(auth_header.split(' ')[1])
     return jsonify({'success': True, 'message': '로그아웃되었습니다'})
 
 # ============================================================================
@@ -637,6 +641,10 @@ def update_user(user_id):
             if not result.data:
                 return jsonify({'error': '사용자 업데이트에 실패했습니다'}), 500
 
+            # 역할/활성 상태 변경 시 기존 토큰 캐시 폐기
+            if 'role' in update_data or 'is_active' in update_data:
+                token_cache.revoke_subject(user_id)
+
             # 업데이트된 사용자 정보 조회
             updated_result = db.supabase.table('users').select('user_id, email, display_name, role, is_active, updated_at').eq('user_id', user_id).execute()
 
@@ -697,6 +705,8 @@ def delete_user(user_id):
             if not result.data:
                 return jsonify({'error': '사용자 삭제에 실패했습니다'}), 500
 
+            token_cache.revoke_subject(user_id)
+
         except Exception as db_error:
             return jsonify({'error': f'데이터베이스 오류: {str(db_error)}'}), 500
 
@@ -1059,6 +1069,29 @@ def update_system_settings():
     except Exception as e:
         return jsonify({'error': f'설정 업데이트 실패: {str(e)}'}), 500
 
+@admin_bp.route('/llm-clients', methods=['GET'])
+@admin_required()
+def get_llm_clients():
+    """캐시된 LLM 클라이언트 현황 조회"""
+    from llm_registry import llm_registry
+    return jsonify({'success': True, 'stats': llm_registry.get_stats()})
+
+@admin_bp.route('/llm-clients/invalidate', methods=['POST'])
+@admin_required()
+def invalidate_llm_client_cache():
+    """LLM 클라이언트 캐시 무효화 (API 키 변경 후 호출)"""
+    try:
+        from llm_registry import invalidate_llm_clients
+        data = request.get_json(silent=True) or {}
+        removed = invalidate_llm_clients(data.get('provider'))
+        return jsonify({
+            'success': True,
+            'removed': removed,
+            'message': f'LLM 클라이언트 {removed}개가 무효화되었습니다'
+        })
+    except Exception as e:
+        return jsonify({'error': f'LLM 클라이언트 무효화 실패: {str(e)}'}), 500
+
 @admin_bp.route('/system/settings', methods=['GET'])
 @admin_required()
 def get_detailed_system_settings():
@@ -16,6 +16,8 @@ from dotenv import load_dotenv
 
 load_dotenv()
 
+from auth_cache import token_cache, memoize_per_request, hash_token, TOKEN_VERSION_CLAIM
+
 # 데이터베이스 모듈 import (메인 토큰 검증을 위해)
 try:
     from database import db
@@ -67,13 +69,27 @@ class AdminAuth:
             'role': self.admin_users[username]['role'],
             'permissions': self.admin_users[username]['permissions'],
             'exp': datetime.utcnow() + timedelta(hours=24),  # 24시간 유효
-            'iat': datetime.utcnow()
+            'iat': datetime.utcnow(),
+            TOKEN_VERSION_CLAIM: token_cache.token_version(username)
         }
 
         return jwt.encode(payload, self.secret_key, algorithm='HS256')
 
     def verify_token(self, token):
-        """JWT 토큰 검증 (관리자 토큰 또는 메인 대시보드 토큰)"""
+        """JWT 토큰 검증 (관리자 토큰 또는 메인 대시보드 토큰) - 검증 결과는 만료 시각까지 캐시"""
+        if not token:
+            return None
+        return memoize_per_request(
+            f"admin_token:{hash_token(token)}",
+            lambda: token_cache.verify('admin', token, self._verify_token_uncached)
+        )
+
+    def revoke_token(self, token):
+        """토큰 폐기 (로그아웃)"""
+        token_cache.revoke(token)
+
+    def _verify_token_uncached(self, token):
+        """JWT 토큰 실제 검증"""
         # 1. 먼저 관리자 전용 토큰으로 검증 시도
         try:
             payload = jwt.decode(token, self.secret_key, algorithms=['HS256'])
@@ -97,9 +113,12 @@ class AdminAuth:
 
                     return {
                         'username': user_data.get('user_id', 'user'),
+                        'user_id': user_data.get('user_id'),
                         'role': user_role,
                         'permissions': self._get_role_permissions(user_role),
-                        'from_main_dashboard': True
+                        'from_main_dashboard': True,
+                        'exp': user_data.get('exp'),
+                        'iat': user_data.get('iat')
                     }
             except Exception:
                 pass
@@ -0,0 +1,310 @@
+# -*- coding: utf-8 -*-
+"""
+사전 분석 응답 캐시 (Analysis Response Cache)
+정규화된 요청 해시 기반 LLM 응답 캐시 - TTL/LRU 메모리 계층 + 선택적 SQLite 계층 + 동시 요청 병합(single-flight)
+"""
+
+import os
+import time
+import sqlite3
+import hashlib
+import threading
+import unicodedata
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, Optional, Tuple
+import logging
+
+logger = logging.getLogger(__name__)
+
+# SQLite 계층 정리(만료/초과 행 삭제) 주기 - 저장 N회마다
+SQLITE_PRUNE_INTERVAL = 100
+
+
+def normalize_request_text(text: str) -> str:
+    """캐시 키용 요청 정규화 (유니코드 NFC + 공백 통합)"""
+    normalized = unicodedata.normalize('NFC', text or '')
+    return ' '.join(normalized.split())
+
+
+def make_cache_key(*parts: str) -> str:
+    """구성 요소들로부터 콘텐츠 주소 키(SHA-256) 생성"""
+    digest = hashlib.sha256()
+    for part in parts:
+        digest.update((part or '').encode('utf-8'))
+        digest.update(b'\x1f')
+    return digest.hexdigest()
+
+
+class _InFlight:
+    """진행 중인 계산 (동일 키 요청들이 결과를 공유)"""
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.value: Optional[str] = None
+        self.error: Optional[BaseException] = None
+
+
+class AnalysisResponseCache:
+    """TTL + 크기 제한 LRU 캐시 (메모리 우선, SQLite 보조 계층)"""
+
+    def __init__(self,
+                 max_entries: int = 256,
+                 ttl_seconds: int = 3600,
+                 sqlite_path: Optional[str] = None,
+                 sqlite_max_entries: int = 10000):
+        self.max_entries = max(1, max_entries)
+        self.ttl_seconds = ttl_seconds
+        self.sqlite_path = sqlite_path
+        self.sqlite_max_entries = max(1, sqlite_max_entries)
+        self._sqlite_stores = 0
+
+        self._entries: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+        self._inflight: Dict[str, _InFlight] = {}
+        self._lock = threading.Lock()
+
+        self._stats = {
+            'hits': 0,
+            'memory_hits': 0,
+            'sqlite_hits': 0,
+            'misses': 0,
+            'coalesced': 0,
+            'stores': 0,
+            'evictions': 0,
+            'expired': 0,
+            'errors': 0,
+            'sqlite_pruned': 0
+        }
+
+        if self.sqlite_path:
+            self._init_sqlite()
+
+    # ==================== 공개 API ====================
+
+    def get_or_compute(self, key: str, compute: Callable[[], str]) -> Tuple[str, bool]:
+        """
+        캐시 조회 후 없으면 계산 - 동일 키의 동시 요청은 하나의 계산을 공유
+
+        Returns:
+            Tuple[str, bool]: (값, 캐시/병합으로 제공되었는지 여부)
+        """
+        with self._lock:
+            cached = self._get_memory_locked(key)
+            if cached is not None:
+                self._stats['hits'] += 1
+                self._stats['memory_hits'] += 1
+                return cached, True
+
+            flight = self._inflight.get(key)
+            if flight is not None:
+                self._stats['coalesced'] += 1
+                leader = False
+            else:
+                flight = _InFlight()
+                self._inflight[key] = flight
+                leader = True
+
+        if not leader:
+            flight.event.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.value, True
+
+        try:
+            value = self._get_sqlite(key)
+            if value is not None:
+                with self._lock:
+                    self._stats['hits'] += 1
+                    self._stats['sqlite_hits'] += 1
+                    self._put_memory_locked(key, value)
+                flight.value = value
+                return value, True
+
+            with self._lock:
+                self._stats['misses'] += 1
+
+            value = compute()
+            self.set(key, value)
+            flight.value = value
+            return value, False
+
+        except BaseException as e:
+            flight.error = e
+            with self._lock:
+                self._stats['errors'] += 1
+            raise
+
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
+            flight.event.set()
+
+    def set(self, key: str, value: str) -> None:
+        """캐시에 값 저장 (메모리 + SQLite)"""
+        with self._lock:
+            self._put_memory_locked(key, value)
+            self._stats['stores'] += 1
+        self._put_sqlite(key, value)
+
+    def invalidate(self, key: Optional[str] = None) -> None:
+        """특정 키 또는 전체 캐시 무효화"""
+        with self._lock:
+            if key is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(key, None)
+
+        if not self.sqlite_path:
+            return
+        try:
+            with self._connect() as conn:
+                if key is None:
+                    conn.execute("DELETE FROM analysis_cache")
+                else:
+                    conn.execute("DELETE FROM analysis_cache WHERE cache_key = ?", (key,))
+        except sqlite3.Error as e:
+            logger.warning(f"SQLite 캐시 무효화 실패: {str(e)}")
+
+    def get_stats(self) -> Dict:
+        """캐시 적중/실패 지표"""
+        with self._lock:
+            stats = dict(self._stats)
+            stats['size'] = len(self._entries)
+            stats['inflight'] = len(self._inflight)
+
+        lookups = stats['hits'] + stats['misses']
+        stats['hit_rate'] = round(stats['hits'] / lookups, 4) if lookups else 0.0
+        stats['max_entries'] = self.max_entries
+        stats['ttl_seconds'] = self.ttl_seconds
+        stats['sqlite_enabled'] = bool(self.sqlite_path)
+        return stats
+
+    # ==================== 메모리 계층 ====================
+
+    def _get_memory_locked(self, key: str) -> Optional[str]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        stored_at, value = entry
+        if self._is_expired(stored_at):
+            del self._entries[key]
+            self._stats['expired'] += 1
+            return None
+
+        self._entries.move_to_end(key)
+        return value
+
+    def _put_memory_locked(self, key: str, value: str) -> None:
+        self._entries[key] = (time.time(), value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self._stats['evictions'] += 1
+
+    def _is_expired(self, stored_at: float) -> bool:
+        return self.ttl_seconds > 0 and (time.time() - stored_at) > self.ttl_seconds
+
+    # ==================== SQLite 계층 ====================
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """트랜잭션 커밋 후 연결까지 닫는 SQLite 연결"""
+        conn = sqlite3.connect(self.sqlite_path, timeout=5)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def _init_sqlite(self) -> None:
+        try:
+            with self._connect() as conn:
+                conn.execute("""
+                    CREATE TABLE IF NOT EXISTS analysis_cache (
+                        cache_key TEXT PRIMARY KEY,
+                        value TEXT NOT NULL,
+                        stored_at REAL NOT NULL
+                    )
+                """)
+                conn.execute("CREATE INDEX IF NOT EXISTS idx_analysis_cache_stored_at ON analysis_cache(stored_at)")
+            self._prune_sqlite()
+            logger.info(f"사전 분석 SQLite 캐시 활성화: {self.sqlite_path}")
+        except sqlite3.Error as e:
+            logger.warning(f"SQLite 캐시 초기화 실패, 메모리 캐시만 사용: {str(e)}")
+            self.sqlite_path = None
+
+    def _get_sqlite(self, key: str) -> Optional[str]:
+        if not self.sqlite_path:
+            return None
+        try:
+            with self._connect() as conn:
+                row = conn.execute(
+                    "SELECT value, stored_at FROM analysis_cache WHERE cache_key = ?", (key,)
+                ).fetchone()
+                if row is None:
+                    return None
+                if self._is_expired(row[1]):
+                    conn.execute("DELETE FROM analysis_cache WHERE cache_key = ?", (key,))
+                    return None
+                return row[0]
+        except sqlite3.Error as e:
+            logger.warning(f"SQLite 캐시 조회 실패: {str(e)}")
+            return None
+
+    def _put_sqlite(self, key: str, value: str) -> None:
+        if not self.sqlite_path:
+            return
+        try:
+            with self._connect() as conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO analysis_cache (cache_key, value, stored_at) VALUES (?, ?, ?)",
+                    (key, value, time.time())
+                )
+        except sqlite3.Error as e:
+            logger.warning(f"SQLite 캐시 저장 실패: {str(e)}")
+            return
+
+        with self._lock:
+            self._sqlite_stores += 1
+            should_prune = self._sqlite_stores % SQLITE_PRUNE_INTERVAL == 0
+        if should_prune:
+            self._prune_sqlite()
+
+    def _prune_sqlite(self) -> None:
+        """만료된 행과 최대 행 수를 넘는 오래된 행 삭제"""
+        if not self.sqlite_path:
+            return
+        try:
+            with self._connect() as conn:
+                removed = 0
+                if self.ttl_seconds > 0:
+                    removed += conn.execute(
+                        "DELETE FROM analysis_cache WHERE stored_at < ?", (time.time() - self.ttl_seconds,)
+                    ).rowcount
+                removed += conn.execute(
+                    "DELETE FROM analysis_cache WHERE cache_key IN ("
+                    "SELECT cache_key FROM analysis_cache ORDER BY stored_at DESC LIMIT -1 OFFSET ?)",
+                    (self.sqlite_max_entries,)
+                ).rowcount
+            if removed:
+                with self._lock:
+                    self._stats['sqlite_pruned'] += removed
+        except sqlite3.Error as e:
+            logger.warning(f"SQLite 캐시 정리 실패: {str(e)}")
+
+
+def create_analysis_cache_from_env() -> AnalysisResponseCache:
+    """환경변수 기반 캐시 생성
+
+    PRE_ANALYSIS_CACHE_SIZE: 메모리 최대 항목 수 (기본 256)
+    PRE_ANALYSIS_CACHE_TTL: 유효 시간(초), 0이면 만료 없음 (기본 3600)
+    PRE_ANALYSIS_CACHE_DB: SQLite 캐시 파일 경로 (미설정 시 메모리만 사용)
+    PRE_ANALYSIS_CACHE_DB_MAX_ENTRIES: SQLite 최대 행 수 (기본 10000, 초과 시 오래된 행부터 삭제)
+    """
+    return AnalysisResponseCache(
+        max_entries=int(os.getenv('PRE_ANALYSIS_CACHE_SIZE', '256')),
+        ttl_seconds=int(os.getenv('PRE_ANALYSIS_CACHE_TTL', '3600')),
+        sqlite_path=os.getenv('PRE_ANALYSIS_CACHE_DB') or None,
+        sqlite_max_entries=int(os.getenv('PRE_ANALYSIS_CACHE_DB_MAX_ENTRIES', '10000'))
+    )
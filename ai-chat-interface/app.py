@@ -4,7 +4,7 @@ AI Chat Interface - Flask Integration Server
 Single Python server integrating CrewAI and MetaGPT
 """
 
-from flask import Flask, render_template, request, jsonify, send_from_directory
+from flask import Flask, render_template, request, jsonify, send_from_directory, Response, stream_with_context
 from flask_cors import CORS
 from flask_socketio import SocketIO
 import os
@@ -20,7 +20,6 @@ from functools import wraps
 from dotenv import load_dotenv
 import uuid
 import gevent
-from supabase import create_client, Client
 
 # Load environment variables
 load_dotenv()
@@ -96,19 +95,32 @@ setup_global_utf8_environment()
 # Import database module
 from database import db
 from security_utils import validate_request_data, check_request_security
+from rate_limiter import rate_limit
 from template_api import template_bp
 from ollama_client import ollama_client
+from llm_http import llm_transport
 # WebSocket manager removed
 # Progress tracking simplified
-from admin_auth import admin_auth
-from crewai_logger import crewai_logger, ExecutionPhase
-from generate_crewai_script_new import generate_crewai_execution_script_with_approval
-
-# 새로운 모듈 import
-from pre_analysis_service import pre_analysis_service
-from approval_workflow import approval_workflow_manager
-from execution_service import handle_crewai_request as handle_crewai_request_service, resume_crewai_execution, resume_metagpt_execution
-from smart_model_allocator import SmartModelAllocator
+from admin_auth import admin_auth, admin_required
+from lazy_loader import LazyObject, lazy_import, get_lazy_status, preload_async_from_env
+from model_catalog import create_model_catalog_from_env
+from metagpt_worker_pool import (
+    create_metagpt_worker_pool_from_env, run_step_subprocess, new_session_id,
+    MetaGPTSessionLostError, MetaGPTWorkerBusyError
+)
+from metagpt_jobs import create_metagpt_job_runner_from_env, METAGPT_WORKFLOW_STAGES, FINISHED_STATUSES
+from workspace_index import WorkspaceProjectIndex
+
+# 무거운 서브시스템은 첫 사용 시 import/생성 (서버 시작 시간 단축)
+crewai_logger = lazy_import('crewai_logger', 'crewai_logger')
+ExecutionPhase = lazy_import('crewai_logger', 'ExecutionPhase')
+generate_crewai_execution_script_with_approval = lazy_import('generate_crewai_script_new', 'generate_crewai_execution_script_with_approval')
+pre_analysis_service = lazy_import('pre_analysis_service', 'pre_analysis_service')
+approval_workflow_manager = lazy_import('approval_workflow', 'approval_workflow_manager')
+handle_crewai_request_service = lazy_import('execution_service', 'handle_crewai_request')
+resume_crewai_execution = lazy_import('execution_service', 'resume_crewai_execution')
+resume_metagpt_execution = lazy_import('execution_service', 'resume_metagpt_execution')
+get_model_allocator = lazy_import('smart_model_allocator', 'get_model_allocator')
 
 # Add current directory to Python path
 project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
@@ -221,8 +233,17 @@ except ImportError as e:
 supabase_url = os.getenv("SUPABASE_URL")
 supabase_key = os.getenv("SUPABASE_ANON_KEY")
 
+
+def _create_supabase_client():
+    """첫 사용 시 Supabase 클라이언트 생성 (설정이 없으면 None)"""
+    if not (supabase_url and supabase_key):
+        return None
+    from supabase import create_client
+    return create_client(supabase_url, supabase_key)
+
+
 if supabase_url and supabase_key:
-    supabase: Client = create_client(supabase_url, supabase_key)
+    supabase = LazyObject(_create_supabase_client, 'app.supabase')
 else:
     supabase = None
     print("⚠️ Supabase 설정이 필요합니다. .env 파일에 SUPABASE_URL과 SUPABASE_ANON_KEY를 추가하세요.")
@@ -231,8 +252,21 @@ else:
 CREWAI_BASE_DIR = os.path.join(os.path.dirname(current_dir), 'CrewAi')  # CrewAI 소스 코드 경로
 PROJECTS_BASE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'Projects')) # 생성된 프로젝트 저장 경로
 execution_status = {}  # 전역 변수로 실행 상태 관리
+metagpt_path = os.path.join(project_root, 'MetaGPT')  # MetaGPT 소스 코드 경로
+
+# MetaGPT 단계 실행 워커 풀 (상주 프로세스, 첫 요청 시 시작)
+metagpt_worker_pool = create_metagpt_worker_pool_from_env(os.path.join(metagpt_path, 'run_step_by_step.py'))
+
+# MetaGPT 전체 실행 작업 (작업 스레드에서 실행, 완료 시 DB 저장)
+metagpt_job_runner = create_metagpt_job_runner_from_env(on_complete=lambda job: save_metagpt_execution(job))
+
+# MetaGPT workspace 프로젝트 색인 (Legacy 프로젝트 목록/상세 조회)
+workspace_index = WorkspaceProjectIndex(os.path.join(metagpt_path, 'workspace'))
 # Client management simplified
 
+# LLM 모델 목록 카탈로그 (Ollama/클라우드 가용성 백그라운드 갱신)
+model_catalog = create_model_catalog_from_env(get_model_allocator, ollama_client)
+
 # 보안 헤더 설정
 @app.after_request
 def set_security_headers(response):
@@ -259,45 +293,9 @@ METAGPT_URL = "http://localhost:3002"  # 내부 MetaGPT 서버
 
 # Global variables
 execution_status = {}
-request_counts = {}  # IP별 요청 카운트
-request_timestamps = {}  # IP별 요청 시간
 
 # ==================== SECURITY DECORATORS ====================
 
-def rate_limit(max_requests=60, window_seconds=60):
-    """Rate limiting decorator"""
-    def decorator(f):
-        @wraps(f)
-        def decorated(*args, **kwargs):
-            client_ip = request.environ.get('HTTP_X_FORWARDED_FOR', request.environ.get('REMOTE_ADDR', 'unknown'))
-            current_time = time.time()
-
-            # IP별 요청 기록 초기화
-            if client_ip not in request_counts:
-                request_counts[client_ip] = []
-
-            # 윈도우 시간 밖의 요청 제거
-            request_counts[client_ip] = [
-                timestamp for timestamp in request_counts[client_ip]
-                if current_time - timestamp < window_seconds
-            ]
-
-            # 요청 제한 확인
-            if len(request_counts[client_ip]) >= max_requests:
-                return jsonify({
-                    'error': 'Rate limit exceeded',
-                    'message': f'최대 {max_requests}개의 요청이 {window_seconds}초 내에 허용됩니다',
-                    'retry_after': window_seconds
-                }), 429
-
-            # 현재 요청 기록
-            request_counts[client_ip].append(current_time)
-
-            return f(*args, **kwargs)
-
-        return decorated
-    return decorator
-
 def validate_json_input(required_fields=None):
     """JSON 입력 검증 데코레이터"""
     def decorator(f):
@@ -420,11 +418,13 @@ def generate_dynamic_script():
 
         data = request.get_json()
         project_id = data.get('projectId')
+        schedule_mode = data.get('scheduleMode')  # 'sequential' | 'dag' (미지정 시 환경변수 기본값)
+        force = bool(data.get('force', False))  # 입력 변경이 없어도 다시 생성
 
         if not project_id:
             return jsonify({'error': 'Project ID is required'}), 400
 
-        result = generate_script(project_id)
+        result = generate_script(project_id, schedule_mode, force)
 
         return jsonify(result), 200
 
@@ -801,6 +801,19 @@ def handle_metagpt_request():
         }), 500
 
 
+def run_metagpt_step(script_path, requirement, step_number, user_input=None, session_id=None, timeout=60,
+                     require_session=False):
+    """run_step_by_step.py 한 단계 실행 - 워커 풀 사용 (비활성화 시 단계마다 새 프로세스)
+
+    session_id는 클라이언트별로 발급한 값 (new_session_id) - 워커 풀에서 단계 간 상태를 이어받는 키
+    require_session이면 워커 풀이 모르는 세션에 새 상태로 실행하지 않고 MetaGPTSessionLostError
+    """
+    if metagpt_worker_pool is not None and os.path.abspath(script_path) == os.path.abspath(metagpt_worker_pool.script_path):
+        return metagpt_worker_pool.run_step(session_id, requirement, step_number, user_input, timeout=timeout,
+                                            require_session=require_session)
+    return run_step_subprocess(script_path, requirement, step_number, user_input, timeout=timeout)
+
+
 def call_metagpt_module(requirement, selected_models):
     """실제 MetaGPT 모듈 호출"""
     try:
@@ -815,31 +828,26 @@ def call_metagpt_module(requirement, selected_models):
                 'path_checked': metagpt_path_full
             }), 404
 
-        # MetaGPT 모듈에서 실제 처리
-        # 여기서는 subprocess로 MetaGPT 스크립트 실행
-        import subprocess
-        import json
-
         # MetaGPT 실행 스크립트 경로
         script_path = os.path.join(metagpt_path_full, 'run_step_by_step.py')
 
         if os.path.exists(script_path):
-            # 실제 MetaGPT 스크립트 실행 (1단계부터 시작)
-            result = subprocess.run([
-                sys.executable, script_path,
-                requirement,  # 첫 번째 인자: 요구사항
-                '1'          # 두 번째 인자: 시작 단계
-            ], capture_output=True, text=True, timeout=30)
+            # 실제 MetaGPT 스크립트 실행 (1단계부터 시작, 새 세션 발급)
+            session_id = new_session_id()
+            result = run_metagpt_step(script_path, requirement, 1, session_id=session_id, timeout=30)
 
             if result.returncode == 0:
                 try:
                     response_data = json.loads(result.stdout)
+                    if isinstance(response_data, dict):
+                        response_data['sessionId'] = session_id
                     return jsonify(response_data)
                 except json.JSONDecodeError:
                     return jsonify({
                         'success': True,
                         'message': result.stdout,
-                        'type': 'text_response'
+                        'type': 'text_response',
+                        'sessionId': session_id
                     })
             else:
                 return jsonify({
@@ -851,6 +859,14 @@ def call_metagpt_module(requirement, selected_models):
             # 스크립트가 없으면 기본 MetaGPT 호출
             return call_basic_metagpt(requirement, metagpt_path_full)
 
+    except MetaGPTWorkerBusyError as e:
+        return jsonify({
+            'success': False,
+            'error': 'worker_busy',
+            'message': 'MetaGPT 워커가 모두 다른 요청을 처리 중입니다. 잠시 후 다시 시도해주세요.',
+            'details': str(e)
+        }), 503
+
     except Exception as e:
         return jsonify({
             'success': False,
@@ -1617,60 +1633,31 @@ def verify_auth_token():
 
 @app.route('/api/projects-legacy', methods=['GET'])
 def get_projects_list():
-    """프로젝트 목록 조회 (Legacy)"""
-    try:
-        # MetaGPT workspace에서 프로젝트 목록 조회
-        projects_path = os.path.join(metagpt_path, 'workspace')
+    """
+    프로젝트 목록 조회 (Legacy)
 
-        if not os.path.exists(projects_path):
+    Query: offset (기본 0), limit (미지정 시 전체) - 생성일 최신순
+    """
+    try:
+        # MetaGPT workspace에서 프로젝트 목록 조회 (변경된 프로젝트만 다시 읽는 색인)
+        if not workspace_index.exists():
             return jsonify({
                 'success': True,
                 'projects': [],
                 'message': 'MetaGPT workspace 디렉토리가 없습니다.'
             })
 
-        projects = []
-        for project_dir in os.listdir(projects_path):
-            project_path = os.path.join(projects_path, project_dir)
-            if os.path.isdir(project_path):
-                metadata_file = os.path.join(project_path, 'project_metadata.json')
-                if os.path.exists(metadata_file):
-                    try:
-                        with open(metadata_file, 'r', encoding='utf-8') as f:
-                            metadata = json.load(f)
-
-                        # 진행 상황 파악
-                        step_files = []
-                        for i in range(1, 6):
-                            step_file_pattern = f"step_{i}_*.json"
-                            step_files_found = [f for f in os.listdir(project_path) if f.startswith(f"step_{i}_")]
-                            if step_files_found:
-                                step_files.append(i)
-
-                        completed_steps = len(step_files)
-                        progress_percentage = (completed_steps / 5) * 100
-
-                        projects.append({
-                            'project_name': metadata.get('project_name', project_dir),
-                            'project_id': metadata.get('project_id', project_dir),
-                            'requirement': metadata.get('requirement', ''),
-                            'created_at': metadata.get('created_at', ''),
-                            'current_step': metadata.get('current_step', 1),
-                            'completed_steps': completed_steps,
-                            'total_steps': 5,
-                            'progress_percentage': progress_percentage,
-                            'workspace_path': project_path,
-                            'status': '완료' if completed_steps >= 5 else f'{completed_steps}/5 단계 진행 중'
-                        })
-                    except Exception as e:
-                        print(f"프로젝트 메타데이터 읽기 실패: {project_dir} - {e}")
-
-        # 최신 순으로 정렬
-        projects.sort(key=lambda x: x['created_at'], reverse=True)
+        offset = request.args.get('offset', 0, type=int)
+        limit = request.args.get('limit', None, type=int)
+        projects, total = workspace_index.list_projects(offset=offset, limit=limit)
 
         return jsonify({
             'success': True,
-            'projects': projects
+            'projects': projects,
+            'total': total,
+            'offset': offset,
+            'limit': limit,
+            'has_more': offset + len(projects) < total
         })
 
     except Exception as e:
@@ -1685,8 +1672,7 @@ def get_project_details(project_name):
     """특정 프로젝트 상세 정보 조회"""
     try:
         # MetaGPT workspace에서 특정 프로젝트 조회
-        projects_path = os.path.join(metagpt_path, 'workspace')
-        project_path = os.path.join(projects_path, project_name)
+        project_path = os.path.join(workspace_index.workspace_dir, project_name)
 
         if not os.path.exists(project_path):
             return jsonify({
@@ -1694,33 +1680,28 @@ def get_project_details(project_name):
                 'error': '프로젝트를 찾을 수 없습니다.'
             }), 404
 
-        metadata_file = os.path.join(project_path, 'project_metadata.json')
-        if not os.path.exists(metadata_file):
+        project = workspace_index.get_project(project_name)
+        if project is None:
             return jsonify({
                 'success': False,
                 'error': '프로젝트 메타데이터를 찾을 수 없습니다.'
             }), 404
 
-        with open(metadata_file, 'r', encoding='utf-8') as f:
-            metadata = json.load(f)
-
-        # 각 단계별 결과 읽기
+        # 각 단계별 결과 읽기 (색인에 기록된 단계 파일만)
         step_results = {}
-        for i in range(1, 6):
-            step_files = [f for f in os.listdir(project_path) if f.startswith(f"step_{i}_")]
-            if step_files:
-                step_file = os.path.join(project_path, step_files[0])
-                try:
-                    with open(step_file, 'r', encoding='utf-8') as f:
-                        step_data = json.load(f)
-                    step_results[i] = step_data
-                except Exception as e:
-                    print(f"단계 {i} 파일 읽기 실패: {e}")
+        for i, step_filename in sorted(project['step_files'].items()):
+            step_file = os.path.join(project_path, step_filename)
+            try:
+                with open(step_file, 'r', encoding='utf-8') as f:
+                    step_data = json.load(f)
+                step_results[i] = step_data
+            except Exception as e:
+                print(f"단계 {i} 파일 읽기 실패: {e}")
 
         return jsonify({
             'success': True,
             'project': {
-                'metadata': metadata,
+                'metadata': project['metadata'],
                 'step_results': step_results,
                 'next_step': len(step_results) + 1 if len(step_results) < 5 else None
             }
@@ -1742,6 +1723,14 @@ def handle_metagpt_step():
     step_number = data.get('step', 1)
     user_response = data.get('user_response')  # 'approve', 'reject', 'modify'
     modifications = data.get('modifications', '')
+    # 클라이언트별 세션 - 없으면 새로 발급하고 응답의 sessionId로 돌려줌 (다음 단계 요청에 포함)
+    # 받은 sessionId로 2단계 이후를 요청했는데 서버에 세션이 없으면 빈 상태로 이어가지 않음 (409)
+    session_id = data.get('sessionId')
+    try:
+        require_session = bool(session_id) and int(step_number) > 1
+    except (TypeError, ValueError):
+        require_session = bool(session_id)
+    session_id = session_id or new_session_id()
 
     if not requirement:
         return jsonify({'error': 'Requirement is required'}), 400
@@ -1764,30 +1753,51 @@ def handle_metagpt_step():
                 'modifications': modifications
             }
 
-        # MetaGPT 스크립트 실행
-        args = [sys.executable, script_path, requirement, str(step_number)]
-        if user_input:
-            args.append(json.dumps(user_input))
-
-        result = subprocess.run(args, capture_output=True, text=True, timeout=60)
+        # MetaGPT 스크립트 실행 (상주 워커, 같은 세션은 같은 워커)
+        result = run_metagpt_step(script_path, requirement, step_number, user_input,
+                                  session_id=session_id, timeout=60, require_session=require_session)
 
         if result.returncode == 0:
             try:
                 response_data = json.loads(result.stdout)
+                if isinstance(response_data, dict):
+                    response_data['sessionId'] = session_id
                 return jsonify(response_data)
             except json.JSONDecodeError:
                 return jsonify({
                     'success': True,
                     'message': result.stdout,
-                    'type': 'text_response'
+                    'type': 'text_response',
+                    'sessionId': session_id
                 })
         else:
             return jsonify({
                 'success': False,
                 'error': 'MetaGPT step execution failed',
-                'details': result.stderr
+                'details': result.stderr,
+                'sessionId': session_id
             }), 500
 
+    except MetaGPTSessionLostError as e:
+        # 워커 재시작으로 이전 단계 상태가 사라짐 - 빈 상태로 이어가지 않고 새 세션으로 다시 시작하도록 안내
+        return jsonify({
+            'success': False,
+            'error': 'session_lost',
+            'message': 'MetaGPT 세션 상태가 사라졌습니다. 1단계부터 다시 시작해주세요.',
+            'details': str(e),
+            'sessionId': session_id
+        }), 409
+
+    except MetaGPTWorkerBusyError as e:
+        # 세션의 워커가 다른 단계를 실행 중 - 세션 상태는 유지되므로 같은 sessionId로 다시 시도
+        return jsonify({
+            'success': False,
+            'error': 'worker_busy',
+            'message': 'MetaGPT 워커가 다른 요청을 처리 중입니다. 잠시 후 다시 시도해주세요.',
+            'details': str(e),
+            'sessionId': session_id
+        }), 503
+
     except Exception as e:
         return jsonify({
             'success': False,
@@ -2539,171 +2549,212 @@ def crewai_execution_status(execution_id):
 @rate_limit(3, 600)  # 10분간 3회로 제한 (MetaGPT는 매우 자원 집약적)
 @validate_json_input(['requirement'])
 def metagpt_execute():
-    """MetaGPT 실행 - 5단계 소프트웨어 개발 프로세스"""
+    """
+    MetaGPT 실행 - 5단계 소프트웨어 개발 프로세스
+
+    기본은 실행 ID를 즉시 반환(202)하고, /api/services/metagpt/jobs/<execution_id> 롱폴링
+    또는 /events SSE로 진행 상황/완료를 확인.
+    async=false (본문 또는 쿼리)이면 완료까지 기다려 기존 응답 형식으로 반환하되,
+    대기 시간(최대 SYNC_WAIT_MAX_SECONDS)을 넘기면 같은 202 응답으로 작업 URL을 안내
+    """
     try:
         data = request.get_json()
         requirement = data['requirement']
         selected_models = data.get('role_llm_mapping', {})
+        async_mode = str(data.get('async', request.args.get('async', 'true'))).lower() not in ('0', 'false', 'no')
 
         # 실행 ID 생성
         execution_id = str(uuid.uuid4())
 
-        # 실행 정보를 데이터베이스에 기록 시작
-        execution_start_time = datetime.utcnow()
-
-        try:
-            # MetaGPT 브릿지 스크립트 실행
-            import subprocess
-            import json as json_module
-
-            # 현재 디렉터리에서 MetaGPT 브릿지 실행
-            bridge_path = os.path.join(os.path.dirname(__file__), 'metagpt_bridge.py')
-
-            # 명령어 구성
-            cmd = [
-                sys.executable,  # python.exe
-                bridge_path,
-                requirement,
-                json_module.dumps(selected_models) if selected_models else '{}'
-            ]
-
-            # 백그라운드에서 실행 (타임아웃: 20분)
-            process = subprocess.Popen(
-                cmd,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True,
-                cwd=os.path.dirname(__file__)
-            )
-
-            # 결과 대기 (최대 20분)
-            try:
-                stdout, stderr = process.communicate(timeout=1200)  # 20분
+        # 현재 디렉터리에서 MetaGPT 브릿지 실행 (작업 스레드에서)
+        bridge_path = os.path.join(os.path.dirname(__file__), 'metagpt_bridge.py')
+        cmd = [
+            sys.executable,  # python.exe
+            bridge_path,
+            requirement,
+            json.dumps(selected_models) if selected_models else '{}'
+        ]
+        job = metagpt_job_runner.submit(requirement, selected_models, cmd,
+                                        os.path.dirname(__file__), execution_id)
+
+        if async_mode:
+            return metagpt_job_accepted(job)
+
+        # 동기 모드 (기존 응답 형식) - 완료까지 대기 (대기 시간을 넘기면 작업은 계속 실행되고 작업 URL 안내)
+        deadline = time.monotonic() + metagpt_job_runner.sync_wait_seconds()
+        since = 0
+        while job['status'] not in FINISHED_STATUSES:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return metagpt_job_accepted(job)
+            job = metagpt_job_runner.store.wait(execution_id, since=since, timeout=remaining)
+            if job is None:
+                return jsonify({'success': False, 'execution_id': execution_id,
+                                'error': '실행 정보를 찾을 수 없습니다.'}), 500
+            since = job['last_seq']
+        return metagpt_job_response(job)
 
-                if process.returncode == 0:
-                    # 성공적으로 완료
-                    try:
-                        metagpt_result = json_module.loads(stdout)
-
-                        # 데이터베이스에 결과 저장
-                        execution_record = {
-                            'project_type': 'metagpt',
-                            'execution_id': execution_id,
-                            'requirement': requirement,
-                            'role_llm_mapping': selected_models,
-                            'status': 'completed',
-                            'started_at': execution_start_time.isoformat(),
-                            'completed_at': datetime.utcnow().isoformat(),
-                            'duration_seconds': (datetime.utcnow() - execution_start_time).total_seconds(),
-                            'result_data': metagpt_result,
-                            'agents_involved': metagpt_result.get('agents_involved', []),
-                            'success': True
-                        }
-
-                        # 실제 데이터베이스 저장 로직
-                        try:
-                            # MetaGPT 워크플로우 단계 생성
-                            workflow_stages = [
-                                {'stage_number': 1, 'stage_name': '요구사항 분석', 'responsible_role': 'Product Manager', 'role_icon': '📋'},
-                                {'stage_number': 2, 'stage_name': '시스템 설계', 'responsible_role': 'Architect', 'role_icon': '🏗️'},
-                                {'stage_number': 3, 'stage_name': '프로젝트 계획', 'responsible_role': 'Project Manager', 'role_icon': '📊'},
-                                {'stage_number': 4, 'stage_name': '코드 개발', 'responsible_role': 'Engineer', 'role_icon': '💻'},
-                                {'stage_number': 5, 'stage_name': '품질 보증', 'responsible_role': 'QA Engineer', 'role_icon': '🧪'}
-                            ]
-
-                            # 프로젝트 데이터 생성
-                            project_data = {
-                                'name': f"MetaGPT-{execution_id[:8]}",
-                                'description': requirement[:200],
-                                'selected_ai': 'meta-gpt',
-                                'status': 'completed',
-                                'progress_percentage': 100,
-                                'execution_metadata': execution_record,
-                                'created_at': execution_start_time.isoformat(),
-                                'updated_at': datetime.utcnow().isoformat()
-                            }
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': f'MetaGPT API 오류: {str(e)}'
+        }), 500
 
-                            # 데이터베이스에 저장
-                            if database.supabase:
-                                # 프로젝트 저장
-                                project_result = database.supabase.table('projects').insert(project_data).execute()
-                                project_id = project_result.data[0]['id'] if project_result.data else None
-
-                                if project_id:
-                                    # MetaGPT 워크플로우 단계 저장
-                                    for stage in workflow_stages:
-                                        stage_data = {
-                                            'project_id': project_id,
-                                            'stage_number': stage['stage_number'],
-                                            'stage_name': stage['stage_name'],
-                                            'responsible_role': stage['responsible_role'],
-                                            'role_icon': stage['role_icon'],
-                                            'status': 'completed',
-                                            'progress_percentage': 100
-                                        }
-                                        database.supabase.table('metagpt_workflow_stages').insert(stage_data).execute()
-
-                                execution_record['database_id'] = project_id
-                                print(f"MetaGPT 실행 결과 데이터베이스 저장 완료: {project_id}")
-                            else:
-                                print("Supabase 연결 없음 - 로컬 로그만 기록")
-                        except Exception as db_save_error:
-                            print(f"데이터베이스 저장 실패: {db_save_error}")
-
-                        print(f"MetaGPT 실행 완료 기록: {execution_record}")
-
-                        return jsonify({
-                            'success': True,
-                            'execution_id': execution_id,
-                            'status': 'completed',
-                            'requirement': requirement,
-                            'result': metagpt_result,
-                            'duration_seconds': execution_record['duration_seconds'],
-                            'agents_involved': metagpt_result.get('agents_involved', [])
-                        })
-
-                    except json_module.JSONDecodeError:
-                        # JSON 파싱 실패
-                        return jsonify({
-                            'success': False,
-                            'execution_id': execution_id,
-                            'error': 'MetaGPT 결과 파싱 오류',
-                            'raw_output': stdout,
-                            'stderr': stderr
-                        }), 500
 
-                else:
-                    # 프로세스 실행 실패
-                    return jsonify({
-                        'success': False,
-                        'execution_id': execution_id,
-                        'error': f'MetaGPT 실행 실패 (exit code: {process.returncode})',
-                        'stderr': stderr,
-                        'stdout': stdout
-                    }), 500
-
-            except subprocess.TimeoutExpired:
-                # 타임아웃 발생
-                process.kill()
-                return jsonify({
-                    'success': False,
-                    'execution_id': execution_id,
-                    'error': 'MetaGPT 실행 시간 초과 (20분)',
-                    'status': 'timeout'
-                }), 408
+def metagpt_job_accepted(job):
+    """실행 중인 MetaGPT 작업의 202 응답 (상태 롱폴링/SSE URL 안내)"""
+    execution_id = job['execution_id']
+    return jsonify({
+        'success': True,
+        'execution_id': execution_id,
+        'status': job['status'],
+        'status_url': f'/api/services/metagpt/jobs/{execution_id}',
+        'events_url': f'/api/services/metagpt/jobs/{execution_id}/events'
+    }), 202
 
-        except Exception as execution_error:
-            return jsonify({
-                'success': False,
-                'execution_id': execution_id,
-                'error': f'MetaGPT 실행 중 오류: {str(execution_error)}'
-            }), 500
 
-    except Exception as e:
+def metagpt_job_response(job):
+    """완료된 MetaGPT 작업을 기존 동기 실행 응답 형식으로 변환"""
+    if job['status'] == 'completed':
+        return jsonify({
+            'success': True,
+            'execution_id': job['execution_id'],
+            'status': 'completed',
+            'requirement': job['requirement'],
+            'result': job['result'],
+            'duration_seconds': job['duration_seconds'],
+            'agents_involved': (job['result'] or {}).get('agents_involved', []),
+            'database_id': job['database_id']
+        })
+    if job['status'] == 'timeout':
         return jsonify({
             'success': False,
-            'error': f'MetaGPT API 오류: {str(e)}'
-        }), 500
+            'execution_id': job['execution_id'],
+            'error': job['error'],
+            'status': 'timeout'
+        }), 408
+
+    response = {
+        'success': False,
+        'execution_id': job['execution_id'],
+        'error': job['error'],
+        'stderr': job.get('stderr', ''),
+        'stdout': job.get('stdout', '')
+    }
+    if 'raw_output' in job:
+        response['raw_output'] = job['raw_output']
+    return jsonify(response), 500
+
+
+def save_metagpt_execution(job):
+    """완료된 MetaGPT 실행을 프로젝트 + 워크플로우 단계로 저장 (단계 행은 한 번에 일괄 insert)"""
+    result = job['result'] or {}
+    execution_record = {
+        'project_type': 'metagpt',
+        'execution_id': job['execution_id'],
+        'requirement': job['requirement'],
+        'role_llm_mapping': job['role_llm_mapping'],
+        'status': 'completed',
+        'started_at': job['started_at'],
+        'completed_at': datetime.utcnow().isoformat(),
+        'duration_seconds': job['duration_seconds'],
+        'result_data': result,
+        'agents_involved': result.get('agents_involved', []),
+        'success': True
+    }
+
+    if not supabase:
+        print("Supabase 연결 없음 - 로컬 로그만 기록")
+        return None
+
+    project_data = {
+        'name': f"MetaGPT-{job['execution_id'][:8]}",
+        'description': job['requirement'][:200],
+        'selected_ai': 'meta-gpt',
+        'status': 'completed',
+        'progress_percentage': 100,
+        'execution_metadata': execution_record,
+        'created_at': job['created_at'],
+        'updated_at': datetime.utcnow().isoformat()
+    }
+    project_result = supabase.table('projects').insert(project_data).execute()
+    project_id = project_result.data[0]['id'] if project_result.data else None
+
+    if project_id:
+        stage_rows = [{
+            'project_id': project_id,
+            'stage_number': stage['stage_number'],
+            'stage_name': stage['stage_name'],
+            'responsible_role': stage['responsible_role'],
+            'role_icon': stage['role_icon'],
+            'status': 'completed',
+            'progress_percentage': 100
+        } for stage in METAGPT_WORKFLOW_STAGES]
+        supabase.table('metagpt_workflow_stages').insert(stage_rows).execute()
+        print(f"MetaGPT 실행 결과 데이터베이스 저장 완료: {project_id}")
+    return project_id
+
+
+@app.route('/api/services/metagpt/jobs/<execution_id>', methods=['GET'])
+@rate_limit(60, 60)
+def metagpt_job_status(execution_id):
+    """
+    MetaGPT 작업 상태 조회 (롱폴링)
+
+    Query: since=<마지막으로 받은 이벤트 seq>, wait=<새 이벤트/완료까지 대기할 초, 최대 30>
+    """
+    since = request.args.get('since', 0, type=int)
+    wait = request.args.get('wait', 0, type=float)
+
+    if wait > 0:
+        job = metagpt_job_runner.store.wait(execution_id, since=since, timeout=wait)
+    else:
+        job = metagpt_job_runner.store.get(execution_id, since=since)
+
+    if job is None:
+        return jsonify({'success': False, 'error': '실행 정보를 찾을 수 없습니다.'}), 404
+    return jsonify({'success': True, 'data': job})
+
+
+@app.route('/api/services/metagpt/jobs/<execution_id>/events', methods=['GET'])
+def metagpt_job_events(execution_id):
+    """
+    MetaGPT 작업 이벤트 구독 (Server-Sent Events)
+
+    Response (text/event-stream):
+        event: queued/started/progress   data: {...}
+        event: completed/failed/timeout  data: 작업 최종 상태 (마지막 이벤트)
+    """
+    since = request.args.get('since', 0, type=int)
+    if metagpt_job_runner.store.get(execution_id) is None:
+        return jsonify({'success': False, 'error': '실행 정보를 찾을 수 없습니다.'}), 404
+
+    def generate():
+        last_seq = since
+        while True:
+            job = metagpt_job_runner.store.wait(execution_id, since=last_seq)
+            if job is None:
+                return
+            for event in job['events']:
+                if event['type'] in FINISHED_STATUSES:
+                    continue
+                yield f"event: {event['type']}\ndata: {json.dumps(event, ensure_ascii=False)}\n\n"
+            last_seq = job['last_seq']
+            if job['status'] in FINISHED_STATUSES:
+                job.pop('events')
+                yield f"event: {job['status']}\ndata: {json.dumps(job, ensure_ascii=False, default=str)}\n\n"
+                return
+            if not job['events']:
+                yield ": keep-alive\n\n"
+
+    return Response(
+        stream_with_context(generate()),
+        mimetype='text/event-stream',
+        headers={
+            'Cache-Control': 'no-cache',
+            'X-Accel-Buffering': 'no'  # 리버스 프록시 버퍼링 비활성화
+        }
+    )
 
 @app.route('/api/services/metagpt/status')
 @rate_limit(10, 60)
@@ -2725,8 +2776,9 @@ def metagpt_status():
             'metagpt_directory_exists': metagpt_exists,
             'bridge_path': bridge_path,
             'metagpt_path': metagpt_dir,
-            'execution_timeout': '20 minutes',
-            'rate_limit': '3 requests per 10 minutes'
+            'execution_timeout': f'{int(metagpt_job_runner.timeout // 60)} minutes',
+            'rate_limit': '3 requests per 10 minutes',
+            'jobs': metagpt_job_runner.get_stats()
         })
 
     except Exception as e:
@@ -2905,76 +2957,21 @@ def ollama_chat():
 @app.route('/api/llm/models', methods=['GET'])
 @rate_limit(max_requests=20, window_seconds=60)
 def get_all_llm_models():
-    """모든 LLM 모델 목록 조회 (SmartModelAllocator 기반)"""
+    """모든 LLM 모델 목록 조회 (백그라운드 갱신 카탈로그 스냅샷, ETag 지원)"""
     try:
-        # SmartModelAllocator에서 모델 정보 가져오기
-        allocator = SmartModelAllocator()
-        available_models = allocator.get_available_models()
-
-        cloud_models = []
-        for model_name in available_models:
-            model_info = allocator.get_model_info(model_name)
-            if model_info:
-                # 모델명을 더 친화적으로 변환
-                friendly_names = {
-                    'gpt-4': 'GPT-4',
-                    'gpt-3.5-turbo': 'GPT-3.5 Turbo',
-                    'gemini-2.5-flash': 'Gemini 2.5 Flash',
-                    'gemini-2.5-pro': 'Gemini 2.5 Pro',
-                    'gemini-flash': 'Gemini Flash',
-                    'gemini-pro': 'Gemini Pro',
-                    'claude-3': 'Claude-3 Sonnet',
-                    'claude-3-opus': 'Claude-3 Opus',
-                    'deepseek-coder': 'DeepSeek Coder'
-                }
+        if request.args.get('refresh') == 'true':
+            # Ollama 재조회는 백그라운드에서 수행 - 이번 응답은 현재 스냅샷
+            model_catalog.request_refresh()
 
-                # 설명 생성
-                descriptions = {
-                    'gpt-4': '범용 고성능 모델',
-                    'gpt-3.5-turbo': '빠른 응답 범용 모델',
-                    'gemini-2.5-flash': '최신 고속 멀티모달 모델',
-                    'gemini-2.5-pro': '최신 고성능 추론 모델',
-                    'gemini-flash': '빠른 응답 멀티모달 모델',
-                    'gemini-pro': '균형잡힌 멀티모달 모델',
-                    'claude-3': '추론 특화 모델',
-                    'claude-3-opus': '최고 품질 창작 모델',
-                    'deepseek-coder': '코딩 전문 모델'
-                }
+        snapshot, etag = model_catalog.get_snapshot()
 
-                cloud_models.append({
-                    'id': model_name,
-                    'name': friendly_names.get(model_name, model_name.title()),
-                    'description': descriptions.get(model_name, model_info.get('strengths', ['범용 모델'])[0] if model_info.get('strengths') else '범용 모델'),
-                    'provider': model_info['api_provider'].title(),
-                    'type': 'cloud',
-                    'cost_level': model_info.get('cost_level', 'medium'),
-                    'speed_level': model_info.get('speed_level', 'medium'),
-                    'strengths': model_info.get('strengths', []),
-                    'env_key': model_info.get('env_key', ''),
-                    'available': allocator.check_model_availability(model_name)
-                })
-
-        all_models = cloud_models.copy()
-
-        # Ollama 로컬 모델들 추가
-        if ollama_client.is_available():
-            ollama_result = ollama_client.get_models()
-            if ollama_result['success']:
-                for model in ollama_result['models']:
-                    model['type'] = 'local'
-                    model['available'] = True
-                    all_models.append(model)
-
-        return jsonify({
-            'success': True,
-            'models': all_models,
-            'count': len(all_models),
-            'cloud_count': len(cloud_models),
-            'local_count': len(all_models) - len(cloud_models),
-            'ollama_available': ollama_client.is_available(),
-            'available_models': len([m for m in all_models if m.get('available', True)]),
-            'env_status': allocator.env_status
-        })
+        if request.if_none_match.contains(etag):
+            response = app.response_class(status=304)
+        else:
+            response = jsonify(snapshot)
+        response.set_etag(etag)
+        response.headers['Cache-Control'] = 'no-cache'
+        return response
 
     except Exception as e:
         return jsonify({
@@ -2983,6 +2980,52 @@ def get_all_llm_models():
             'models': []
         }), 500
 
+@app.route('/api/llm/models/catalog/stats', methods=['GET'])
+@admin_required()
+def get_model_catalog_stats():
+    """모델 카탈로그 갱신 통계 조회"""
+    return jsonify({
+        'success': True,
+        'stats': model_catalog.get_stats()
+    })
+
+@app.route('/api/system/lazy-status', methods=['GET'])
+@admin_required()
+def get_lazy_loading_status():
+    """지연 로딩 서브시스템별 로딩 여부/소요 시간 조회"""
+    return jsonify({
+        'success': True,
+        'modules': get_lazy_status()
+    })
+
+@app.route('/api/metagpt/workspace/index/stats', methods=['GET'])
+@admin_required()
+def get_workspace_index_stats():
+    """MetaGPT workspace 프로젝트 색인 통계 (재스캔 횟수, 프로젝트 수)"""
+    return jsonify({
+        'success': True,
+        'stats': workspace_index.get_stats()
+    })
+
+@app.route('/api/metagpt/workers/stats', methods=['GET'])
+@admin_required()
+def get_metagpt_worker_stats():
+    """MetaGPT 워커 풀 상태 (워커별 요청/재시작 수, 세션 수)"""
+    return jsonify({
+        'success': True,
+        'enabled': metagpt_worker_pool is not None,
+        'stats': metagpt_worker_pool.get_stats() if metagpt_worker_pool is not None else None
+    })
+
+@app.route('/api/llm/transport/stats', methods=['GET'])
+@admin_required()
+def get_llm_transport_stats():
+    """LLM 프로바이더별 HTTP 지연시간 히스토그램 조회"""
+    return jsonify({
+        'success': True,
+        'latency': llm_transport.get_latency_stats()
+    })
+
 # 자동 모델 추천 엔드포인트 추가
 @app.route('/api/llm/models/recommend', methods=['POST'])
 @rate_limit(max_requests=10, window_seconds=60)
@@ -3000,8 +3043,8 @@ def recommend_models():
                 'error': '요구사항이 필요합니다'
             }), 400
 
-        # SmartModelAllocator를 사용하여 추천
-        allocator = SmartModelAllocator()
+        # 공유 SmartModelAllocator를 사용하여 추천 (같은 에이전트 조합/전략은 메모이즈)
+        allocator = get_model_allocator()
 
         # 요구사항 분석 및 에이전트 매칭 (임시로 간단한 분석 구현)
         from intelligent_requirement_analyzer import IntelligentRequirementAnalyzer
@@ -3099,6 +3142,15 @@ def create_pre_analysis():
         print(f"사전 분석 생성 오류: {e}")
         return jsonify({'error': str(e)}), 500
 
+@app.route('/api/pre-analysis/cache/stats', methods=['GET'])
+@admin_required()
+def get_pre_analysis_cache_stats():
+    """사전 분석 응답 캐시 지표 조회"""
+    return jsonify({
+        'success': True,
+        'stats': pre_analysis_service.get_cache_stats()
+    })
+
 @app.route('/api/approval/pending', methods=['GET'])
 def get_pending_approvals():
     """승인 대기 중인 요청 목록 조회"""
@@ -3789,5 +3841,15 @@ if __name__ == '__main__':
     except ImportError as e:
         print(f"⚠️ WebSocket 매니저 초기화 실패: {e}")
 
+    # 자주 쓰는 LLM 클라이언트 백그라운드 워밍업
+    try:
+        from llm_registry import llm_registry
+        llm_registry.warm_up_async()
+    except ImportError as e:
+        print(f"⚠️ LLM 클라이언트 워밍업 실패: {e}")
+
+    # 지연 로딩 서브시스템 백그라운드 사전 로딩 (LAZY_PRELOAD=true일 때만)
+    preload_async_from_env()
+
     # SocketIO로 서버 실행
     socketio.run(app, host='0.0.0.0', port=PORT, debug=True)
@@ -252,7 +252,8 @@ ${executionPlan.phases.map(phase =>
                             workflowData: data.need_approval ? {
                                 step: data.step,
                                 next_step: data.next_step,
-                                need_approval: data.need_approval
+                                need_approval: data.need_approval,
+                                session_id: data.sessionId
                             } : null
                         };
                     }
@@ -383,7 +384,8 @@ MetaGPT가 "${userMessage}" 요청을 분석했습니다.
                     requirement: inputText,
                     currentStep: response.workflowData.step,
                     nextStep: response.workflowData.next_step,
-                    needApproval: response.workflowData.need_approval
+                    needApproval: response.workflowData.need_approval,
+                    sessionId: response.workflowData.session_id // 다음 단계 요청에 포함 (같은 워커 세션 유지)
                 });
             }
         } catch (error) {
@@ -597,7 +599,8 @@ MetaGPT가 "${userMessage}" 요청을 분석했습니다.
                     requirement: currentWorkflow.requirement,
                     step: approve ? currentWorkflow.nextStep : currentWorkflow.currentStep,
                     user_response: approve ? 'approve' : 'reject',
-                    modifications: modifications
+                    modifications: modifications,
+                    sessionId: currentWorkflow.sessionId
                 })
             });
 
@@ -622,11 +625,23 @@ MetaGPT가 "${userMessage}" 요청을 분석했습니다.
                         requirement: currentWorkflow.requirement,
                         currentStep: data.step,
                         nextStep: data.next_step,
-                        needApproval: true
+                        needApproval: true,
+                        sessionId: data.sessionId || currentWorkflow.sessionId
                     });
                 } else {
                     setCurrentWorkflow(null); // 워크플로우 완료
                 }
+            } else if (data.error === 'session_lost') {
+                // 서버의 세션 상태가 사라짐 - 현재 워크플로우를 종료하고 처음부터 다시 요청하도록 안내
+                setCurrentWorkflow(null);
+                const errorMessage = {
+                    id: Date.now(),
+                    text: `⚠️ ${data.message}`,
+                    sender: 'ai',
+                    aiType: 'meta-gpt',
+                    timestamp: new Date()
+                };
+                setMessages(prev => [...prev, errorMessage]);
             } else {
                 const errorMessage = {
                     id: Date.now(),
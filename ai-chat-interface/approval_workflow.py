@@ -7,7 +7,9 @@
 import os
 import json
 import uuid
-from datetime import datetime
+import threading
+from collections import OrderedDict
+from datetime import datetime, timezone
 from typing import Dict, List, Optional, Tuple
 import logging
 from enum import Enum
@@ -32,6 +34,9 @@ except ImportError as e:
     Client = None
     supabase_available = False
 
+# 처리/만료된 승인 요청 기록 최대 수 (오래된 것부터 제거)
+RESOLVED_APPROVAL_LIMIT = 10000
+
 class ApprovalStatus(Enum):
     """승인 상태 열거형"""
     PENDING = "pending"           # 승인 대기
@@ -68,6 +73,16 @@ class ApprovalWorkflowManager:
         self.approval_storage = {}
         self.analysis_storage = {}
 
+        # 데이터베이스 read-through 캐시 (approval_id -> 대기 중인 row)
+        # DB가 기록한 updated_at 워터마크 이후 변경된 행만 증분 동기화 (대기 상태가 아닌 행은 제거)
+        self._db_cache: Dict[str, Dict] = {}
+        # approval_id -> DB에서 대기 상태를 벗어난 행의 {status, updated_at}
+        # 다른 워커가 처리한 요청의 오래된 메모리 사본이 대기 중으로 보이지 않도록 병합 시 비교
+        self._db_resolved: "OrderedDict[str, Dict]" = OrderedDict()
+        self._db_watermark: Optional[str] = None
+        self._db_watermark_at: Optional[datetime] = None
+        self._db_cache_lock = threading.Lock()
+
         self._initialized = True
 
     def create_approval_request(self,
@@ -89,7 +104,7 @@ class ApprovalWorkflowManager:
         """
         try:
             approval_id = str(uuid.uuid4())
-            timestamp = datetime.now()
+            timestamp = self._utc_now()
 
             approval_request = {
                 "approval_id": approval_id,
@@ -194,7 +209,7 @@ class ApprovalWorkflowManager:
                 logger.error(f"메모리 저장소 디버깅: {self.approval_storage}")
                 raise ValueError(f"승인 요청을 찾을 수 없음: {approval_id}")
 
-            timestamp = datetime.now()
+            timestamp = self._utc_now()
 
             # 액션별 상태 업데이트
             if action == 'approve':
@@ -252,48 +267,143 @@ class ApprovalWorkflowManager:
             }
 
     def get_pending_approvals(self, project_id: Optional[str] = None) -> List[Dict]:
-        """대기 중인 승인 요청 목록 조회"""
-        pending_approvals = []
-
-        # 데이터베이스에서 조회 (실패해도 계속 진행)
-        if self.supabase:
-            try:
-                query = self.supabase.table('approval_requests').select('*').eq('status', ApprovalStatus.PENDING.value)
-                if project_id:
-                    query = query.eq('project_id', project_id)
+        """대기 중인 승인 요청 목록 조회 (DB 증분 동기화 + 메모리 병합, approval_id 기준 중복 제거)"""
+        # 데이터베이스 증분 동기화 (실패해도 캐시된 결과로 계속 진행)
+        self._sync_db_cache()
 
-                result = query.execute()
-                if result.data:
-                    pending_approvals.extend(result.data)
-                    logger.info(f"데이터베이스에서 승인 요청 {len(result.data)}개 조회")
-            except Exception as db_error:
-                logger.error(f"데이터베이스 조회 실패: {str(db_error)}")
+        with self._db_cache_lock:
+            merged = dict(self._db_cache)
+            resolved = dict(self._db_resolved)
 
-        # 메모리 저장소에서 조회
+        # 메모리 저장소 병합 - 같은 ID는 updated_at이 더 최신인 쪽 사용
+        # DB에서 이미 처리된 요청은 메모리 사본이 그보다 확실히 최신일 때만 사용
         try:
-            memory_count = 0
-            logger.info(f"메모리 저장소 총 {len(self.approval_storage)}개 항목 확인 중")
-
-            for approval_id, approval_data in self.approval_storage.items():
-                current_status = approval_data.get('status')
-                expected_status = ApprovalStatus.PENDING.value
-                logger.info(f"승인 ID {approval_id}: 현재 상태='{current_status}', 예상 상태='{expected_status}', 일치={current_status == expected_status}")
-
-                if (approval_data.get('status') == ApprovalStatus.PENDING.value and
-                    (not project_id or approval_data.get('project_id') == project_id)):
-                    pending_approvals.append(approval_data)
-                    memory_count += 1
-
-            if memory_count > 0:
-                logger.info(f"메모리에서 승인 요청 {memory_count}개 조회")
-            else:
-                logger.info(f"메모리에서 조건에 맞는 승인 요청 없음")
+            for approval_id, approval_data in list(self.approval_storage.items()):
+                tombstone = resolved.get(approval_id)
+                if tombstone is not None and not self._is_strictly_newer(approval_data, tombstone):
+                    continue
+                cached = merged.get(approval_id)
+                if cached is None or self._is_newer(approval_data, cached):
+                    merged[approval_id] = approval_data
         except Exception as memory_error:
             logger.error(f"메모리 조회 실패: {str(memory_error)}")
 
-        logger.info(f"총 {len(pending_approvals)}개 승인 요청 반환")
+        pending_approvals = [
+            approval_data for approval_data in merged.values()
+            if approval_data.get('status') == ApprovalStatus.PENDING.value
+            and (not project_id or approval_data.get('project_id') == project_id)
+        ]
+        pending_approvals.sort(key=lambda item: item.get('created_at') or '', reverse=True)
+
+        logger.debug(f"총 {len(pending_approvals)}개 승인 요청 반환 (DB 캐시 {len(self._db_cache)}개, 메모리 {len(self.approval_storage)}개)")
         return pending_approvals
 
+    def _sync_db_cache(self) -> None:
+        """워터마크 이후 변경된 승인 요청만 데이터베이스에서 가져와 캐시 갱신"""
+        if not self.supabase:
+            return
+
+        try:
+            with self._db_cache_lock:
+                watermark = self._db_watermark
+
+            query = self.supabase.table('approval_requests').select('*')
+            if watermark:
+                # 같은 시각에 갱신된 행을 놓치지 않도록 경계값 포함 (중복은 ID로 제거됨)
+                # 상태 변경(대기 -> 승인 등)을 반영해야 하므로 증분 동기화는 상태 필터 없이 조회
+                query = query.gte('updated_at', watermark)
+            else:
+                # 최초 동기화는 대기 중인 요청만 적재
+                query = query.eq('status', ApprovalStatus.PENDING.value)
+
+            result = query.order('updated_at').execute()
+            rows = result.data or []
+
+            with self._db_cache_lock:
+                for row in rows:
+                    self._cache_db_row_locked(row)
+                    updated_at = self._parse_timestamp(row.get('updated_at'))
+                    if updated_at and (self._db_watermark_at is None or updated_at > self._db_watermark_at):
+                        # 쿼리에는 DB가 돌려준 원래 문자열을 그대로 사용
+                        self._db_watermark_at = updated_at
+                        self._db_watermark = row.get('updated_at')
+
+            if rows:
+                logger.info(f"데이터베이스에서 변경된 승인 요청 {len(rows)}개 동기화 (워터마크: {self._db_watermark})")
+        except Exception as db_error:
+            logger.error(f"데이터베이스 동기화 실패: {str(db_error)}")
+
+    def _cache_db_row(self, approval_request: Dict) -> None:
+        """데이터베이스에 기록한 행을 캐시에 반영 (다음 동기화 전에도 일관된 조회 보장)"""
+        with self._db_cache_lock:
+            self._cache_db_row_locked(approval_request)
+
+    def _cache_db_row_locked(self, row: Dict) -> None:
+        """대기 중인 행만 캐시에 보관 (처리/만료된 행은 제거하고 상태/갱신 시각만 기록)"""
+        approval_id = row.get('approval_id')
+        if not approval_id:
+            return
+        if row.get('status') == ApprovalStatus.PENDING.value:
+            self._db_cache[approval_id] = row
+            self._db_resolved.pop(approval_id, None)
+        else:
+            self._db_cache.pop(approval_id, None)
+            self._db_resolved[approval_id] = {'status': row.get('status'), 'updated_at': row.get('updated_at')}
+            self._db_resolved.move_to_end(approval_id)
+            while len(self._db_resolved) > RESOLVED_APPROVAL_LIMIT:
+                self._db_resolved.popitem(last=False)
+
+    def invalidate_approval_cache(self) -> None:
+        """승인 요청 캐시 초기화 - 다음 조회 시 전체 재동기화"""
+        with self._db_cache_lock:
+            self._db_cache.clear()
+            self._db_resolved.clear()
+            self._db_watermark = None
+            self._db_watermark_at = None
+
+    @staticmethod
+    def _utc_now() -> datetime:
+        """메모리 저장 행의 시각 (DB 시각과 비교할 수 있도록 UTC, 시간대 포함)"""
+        return datetime.now(timezone.utc)
+
+    @staticmethod
+    def _parse_timestamp(value) -> Optional[datetime]:
+        """ISO 시각 파싱 (시간대가 있으면 UTC 기준 naive로 맞춤, 실패 시 None)"""
+        if not value:
+            return None
+        try:
+            text = str(value).replace('Z', '+00:00')
+            # 소수점 이하 자릿수가 6자리가 아닌 경우 (PostgREST 출력) 보정
+            if '.' in text:
+                head, _, tail = text.partition('.')
+                digits = len(tail) - len(tail.lstrip('0123456789'))
+                fraction, rest = tail[:digits], tail[digits:]
+                text = f"{head}.{(fraction + '000000')[:6]}{rest}"
+            parsed = datetime.fromisoformat(text)
+        except ValueError:
+            return None
+        if parsed.tzinfo is not None:
+            parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+        return parsed
+
+    @classmethod
+    def _is_newer(cls, candidate: Dict, current: Dict) -> bool:
+        """updated_at 비교 (파싱 불가한 값이 있으면 후보를 우선)"""
+        candidate_ts = cls._parse_timestamp(candidate.get('updated_at'))
+        current_ts = cls._parse_timestamp(current.get('updated_at'))
+        if candidate_ts is None or current_ts is None:
+            return True
+        return candidate_ts >= current_ts
+
+    @classmethod
+    def _is_strictly_newer(cls, candidate: Dict, current: Dict) -> bool:
+        """updated_at이 확실히 더 최신인 경우만 True (파싱 불가하면 기존 값 우선)"""
+        candidate_ts = cls._parse_timestamp(candidate.get('updated_at'))
+        current_ts = cls._parse_timestamp(current.get('updated_at'))
+        if candidate_ts is None or current_ts is None:
+            return False
+        return candidate_ts > current_ts
+
     def request_revision(self,
                         approval_id: str,
                         revision_requests: Dict,
@@ -321,7 +431,7 @@ class ApprovalWorkflowManager:
             # 수정된 분석 결과 적용
             approval_request['analysis_result'] = revised_analysis
             approval_request['status'] = ApprovalStatus.PENDING.value
-            approval_request['updated_at'] = datetime.now().isoformat()
+            approval_request['updated_at'] = self._utc_now().isoformat()
 
             # 저장
             if self._update_approval_in_db(approval_request):
@@ -377,8 +487,12 @@ class ApprovalWorkflowManager:
 
         try:
             logger.info(f"승인 요청 데이터베이스 삽입 중: approval_id={approval_request.get('approval_id')}")
-            result = self.supabase.table('approval_requests').insert(approval_request).execute()
+            # created_at/updated_at은 DB 기본값(NOW())으로 기록 - 워터마크를 DB 시계 하나로 유지
+            row = {key: value for key, value in approval_request.items() if key not in ('created_at', 'updated_at')}
+            result = self.supabase.table('approval_requests').insert(row).execute()
             success = len(result.data) > 0
+            if success:
+                self._cache_db_row(result.data[0])
             logger.info(f"데이터베이스 저장 결과: success={success}, result_data_length={len(result.data) if result.data else 0}")
             return success
 
@@ -393,13 +507,20 @@ class ApprovalWorkflowManager:
             return False
 
         try:
-            # 승인 요청 업데이트
-            result = self.supabase.table('approval_requests').update(approval_request).eq('approval_id', approval_request['approval_id']).execute()
+            # 승인 요청 업데이트 (updated_at은 DB 트리거가 기록)
+            row = {key: value for key, value in approval_request.items() if key not in ('created_at', 'updated_at')}
+            result = self.supabase.table('approval_requests').update(row).eq('approval_id', approval_request['approval_id']).execute()
 
             # 히스토리 추가
             if history_entry:
                 self.supabase.table('approval_history').insert(history_entry).execute()
 
+            if result.data:
+                self._cache_db_row(result.data[0])
+                # 조회 시 메모리에 보관된 사본도 DB 시각이 담긴 행으로 교체
+                approval_id = approval_request['approval_id']
+                if approval_id in self.approval_storage:
+                    self.approval_storage[approval_id] = result.data[0]
             return len(result.data) > 0
 
         except Exception as e:
@@ -462,29 +583,34 @@ class ApprovalWorkflowManager:
         try:
             from datetime import timedelta
 
-            cutoff_date = datetime.now() - timedelta(days=days)
+            cutoff_date = self._utc_now() - timedelta(days=days)
+            cutoff_naive = cutoff_date.replace(tzinfo=None)
             cleaned_count = 0
 
-            # 메모리 저장소 정리
+            # 메모리 저장소 정리 (저장 시각은 UTC 기준 naive로 맞춰 비교)
             expired_keys = []
             for approval_id, approval_data in self.approval_storage.items():
-                created_at = datetime.fromisoformat(approval_data.get('created_at', ''))
-                if (created_at < cutoff_date and
+                created_at = self._parse_timestamp(approval_data.get('created_at'))
+                if (created_at is not None and created_at < cutoff_naive and
                     approval_data.get('status') == ApprovalStatus.PENDING.value):
                     expired_keys.append(approval_id)
 
             for key in expired_keys:
                 self.approval_storage[key]['status'] = ApprovalStatus.EXPIRED.value
+                self.approval_storage[key]['updated_at'] = self._utc_now().isoformat()
                 cleaned_count += 1
 
             # 데이터베이스 정리
             if self.supabase:
+                # updated_at은 DB 트리거가 갱신하므로 워터마크 동기화에 반영됨
                 result = self.supabase.table('approval_requests').update({
                     'status': ApprovalStatus.EXPIRED.value
                 }).lt('created_at', cutoff_date.isoformat()).eq('status', ApprovalStatus.PENDING.value).execute()
 
                 if result.data:
                     cleaned_count += len(result.data)
+                    for row in result.data:
+                        self._cache_db_row(row)
 
             logger.info(f"만료된 승인 요청 {cleaned_count}개 정리 완료")
             return cleaned_count
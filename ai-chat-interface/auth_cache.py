@@ -0,0 +1,158 @@
+# -*- coding: utf-8 -*-
+"""
+검증된 JWT 캐시 (Verified Token Cache)
+토큰 해시 키 LRU로 디코딩된 payload를 만료 시각까지 보관 - 폐기(denylist), 요청 단위 사용자/역할 메모이제이션
+"""
+
+import time
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional
+
+from flask import g, has_request_context
+
+# 만료(exp) 클레임이 없는 토큰의 최대 캐시 시간 (초)
+DEFAULT_TTL_SECONDS = 300
+
+# 사용자별 토큰 버전 클레임 - 발급 시 현재 버전을 넣고, 사용자 토큰 전체 폐기 시 버전을 올림
+TOKEN_VERSION_CLAIM = 'tv'
+
+_MISSING = object()
+
+
+def hash_token(token: str) -> str:
+    """토큰 원문 대신 사용하는 캐시 키"""
+    return hashlib.sha256(token.encode('utf-8')).hexdigest()
+
+
+class VerifiedTokenCache:
+    """검증 성공한 토큰의 payload 캐시"""
+
+    def __init__(self, max_entries: int = 2048):
+        self.max_entries = max_entries
+        # (네임스페이스, 토큰 해시) -> (만료 시각, payload)
+        self._entries: OrderedDict = OrderedDict()
+        # 토큰 해시 -> 폐기 기록 만료 시각
+        self._denylist: Dict[str, float] = {}
+        # 사용자 ID -> 현재 토큰 버전 (이보다 낮은 버전 클레임의 토큰은 무효, 없으면 0)
+        self._token_versions: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        self._stats = {'hits': 0, 'misses': 0, 'revoked': 0}
+
+    def verify(self, namespace: str, token: str, verifier: Callable[[str], Optional[Dict]]) -> Optional[Dict]:
+        """
+        캐시 조회 후 없으면 verifier로 검증하여 저장
+
+        Args:
+            namespace: 검증 방식 구분 (예: 'main', 'admin') - 방식별 결과를 섞지 않음
+            verifier: 토큰 -> payload (실패 시 None)
+        """
+        token_hash = hash_token(token)
+        if self._is_denied(token_hash):
+            return None
+
+        key = (namespace, token_hash)
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                expires_at, payload = entry
+                if expires_at > now:
+                    self._entries.move_to_end(key)
+                    self._stats['hits'] += 1
+                else:
+                    del self._entries[key]
+                    entry = None
+            if entry is None:
+                self._stats['misses'] += 1
+
+        if entry is not None:
+            return None if self._is_payload_revoked(payload) else payload
+
+        payload = verifier(token)
+        if payload is None or self._is_payload_revoked(payload):
+            return None
+
+        exp = payload.get('exp')
+        expires_at = float(exp) if isinstance(exp, (int, float)) else now + DEFAULT_TTL_SECONDS
+        with self._lock:
+            self._entries[key] = (expires_at, payload)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return payload
+
+    # ==================== 폐기 ====================
+
+    def revoke(self, token: str, expires_at: Optional[float] = None) -> None:
+        """특정 토큰 폐기 (로그아웃 등)"""
+        token_hash = hash_token(token)
+        with self._lock:
+            self._denylist[token_hash] = expires_at or (time.time() + 24 * 3600)
+            for key in [key for key in self._entries if key[1] == token_hash]:
+                del self._entries[key]
+            self._stats['revoked'] += 1
+            self._prune_denylist_locked()
+
+    def revoke_subject(self, user_id: str) -> None:
+        """사용자의 기존 토큰 전부 폐기 (비밀번호/역할 변경, 계정 삭제 시) - 토큰 버전 증가"""
+        with self._lock:
+            subject = str(user_id)
+            self._token_versions[subject] = self._token_versions.get(subject, 0) + 1
+            self._stats['revoked'] += 1
+
+    def token_version(self, user_id: Any) -> int:
+        """토큰 발급 시 TOKEN_VERSION_CLAIM에 넣을 사용자의 현재 토큰 버전"""
+        with self._lock:
+            return self._token_versions.get(str(user_id), 0)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def get_stats(self) -> Dict:
+        with self._lock:
+            stats = dict(self._stats)
+            stats['size'] = len(self._entries)
+            stats['denylist_size'] = len(self._denylist)
+        return stats
+
+    def _is_denied(self, token_hash: str) -> bool:
+        with self._lock:
+            expires_at = self._denylist.get(token_hash)
+            return expires_at is not None and expires_at > time.time()
+
+    def _is_payload_revoked(self, payload: Dict) -> bool:
+        # 발급 시각(iat, 초 단위)으로는 같은 초에 발급된 폐기 전/후 토큰을 구분할 수 없으므로 버전으로 비교
+        subject = payload.get('user_id') or payload.get('username')
+        if subject is None:
+            return False
+        with self._lock:
+            current_version = self._token_versions.get(str(subject), 0)
+        if current_version == 0:
+            return False
+        token_version = payload.get(TOKEN_VERSION_CLAIM, 0)
+        return not isinstance(token_version, int) or token_version < current_version
+
+    def _prune_denylist_locked(self) -> None:
+        now = time.time()
+        for token_hash in [h for h, expires_at in self._denylist.items() if expires_at <= now]:
+            del self._denylist[token_hash]
+
+
+# 전역 토큰 캐시 인스턴스
+token_cache = VerifiedTokenCache()
+
+
+def memoize_per_request(name: str, loader: Callable[[], Any]) -> Any:
+    """요청 컨텍스트 안에서는 loader 결과를 flask.g에 한 번만 계산해 보관"""
+    if not has_request_context():
+        return loader()
+
+    memo = g.setdefault('_auth_memo', {})
+    value = memo.get(name, _MISSING)
+    if value is _MISSING:
+        value = loader()
+        memo[name] = value
+    return value
@@ -0,0 +1,115 @@
+# -*- coding: utf-8 -*-
+"""
+서버 시작 시간 벤치마크 (Startup Benchmark)
+`python -X importtime`으로 app 모듈 import 시간을 측정하고 가장 오래 걸린 모듈을 출력
+
+사용법:
+    python benchmark_startup.py                 # app import 시간 측정
+    python benchmark_startup.py --top 30        # 상위 30개 모듈 출력
+    python benchmark_startup.py --threshold 1.0 # 1초 초과 시 종료 코드 1
+"""
+
+import os
+import re
+import sys
+import time
+import argparse
+import subprocess
+from typing import Dict, List, Tuple
+
+IMPORTTIME_LINE = re.compile(r'^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)\s*$')
+
+
+def parse_importtime(stderr: str) -> List[Tuple[str, int, int, int]]:
+    """-X importtime 출력 파싱 -> [(모듈명, self us, cumulative us, 깊이)]"""
+    entries = []
+    for line in stderr.splitlines():
+        match = IMPORTTIME_LINE.match(line)
+        if match:
+            self_us, cumulative_us, indent, module = match.groups()
+            entries.append((module, int(self_us), int(cumulative_us), (len(indent) - 1) // 2))
+    return entries
+
+
+def direct_imports(entries: List[Tuple[str, int, int, int]], module: str) -> List[Tuple[str, int, int, int]]:
+    """대상 모듈이 직접 import한 모듈 (출력에서 자식은 부모보다 먼저, 한 단계 깊게 표시됨)"""
+    indexes = [i for i, entry in enumerate(entries) if entry[0] == module]
+    if not indexes:
+        return []
+
+    index = indexes[-1]
+    depth = entries[index][3]
+    children = []
+    for entry in reversed(entries[:index]):
+        if entry[3] <= depth:
+            break
+        if entry[3] == depth + 1:
+            children.append(entry)
+    return children
+
+
+def measure(module: str = 'app', runs: int = 1) -> Dict:
+    """별도 프로세스에서 모듈 import 시간 측정 (가장 빠른 실행 기준)"""
+    base_dir = os.path.dirname(os.path.abspath(__file__))
+    env = dict(os.environ, PYTHONDONTWRITEBYTECODE='0')
+
+    best = None
+    for _ in range(runs):
+        started = time.perf_counter()
+        completed = subprocess.run(
+            [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+            cwd=base_dir, env=env, capture_output=True, text=True, encoding='utf-8', errors='replace'
+        )
+        wall_seconds = time.perf_counter() - started
+
+        entries = parse_importtime(completed.stderr)
+        target = next((entry for entry in reversed(entries) if entry[0] == module), None)
+        result = {
+            'returncode': completed.returncode,
+            'wall_seconds': round(wall_seconds, 3),
+            'import_seconds': round(target[2] / 1e6, 3) if target else None,
+            'entries': entries,
+            'error': completed.stderr.strip().splitlines()[-1] if completed.returncode else None
+        }
+        if best is None or result['wall_seconds'] < best['wall_seconds']:
+            best = result
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description='서버 시작(import) 시간 측정')
+    parser.add_argument('--module', default='app', help='측정할 모듈 (기본 app)')
+    parser.add_argument('--runs', type=int, default=3, help='반복 횟수 (가장 빠른 실행 기준)')
+    parser.add_argument('--top', type=int, default=15, help='출력할 상위 모듈 수')
+    parser.add_argument('--threshold', type=float, default=None, help='허용 최대 import 시간(초)')
+    args = parser.parse_args()
+
+    result = measure(args.module, args.runs)
+
+    print("=" * 70)
+    print(f"📊 '{args.module}' 시작 시간 (최소 {args.runs}회 중)")
+    print("=" * 70)
+    if result['returncode'] != 0:
+        print(f"❌ import 실패: {result['error']}")
+        sys.exit(2)
+
+    print(f"프로세스 전체: {result['wall_seconds']:.3f}s")
+    print(f"{args.module} import: {result['import_seconds']:.3f}s")
+
+    print(f"\n누적 시간 상위 {args.top}개 모듈 ({args.module}의 직접 import 기준):")
+    direct = direct_imports(result['entries'], args.module)
+    for module, _, cumulative_us, _ in sorted(direct, key=lambda e: e[2], reverse=True)[:args.top]:
+        print(f"  {cumulative_us / 1e6:8.3f}s  {module}")
+
+    print(f"\n자체 시간 상위 {args.top}개 모듈:")
+    for module, self_us, _, _ in sorted(result['entries'], key=lambda e: e[1], reverse=True)[:args.top]:
+        print(f"  {self_us / 1e6:8.3f}s  {module}")
+
+    if args.threshold is not None and result['import_seconds'] > args.threshold:
+        print(f"\n❌ 기준 초과: {result['import_seconds']:.3f}s > {args.threshold:.3f}s")
+        sys.exit(1)
+    print("\n✅ 측정 완료")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,250 @@
+# -*- coding: utf-8 -*-
+"""
+대화 이력 관리자 (Chat History Manager)
+세션별 대화 이력을 서버에 보관하고, 토큰 예산을 넘는 오래된 대화는 누적 요약으로 압축
+"""
+
+import time
+import uuid
+import threading
+from collections import OrderedDict
+from typing import Callable, Dict, List, Optional
+import logging
+
+logger = logging.getLogger(__name__)
+
+try:
+    import tiktoken
+    TIKTOKEN_AVAILABLE = True
+except ImportError:
+    tiktoken = None
+    TIKTOKEN_AVAILABLE = False
+
+# 클라이언트가 보내는 역할명을 표준 역할명으로 변환
+ROLE_ALIASES = {
+    'user': 'user',
+    'assistant': 'assistant',
+    'ai': 'assistant'
+}
+
+# 요약 시 원문 대화 최대 길이 (요약 프롬프트 폭주 방지)
+MAX_SUMMARY_SOURCE_CHARS = 12000
+
+SUMMARY_PROMPT = """다음은 소프트웨어 요구사항 정리를 위한 대화의 앞부분입니다.
+이후 대화를 이어가는 데 필요한 사실(프로젝트 목적, 핵심 기능, 대상 사용자, 기술 스택, 제약사항, 이미 확인된 결정, 남은 질문)만 간결한 한국어 글머리표로 요약하세요.
+
+[기존 요약]
+{previous_summary}
+
+[추가된 대화]
+{transcript}
+"""
+
+
+def count_tokens(text: str, model: str = '') -> int:
+    """모델별 토큰 수 계산 (tiktoken 미설치 시 근사치)"""
+    if not text:
+        return 0
+
+    if TIKTOKEN_AVAILABLE and model.startswith('gpt'):
+        try:
+            encoding = _get_encoding(model)
+            return len(encoding.encode(text))
+        except Exception:
+            pass
+
+    # 근사치: ASCII는 약 4자당 1토큰, 한글 등 비ASCII 문자는 약 1자당 1토큰
+    ascii_chars = sum(1 for ch in text if ord(ch) < 128)
+    return ascii_chars // 4 + (len(text) - ascii_chars) + 1
+
+
+_encoding_cache: Dict[str, object] = {}
+
+
+def _get_encoding(model: str):
+    encoding = _encoding_cache.get(model)
+    if encoding is None:
+        try:
+            encoding = tiktoken.encoding_for_model(model)
+        except KeyError:
+            encoding = tiktoken.get_encoding('cl100k_base')
+        _encoding_cache[model] = encoding
+    return encoding
+
+
+def normalize_history(conversation_history: List[Dict]) -> List[Dict]:
+    """클라이언트 대화 이력을 {'role', 'content'} 형태로 정규화"""
+    normalized = []
+    for msg in conversation_history or []:
+        role = ROLE_ALIASES.get((msg or {}).get('role'))
+        content = (msg or {}).get('content')
+        if role and content:
+            normalized.append({'role': role, 'content': content})
+    return normalized
+
+
+class ChatSession:
+    """세션 상태 - 누적 요약 + 최근 대화 원문"""
+
+    def __init__(self, session_id: str):
+        self.session_id = session_id
+        self.summary = ''
+        self.summarized_count = 0
+        self.turns: List[Dict] = []
+        self.updated_at = time.time()
+        self.lock = threading.Lock()
+        self.compacting = False
+
+
+class ChatHistoryManager:
+    """토큰 예산 기반 대화 이력 압축 관리자"""
+
+    def __init__(self,
+                 keep_recent_turns: int = 6,
+                 token_budget: int = 3000,
+                 max_sessions: int = 500,
+                 session_ttl_seconds: int = 6 * 3600):
+        self.keep_recent_turns = keep_recent_turns
+        self.token_budget = token_budget
+        self.max_sessions = max_sessions
+        self.session_ttl_seconds = session_ttl_seconds
+
+        self._sessions: "OrderedDict[str, ChatSession]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    # ==================== 세션 관리 ====================
+
+    def create_session(self, conversation_history: Optional[List[Dict]] = None) -> str:
+        """새 세션 생성 (기존 클라이언트 이력이 있으면 초기값으로 사용)"""
+        session_id = str(uuid.uuid4())
+        session = ChatSession(session_id)
+        session.turns = normalize_history(conversation_history)
+
+        with self._lock:
+            self._sessions[session_id] = session
+            self._evict_locked()
+        return session_id
+
+    def get_session(self, session_id: Optional[str]) -> Optional[ChatSession]:
+        """세션 조회 (만료 시 None)"""
+        if not session_id:
+            return None
+
+        with self._lock:
+            session = self._sessions.get(session_id)
+            if session is None:
+                return None
+            if time.time() - session.updated_at > self.session_ttl_seconds:
+                del self._sessions[session_id]
+                return None
+            self._sessions.move_to_end(session_id)
+            return session
+
+    def delete_session(self, session_id: str) -> None:
+        with self._lock:
+            self._sessions.pop(session_id, None)
+
+    def _evict_locked(self) -> None:
+        while len(self._sessions) > self.max_sessions:
+            self._sessions.popitem(last=False)
+
+    # ==================== 컨텍스트 구성 ====================
+
+    def get_context(self, session: ChatSession) -> Dict:
+        """LLM 호출용 컨텍스트 - {'summary': 누적 요약, 'turns': 최근 대화}"""
+        with session.lock:
+            return {
+                'summary': session.summary,
+                'turns': list(session.turns)
+            }
+
+    def record_exchange(self,
+                        session: ChatSession,
+                        user_message: str,
+                        ai_message: str,
+                        model: str,
+                        summarize: Callable[[str, str], str]) -> None:
+        """
+        대화 한 턴 기록 후 예산 초과 시 오래된 대화를 요약으로 압축
+
+        Args:
+            summarize: (기존 요약, 추가 대화 원문) -> 새 요약 을 반환하는 함수
+        """
+        with session.lock:
+            session.turns.append({'role': 'user', 'content': user_message})
+            session.turns.append({'role': 'assistant', 'content': ai_message})
+            session.updated_at = time.time()
+
+            if session.compacting or not self._needs_compaction(session, model):
+                return
+            session.compacting = True
+
+        # 요약 LLM 호출은 응답 이후 백그라운드에서 수행
+        threading.Thread(
+            target=self._compact,
+            args=(session, model, summarize),
+            daemon=True,
+            name=f'chat-compact-{session.session_id[:8]}'
+        ).start()
+
+    def _needs_compaction(self, session: ChatSession, model: str) -> bool:
+        if len(session.turns) <= self.keep_recent_turns:
+            return False
+        total = count_tokens(session.summary, model) + sum(
+            count_tokens(turn['content'], model) for turn in session.turns
+        )
+        return total > self.token_budget
+
+    def _compact(self, session: ChatSession, model: str, summarize: Callable[[str, str], str]) -> None:
+        try:
+            with session.lock:
+                fold_count = len(session.turns) - self.keep_recent_turns
+                if fold_count <= 0:
+                    return
+                folded = session.turns[:fold_count]
+                previous_summary = session.summary
+
+            transcript = self._format_transcript(folded)
+            try:
+                new_summary = summarize(previous_summary, transcript)
+            except Exception as e:
+                logger.warning(f"대화 요약 실패, 원문 발췌로 대체: {str(e)}")
+                new_summary = self._fallback_summary(previous_summary, transcript)
+
+            with session.lock:
+                # 요약하는 동안 추가된 대화는 유지
+                session.turns = session.turns[fold_count:]
+                session.summary = (new_summary or '').strip()
+                session.summarized_count += fold_count
+
+            logger.info(f"대화 이력 압축: 세션 {session.session_id}, {fold_count}개 메시지 요약")
+        finally:
+            with session.lock:
+                session.compacting = False
+
+    @staticmethod
+    def _format_transcript(turns: List[Dict]) -> str:
+        labels = {'user': '사용자', 'assistant': 'AI'}
+        transcript = '\n'.join(f"{labels[turn['role']]}: {turn['content']}" for turn in turns)
+        return transcript[-MAX_SUMMARY_SOURCE_CHARS:]
+
+    @staticmethod
+    def _fallback_summary(previous_summary: str, transcript: str) -> str:
+        combined = f"{previous_summary}\n{transcript}".strip()
+        return combined[-2000:]
+
+    def get_stats(self) -> Dict:
+        with self._lock:
+            return {
+                'sessions': len(self._sessions),
+                'keep_recent_turns': self.keep_recent_turns,
+                'token_budget': self.token_budget
+            }
+
+
+def build_summary_prompt(previous_summary: str, transcript: str) -> str:
+    """요약 프롬프트 구성"""
+    return SUMMARY_PROMPT.format(
+        previous_summary=previous_summary or '(없음)',
+        transcript=transcript
+    )
@@ -4,16 +4,25 @@ Database connection and models for AI Chat Interface
 Supabase integration with PostgreSQL
 """
 
+from __future__ import annotations
+
 import os
 import json
 import socket
 import urllib.parse
 from datetime import datetime, timedelta
-from typing import Optional, List, Dict, Any
-from supabase import create_client, Client
+from typing import TYPE_CHECKING, Optional, List, Dict, Any
 from dotenv import load_dotenv
 import jwt
 import bcrypt
+from auth_cache import token_cache, memoize_per_request, TOKEN_VERSION_CLAIM
+from lazy_loader import LazyObject, lazy_import
+
+if TYPE_CHECKING:
+    from supabase import Client
+
+# supabase 패키지(httpx/realtime 등 포함)는 클라이언트를 처음 만들 때 import
+create_client = lazy_import('supabase', 'create_client')
 
 # Load environment variables from the correct .env file
 import pathlib
@@ -353,8 +362,7 @@ class Database:
         try:
             # Check if admin or self-update
             if admin_user_id:
-                admin_result = self.supabase.table('users').select('role').eq('user_id', admin_user_id).execute()
-                is_admin = admin_result.data and admin_result.data[0].get('role') == 'admin'
+                is_admin = self.get_user_role(admin_user_id) == 'admin'
 
                 if not is_admin and admin_user_id != user_id:
                     return {"success": False, "error": "Permission denied"}
@@ -374,8 +382,7 @@ class Database:
 
             # Only admin can change role and is_active
             if admin_user_id:
-                admin_result = self.supabase.table('users').select('role').eq('user_id', admin_user_id).execute()
-                if admin_result.data and admin_result.data[0].get('role') == 'admin':
+                if self.get_user_role(admin_user_id) == 'admin':
                     if 'role' in user_data:
                         update_data['role'] = user_data['role']
                     if 'is_active' in user_data:
@@ -383,6 +390,10 @@ class Database:
 
             result = self.supabase.table('users').update(update_data).eq('user_id', user_id).execute()
 
+            # 비밀번호/역할/활성 상태 변경 시 기존 토큰 캐시 폐기
+            if any(field in update_data for field in ('password_hash', 'role', 'is_active')):
+                token_cache.revoke_subject(user_id)
+
             if result.data:
                 user = result.data[0].copy()
                 user.pop('password_hash', None)
@@ -400,8 +411,7 @@ class Database:
 
         try:
             # Check if admin
-            admin_result = self.supabase.table('users').select('role').eq('user_id', admin_user_id).execute()
-            if not admin_result.data or admin_result.data[0].get('role') != 'admin':
+            if self.get_user_role(admin_user_id) != 'admin':
                 return {"success": False, "error": "Admin access required"}
 
             # Don't allow deleting yourself
@@ -409,12 +419,24 @@ class Database:
                 return {"success": False, "error": "Cannot delete your own account"}
 
             result = self.supabase.table('users').delete().eq('user_id', user_id).execute()
+            token_cache.revoke_subject(user_id)
 
             return {"success": True, "message": "User deleted successfully"}
 
         except Exception as e:
             return {"success": False, "error": str(e)}
 
+    def get_user_role(self, user_id: str) -> Optional[str]:
+        """Get user role (memoized per request)"""
+        if not user_id or not self.is_connected():
+            return None
+
+        def load_role() -> Optional[str]:
+            result = self.supabase.table('users').select('role').eq('user_id', user_id).execute()
+            return result.data[0].get('role') if result.data else None
+
+        return memoize_per_request(f"user_role:{user_id}", load_role)
+
     def verify_user(self, user_id: str, password: str) -> Dict[str, Any]:
         """Verify user credentials"""
         if not self.is_connected():
@@ -513,8 +535,7 @@ class Database:
 
             # Check if user is admin
             if user_id:
-                user_result = self.supabase.table('users').select('role').eq('user_id', user_id).execute()
-                is_admin = user_result.data and user_result.data[0].get('role') == 'admin'
+                is_admin = self.get_user_role(user_id) == 'admin'
 
                 # If not admin, only show user's own projects
                 if not is_admin:
@@ -842,7 +863,8 @@ class Database:
             "email": user_data.get("email"),
             "role": user_data.get("role", "user"),
             "exp": datetime.utcnow() + timedelta(hours=self.jwt_expire_hours),
-            "iat": datetime.utcnow()
+            "iat": datetime.utcnow(),
+            TOKEN_VERSION_CLAIM: token_cache.token_version(user_data.get("id"))
         }
 
         return jwt.encode(payload, self.jwt_secret, algorithm=self.jwt_algorithm)
@@ -1035,7 +1057,8 @@ def get_database():
     """Get database instance with current environment variables"""
     return Database()
 
-db = get_database()
+# 네트워크 진단/클라이언트 생성은 첫 사용 시점에 수행 (모듈 import 시 지연 없음)
+db = LazyObject(get_database, 'database.db')
 
 
 # PostgreSQL 직접 연결 함수 (psycopg2 사용)
@@ -6,10 +6,34 @@
 """
 
 import json
-from typing import Dict, List, Tuple, Optional
+import time
+import threading
+from collections import OrderedDict
+from typing import Dict, Iterable, List, Tuple, Optional
 from dataclasses import dataclass
 from intelligent_requirement_analyzer import RequirementAnalysis, ComplexityLevel
 
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
+
+# 부분 문자열 검색용 n-gram 길이 (이보다 짧은 키워드는 전체 스캔)
+NGRAM_SIZE = 3
+
+# 키워드별 점수 벡터 캐시 크기
+KEYWORD_CACHE_SIZE = 2048
+
+# 역할/목표/배경 매칭 가중치, 역량 매칭 가중치
+TEXT_MATCH_WEIGHT = 1.0
+CAPABILITY_MATCH_WEIGHT = 0.5
+
+# 팀 조합 빔 탐색 폭 / 시간 예산 (초) - 예산 초과 시 남은 단계는 빔 폭 1(탐욕)로 완성
+TEAM_SEARCH_BEAM_WIDTH = 24
+TEAM_SEARCH_TIME_BUDGET = 0.005
+
 @dataclass
 class AgentProfile:
     """에이전트 프로필"""
@@ -31,12 +55,127 @@ class AgentSelection:
     confidence_score: float
     estimated_performance: float
 
+class AgentKeywordIndex:
+    """
+    에이전트 키워드 역색인
+
+    역할/목표/배경 텍스트와 각 역량을 문서로 보고 n-gram -> 문서 역색인을 구축.
+    키워드는 n-gram 교집합으로 후보 문서를 좁힌 뒤 부분 문자열을 확인하므로 기존 `in` 매칭과 결과가 같음.
+    키워드별 에이전트 점수 벡터는 캐시하여 요청 간 재사용 (여러 요청 스레드가 공유하므로 캐시 접근은 잠금)
+    """
+
+    def __init__(self, agents: List[AgentProfile]):
+        self.agents = list(agents)
+        self.positions = {agent.name: index for index, agent in enumerate(self.agents)}
+
+        # 문서 = (소유 에이전트 위치, 가중치, 소문자 텍스트)
+        self.documents: List[Tuple[int, float, str]] = []
+        for index, agent in enumerate(self.agents):
+            agent_text = (agent.role + " " + agent.goal + " " + agent.backstory).lower()
+            self.documents.append((index, TEXT_MATCH_WEIGHT, agent_text))
+            for capability in agent.capabilities:
+                self.documents.append((index, CAPABILITY_MATCH_WEIGHT, capability.lower()))
+
+        self.ngram_index: Dict[str, set] = {}
+        for doc_id, (_, _, text) in enumerate(self.documents):
+            for gram in _ngrams(text):
+                self.ngram_index.setdefault(gram, set()).add(doc_id)
+
+        # 우선순위 보정 (우선순위 높을수록 점수 추가)
+        self.priority_bonus = _vector([(5 - agent.priority) * 0.2 for agent in self.agents])
+
+        # 도메인 비트셋
+        self.domain_bits: Dict[str, int] = {}
+        self.domain_masks = [self._domain_mask(agent.domains, register=True) for agent in self.agents]
+        self.general_bit = self.domain_bits.get('general', 0)
+
+        self._keyword_vectors: "OrderedDict[str, object]" = OrderedDict()
+        self._cache_lock = threading.Lock()
+
+    def _domain_mask(self, domains: Iterable[str], register: bool = False) -> int:
+        mask = 0
+        for domain in domains:
+            bit = self.domain_bits.get(domain)
+            if bit is None:
+                if not register:
+                    continue
+                bit = 1 << len(self.domain_bits)
+                self.domain_bits[domain] = bit
+            mask |= bit
+        return mask
+
+    def filter_by_domains(self, domains: Iterable[str]) -> List[AgentProfile]:
+        """도메인 비트셋 교집합으로 필터링 (범용 에이전트는 항상 포함)"""
+        query_mask = self._domain_mask(domains) | self.general_bit
+        return [agent for agent, mask in zip(self.agents, self.domain_masks) if mask & query_mask]
+
+    def keyword_vector(self, keyword: str):
+        """키워드 하나에 대한 에이전트별 점수 벡터 (캐시)"""
+        keyword = keyword.lower()
+        with self._cache_lock:
+            vector = self._keyword_vectors.get(keyword)
+            if vector is not None:
+                self._keyword_vectors.move_to_end(keyword)
+                return vector
+
+        scores = [0.0] * len(self.agents)
+        for doc_id in self._candidate_documents(keyword):
+            owner, weight, text = self.documents[doc_id]
+            if keyword in text:
+                scores[owner] += weight
+
+        vector = _vector(scores)
+        with self._cache_lock:
+            self._keyword_vectors[keyword] = vector
+            self._keyword_vectors.move_to_end(keyword)
+            while len(self._keyword_vectors) > KEYWORD_CACHE_SIZE:
+                self._keyword_vectors.popitem(last=False)
+        return vector
+
+    def _candidate_documents(self, keyword: str) -> Iterable[int]:
+        grams = _ngrams(keyword)
+        if len(keyword) < NGRAM_SIZE or not grams:
+            return range(len(self.documents))
+
+        postings = []
+        for gram in grams:
+            posting = self.ngram_index.get(gram)
+            if not posting:
+                return ()
+            postings.append(posting)
+        postings.sort(key=len)
+        return set.intersection(*postings)
+
+    def score(self, keywords: List[str]):
+        """전체 에이전트 점수 벡터 = 키워드 벡터 합 + 우선순위 보정"""
+        vectors = [self.keyword_vector(keyword) for keyword in keywords]
+        if NUMPY_AVAILABLE:
+            total = np.sum(vectors, axis=0) if vectors else np.zeros(len(self.agents))
+            return total + self.priority_bonus
+
+        total = [0.0] * len(self.agents)
+        for vector in vectors:
+            total = [a + b for a, b in zip(total, vector)]
+        return [a + b for a, b in zip(total, self.priority_bonus)]
+
+
+def _ngrams(text: str) -> set:
+    return {text[i:i + NGRAM_SIZE] for i in range(len(text) - NGRAM_SIZE + 1)}
+
+
+def _vector(values: List[float]):
+    return np.asarray(values, dtype=float) if NUMPY_AVAILABLE else list(values)
+
+
 class DynamicAgentMatcher:
     """동적 에이전트 매칭 시스템"""
 
     def __init__(self):
         self.agent_pool = self._initialize_agent_pool()
+        self.keyword_index = AgentKeywordIndex(list(self.agent_pool.values()))
         self.synergy_matrix = self._build_synergy_matrix()
+        # (에이전트, 에이전트) -> 상호 시너지 횟수
+        self._pair_synergy: Dict[Tuple[str, str], int] = {}
 
     def _initialize_agent_pool(self) -> Dict[str, AgentProfile]:
         """에이전트 풀 초기화"""
@@ -320,18 +459,30 @@ class DynamicAgentMatcher:
         """최적 에이전트 조합 선택"""
 
         # 1. 도메인 기반 1차 필터링
-        candidate_agents = self._filter_by_domain(analysis.domain, analysis.sub_domains)
+        domain_agents = self._filter_by_domain(analysis.domain, analysis.sub_domains)
 
         # 2. 복잡도 기반 필터링
-        candidate_agents = self._filter_by_complexity(candidate_agents, analysis.complexity)
+        candidate_agents = self._filter_by_complexity(domain_agents, analysis.complexity)
 
         # 3. 키워드 매칭 점수 계산
         scored_agents = self._score_agents_by_keywords(candidate_agents, analysis.keywords)
 
-        # 4. 시너지 효과 고려한 조합 생성
+        # 4. 시너지 효과 고려한 조합 생성 + 빔 탐색 조합
         optimal_combinations = self._generate_optimal_combinations(
             scored_agents, analysis.agent_count, analysis.domain
         )
+        # 복잡도 필터 결과가 목표 인원보다 적어도 탐색할 수 있도록 도메인 후보를 뒤에 이어 붙임
+        candidate_names = {agent.name for agent in candidate_agents}
+        remaining_agents = [agent for agent in domain_agents if agent.name not in candidate_names]
+        search_pool = scored_agents + self._score_agents_by_keywords(remaining_agents, analysis.keywords)
+        searched_team = self._search_best_team(search_pool, analysis)
+        # 조합 평가는 범용 에이전트에 유리하므로 키워드 관련도가 점수 상위 팀 이상일 때만 후보로 추가
+        if searched_team:
+            keyword_scores = {agent.name: score for agent, score in search_pool}
+            greedy_relevance = sum(score for _, score in scored_agents[:analysis.agent_count])
+            searched_relevance = sum(keyword_scores[agent.name] for agent in searched_team)
+            if searched_relevance >= greedy_relevance - 1e-9:
+                optimal_combinations.append(searched_team)
 
         # 5. 최고 조합 선택
         best_combination = self._select_best_combination(optimal_combinations, analysis)
@@ -347,27 +498,8 @@ class DynamicAgentMatcher:
         )
 
     def _filter_by_domain(self, primary_domain: str, sub_domains: List[str]) -> List[AgentProfile]:
-        """도메인 기반 에이전트 필터링"""
-        candidates = []
-        all_domains = [primary_domain] + sub_domains
-
-        for agent in self.agent_pool.values():
-            # 일반 에이전트는 항상 포함
-            if 'general' in agent.domains:
-                candidates.append(agent)
-                continue
-
-            # 도메인 매칭 점수 계산
-            domain_match_score = 0
-            for domain in all_domains:
-                if domain in agent.domains:
-                    domain_match_score += 1
-
-            # 매칭 점수가 있으면 후보에 포함
-            if domain_match_score > 0:
-                candidates.append(agent)
-
-        return candidates
+        """도메인 기반 에이전트 필터링 (일반 에이전트는 항상 포함)"""
+        return self.keyword_index.filter_by_domains([primary_domain] + sub_domains)
 
     def _filter_by_complexity(self, candidates: List[AgentProfile], complexity: ComplexityLevel) -> List[AgentProfile]:
         """복잡도 기반 필터링"""
@@ -380,29 +512,11 @@ class DynamicAgentMatcher:
         return filtered if filtered else candidates  # 빈 경우 원본 반환
 
     def _score_agents_by_keywords(self, candidates: List[AgentProfile], keywords: List[str]) -> List[Tuple[AgentProfile, float]]:
-        """키워드 매칭 점수 계산"""
-        scored_agents = []
-
-        for agent in candidates:
-            score = 0.0
-
-            # 역할/목표/배경에서 키워드 매칭
-            agent_text = (agent.role + " " + agent.goal + " " + agent.backstory).lower()
-
-            for keyword in keywords:
-                if keyword.lower() in agent_text:
-                    score += 1.0
-
-            # 역량 매칭
-            for capability in agent.capabilities:
-                for keyword in keywords:
-                    if keyword.lower() in capability.lower():
-                        score += 0.5
+        """키워드 매칭 점수 계산 (역색인 점수 벡터에서 후보 위치만 추출)"""
+        scores = self.keyword_index.score(keywords)
+        positions = self.keyword_index.positions
 
-            # 우선순위 보정 (우선순위 높을수록 점수 추가)
-            score += (5 - agent.priority) * 0.2
-
-            scored_agents.append((agent, score))
+        scored_agents = [(agent, float(scores[positions[agent.name]])) for agent in candidates]
 
         # 점수 순 정렬
         scored_agents.sort(key=lambda x: x[1], reverse=True)
@@ -440,6 +554,97 @@ class DynamicAgentMatcher:
 
         return combinations[:5]  # 최대 5개 조합
 
+    def _search_best_team(self, scored_agents: List[Tuple[AgentProfile, float]],
+                          analysis: RequirementAnalysis) -> Optional[List[AgentProfile]]:
+        """
+        후보 부분집합 빔 탐색 - _evaluate_combination과 같은 점수를 상태 증분으로 계산
+
+        도메인/역량은 비트셋으로 누적하고 시너지는 메모이즈된 쌍별 값을 더하므로
+        후보 하나 추가 비용이 조합 크기와 무관. 조합 점수만으로는 범용 에이전트 팀이 이기므로
+        키워드 관련도(상위 점수 팀 대비 비율)를 목표 함수에 더함
+        """
+        target_count = analysis.agent_count
+        candidates = [agent for agent, _ in scored_agents]
+        if target_count <= 0 or len(candidates) < target_count:
+            return None
+
+        keyword_scores = [score for _, score in scored_agents]
+        top_relevance = sum(sorted(keyword_scores, reverse=True)[:target_count])
+        relevance_scale = 1.0 / top_relevance if top_relevance > 0 else 0.0
+        all_domains = set([analysis.domain] + analysis.sub_domains)
+        domain_count = max(len(all_domains), 1)
+
+        # 후보별 비트셋 사전 계산
+        domain_bits = {domain: 1 << i for i, domain in enumerate(sorted(all_domains | {'general'}))}
+        general_bit = domain_bits['general']
+        all_domains_mask = sum(domain_bits[domain] for domain in all_domains)
+        capability_bits: Dict[str, int] = {}
+        domain_masks, capability_masks, fits = [], [], []
+        for agent in candidates:
+            domain_masks.append(sum(domain_bits[d] for d in set(agent.domains) if d in domain_bits))
+            mask = 0
+            for capability in agent.capabilities:
+                mask |= capability_bits.setdefault(capability, 1 << len(capability_bits))
+            capability_masks.append(mask)
+            fits.append(1 if analysis.complexity.value in agent.complexity_fit else 0)
+        self_synergy = [self._get_pair_synergy(agent, agent) // 2 for agent in candidates]
+
+        def evaluate(state) -> float:
+            members, domain_mask, capability_mask, synergy, fit_count, keyword_sum = state
+            size = len(members)
+            if domain_mask & general_bit:
+                domain_mask |= all_domains_mask
+            coverage = bin(domain_mask).count('1') / domain_count
+            diversity = min(bin(capability_mask).count('1') / 10.0, 1.0)
+            synergy_effect = min(synergy / (size * 3), 1.0)
+            combination_score = coverage * 0.4 + diversity * 0.3 + synergy_effect * 0.2 + (fit_count / size) * 0.1
+            return combination_score + keyword_sum * relevance_scale
+
+        # 상태 = (후보 위치 튜플, 도메인 비트셋, 역량 비트셋, 시너지 수, 복잡도 적합 수, 키워드 점수 합)
+        beam = [((), 0, 0, 0, 0, 0.0)]
+        beam_width = TEAM_SEARCH_BEAM_WIDTH
+        deadline = time.perf_counter() + TEAM_SEARCH_TIME_BUDGET
+
+        for _ in range(target_count):
+            expanded = []
+            for state_index, state in enumerate(beam):
+                # 시간 예산 초과 시 이미 확장한 상태만으로 진행 (최소 1개는 확장)
+                if state_index > 0 and time.perf_counter() > deadline:
+                    beam_width = 1
+                    break
+                members, domain_mask, capability_mask, synergy, fit_count, keyword_sum = state
+                start = members[-1] + 1 if members else 0
+                # 남은 자리를 채울 후보가 부족해지는 위치는 제외 (빔의 모든 상태가 완성 가능)
+                stop = len(candidates) - (target_count - len(members) - 1)
+                for index in range(start, stop):
+                    added_synergy = self_synergy[index] + sum(
+                        self._get_pair_synergy(candidates[member], candidates[index]) for member in members
+                    )
+                    new_state = (
+                        members + (index,),
+                        domain_mask | domain_masks[index],
+                        capability_mask | capability_masks[index],
+                        synergy + added_synergy,
+                        fit_count + fits[index],
+                        keyword_sum + keyword_scores[index]
+                    )
+                    expanded.append((evaluate(new_state), new_state[5], new_state))
+            if not expanded:
+                return None
+            expanded.sort(key=lambda item: (item[0], item[1]), reverse=True)
+            beam = [state for _, _, state in expanded[:beam_width]]
+
+        return [candidates[index] for index in beam[0][0]]
+
+    def _get_pair_synergy(self, agent_a: AgentProfile, agent_b: AgentProfile) -> int:
+        """두 에이전트가 서로를 시너지 대상으로 지정한 횟수 (메모이즈)"""
+        key = (agent_a.name, agent_b.name) if agent_a.name <= agent_b.name else (agent_b.name, agent_a.name)
+        value = self._pair_synergy.get(key)
+        if value is None:
+            value = int(agent_b.name in agent_a.synergy_agents) + int(agent_a.name in agent_b.synergy_agents)
+            self._pair_synergy[key] = value
+        return value
+
     def _get_domain_templates(self, domain: str) -> List[List[str]]:
         """도메인별 추천 템플릿"""
         templates = {
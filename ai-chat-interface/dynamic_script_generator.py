@@ -4,30 +4,243 @@ DB에서 Agent/Task를 읽어 Jinja2 템플릿으로 실행 스크립트를 생
 """
 import os
 import json
-from typing import Dict, List, Optional
-from jinja2 import Environment, FileSystemLoader
+import hashlib
+import tempfile
+import threading
+from typing import Any, Callable, Dict, List, Optional
+from jinja2 import Environment, FileSystemLoader, FileSystemBytecodeCache
 from database import get_supabase_client
 
+TEMPLATE_DIR = os.path.join(os.path.dirname(__file__), 'templates', 'scripts')
+MCP_REGISTRY_PATH = os.path.join(os.path.dirname(__file__), 'mcp_registry.json')
+
+# 일괄 조회 시 한 번의 in_() 쿼리에 넣을 최대 프로젝트 수 (URL 길이 제한)
+BULK_QUERY_CHUNK_SIZE = 200
+
+# 일괄 조회 페이지 크기 - PostgREST max-rows(기본 1000)를 넘으면 응답이 잘리므로 그 이하로 유지
+BULK_QUERY_PAGE_SIZE = 1000
+
+# 생성 파일 옆에 저장하는 입력 지문 파일 (변경 없으면 렌더링/쓰기 생략)
+FINGERPRINT_FILENAME = '.generation_fingerprint.json'
+# 생성 로직 자체가 바뀌면 올려서 기존 지문을 전부 무효화
+FINGERPRINT_VERSION = 1
+
+TASK_SELECT = '*, project_agents!project_tasks_agent_project_id_agent_framework_agent_order_fkey(role)'
+
+# CrewAI Task 스케줄링 방식 ('sequential': 저장 순서대로 순차 실행, 'dag': 의존성 기반 병렬 실행)
+SCHEDULE_MODES = ('sequential', 'dag')
+
+
+def build_task_schedule(tasks: List[Dict], mode: str = 'sequential') -> List[Dict]:
+    """
+    Task 실행 순서 구성
+
+    dag 모드에서는 depends_on_task_order로 의존성 그래프를 만들어 단계(level)별로 묶음.
+    같은 단계의 Task들은 서로 독립이므로 마지막 하나를 제외하고 async_execution으로 동시에 실행하며,
+    마지막 Task(동기)가 앞선 비동기 Task 완료를 기다리는 단계 경계 역할을 함.
+    의존 Task의 결과는 context로 명시 전달
+
+    Returns:
+        List[Dict]: 실행 순서대로 정렬된 Task (각 항목에 level, async_execution, context_task_order 추가)
+
+    Raises:
+        ValueError: 알 수 없는 모드 또는 순환 의존성
+    """
+    if mode not in SCHEDULE_MODES:
+        raise ValueError(f"Unsupported schedule mode: {mode}")
+
+    if mode == 'sequential':
+        return [
+            {**task, 'level': index, 'async_execution': False, 'context_task_order': None}
+            for index, task in enumerate(tasks)
+        ]
+
+    by_order = {task['task_order']: task for task in tasks}
+
+    parents = {}
+    for task in tasks:
+        dependency = task.get('depends_on_task_order')
+        if dependency is not None and dependency not in by_order:
+            print(f"[WARNING] Task {task['task_order']} depends on missing task {dependency} - ignored")
+            dependency = None
+        parents[task['task_order']] = dependency
+
+    # 단계 계산 (부모가 하나인 그래프이므로 부모 체인을 따라가며 순환 검사)
+    levels: Dict[int, int] = {}
+    for order in by_order:
+        path = []
+        current = order
+        while current is not None and current not in levels:
+            if current in path:
+                cycle = path[path.index(current):] + [current]
+                raise ValueError(f"Circular task dependency: {' -> '.join(map(str, cycle))}")
+            path.append(current)
+            current = parents[current]
+
+        level = levels[current] if current is not None else -1
+        for node in reversed(path):
+            level += 1
+            levels[node] = level
+
+    layers: Dict[int, List[Dict]] = {}
+    for task in sorted(tasks, key=lambda t: (levels[t['task_order']], t['task_order'])):
+        layers.setdefault(levels[task['task_order']], []).append(task)
+
+    schedule = []
+    for level in sorted(layers):
+        layer = layers[level]
+        for index, task in enumerate(layer):
+            schedule.append({
+                **task,
+                'level': level,
+                'async_execution': index < len(layer) - 1,
+                'context_task_order': parents[task['task_order']]
+            })
+    return schedule
+
+
+def _hash_content(value) -> str:
+    """JSON 직렬화 가능한 값의 내용 해시"""
+    body = json.dumps(value, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(body.encode('utf-8')).hexdigest()
+
+
+def _resolve_schedule_mode(schedule_mode: Optional[str]) -> str:
+    return schedule_mode or os.getenv('CREWAI_SCHEDULE_MODE', 'sequential')
+
+
+def _collect_selected_tools(agents: List[Dict]) -> List[str]:
+    """Agent들에서 선택된 도구 수집 (중복 제거)"""
+    selected_tools = set()
+    for agent in agents:
+        agent_tools = agent.get('tools', [])
+        if agent_tools:
+            selected_tools.update(agent_tools)
+    return sorted(selected_tools)
+
+
+def _write_if_changed(path: str, content: str) -> bool:
+    """내용이 다를 때만 파일 쓰기 (mtime 유지) - 썼으면 True"""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            if f.read() == content:
+                return False
+    except (OSError, UnicodeDecodeError):
+        pass
+
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(content)
+    return True
+
+
+def _fetch_all_pages(build_query: Callable[[], Any]) -> List[Dict]:
+    """
+    .range()로 페이지를 나눠 전체 행 조회 (한 페이지보다 적게 오면 종료)
+
+    build_query는 정렬까지 지정된 새 쿼리를 매번 만들어야 함 (페이지 간 순서 고정)
+    """
+    rows: List[Dict] = []
+    start = 0
+    while True:
+        page = build_query().range(start, start + BULK_QUERY_PAGE_SIZE - 1).execute().data or []
+        rows.extend(page)
+        if len(page) < BULK_QUERY_PAGE_SIZE:
+            return rows
+        start += BULK_QUERY_PAGE_SIZE
+
+
+def _normalize_project(project: Dict) -> Dict:
+    """projects 행을 템플릿용 딕셔너리로 변환 ('name' -> 'project_name' 호환성 매핑)"""
+    return {
+        'project_id': project.get('project_id'),
+        'project_name': project.get('name'),
+        'framework': project.get('framework'),
+        'final_requirement': project.get('final_requirement'),
+        'status': project.get('status')
+    }
+
+
+def _normalize_task(task: Dict) -> Dict:
+    """project_tasks 행을 템플릿용 딕셔너리로 변환 (Agent role 추가)"""
+    agent_role = None
+    if task.get('project_agents'):
+        agent_role = task['project_agents'].get('role')
+
+    return {
+        'project_id': task.get('project_id'),
+        'framework': task.get('framework'),
+        'task_order': task.get('task_order'),
+        'task_type': task.get('task_type'),
+        'description': task.get('description'),
+        'expected_output': task.get('expected_output'),
+        'agent_order': task.get('agent_order'),
+        'depends_on_task_order': task.get('depends_on_task_order'),
+        'agent_role': agent_role
+    }
+
+
 class DynamicScriptGenerator:
     """DB 기반 동적 스크립트 생성기"""
 
-    def __init__(self):
-        # Jinja2 환경 설정
-        template_dir = os.path.join(os.path.dirname(__file__), 'templates', 'scripts')
+    def __init__(self, auto_reload: Optional[bool] = None, bytecode_cache_dir: Optional[str] = None):
+        """
+        Args:
+            auto_reload: 템플릿 파일 변경 감지 여부 (미지정 시 SCRIPT_TEMPLATE_AUTO_RELOAD, 기본 True)
+            bytecode_cache_dir: 컴파일된 템플릿 저장 경로 (미지정 시 SCRIPT_TEMPLATE_CACHE_DIR, 기본 임시 디렉토리)
+        """
+        if auto_reload is None:
+            auto_reload = os.getenv('SCRIPT_TEMPLATE_AUTO_RELOAD', 'true').lower() in ('1', 'true', 'yes')
+        bytecode_cache_dir = bytecode_cache_dir or os.getenv(
+            'SCRIPT_TEMPLATE_CACHE_DIR',
+            os.path.join(tempfile.gettempdir(), 'ai-chat-interface-jinja')
+        )
+
+        # Jinja2 환경 설정 (컴파일 결과는 프로세스 재시작 후에도 바이트코드 캐시에서 재사용)
+        bytecode_cache = None
+        try:
+            os.makedirs(bytecode_cache_dir, exist_ok=True)
+            bytecode_cache = FileSystemBytecodeCache(bytecode_cache_dir)
+        except OSError as e:
+            print(f"[WARNING] Template bytecode cache disabled: {e}")
+
         self.env = Environment(
-            loader=FileSystemLoader(template_dir),
+            loader=FileSystemLoader(TEMPLATE_DIR),
             trim_blocks=True,
-            lstrip_blocks=True
+            lstrip_blocks=True,
+            auto_reload=auto_reload,
+            bytecode_cache=bytecode_cache,
+            cache_size=50
         )
 
-        # MCP 레지스트리 로드
-        self.mcp_registry = self.load_mcp_registry()
+        # MCP 레지스트리 (파일 mtime이 바뀔 때만 다시 로드)
+        self._registry_lock = threading.Lock()
+        self._registry_mtime: Optional[float] = None
+        self._mcp_registry: Dict = {}
+        self._registry_hash = ''
+
+        # 템플릿 파일명 -> (mtime, 내용 해시)
+        self._template_hashes: Dict[str, tuple] = {}
+
+    @property
+    def mcp_registry(self) -> Dict:
+        """MCP 레지스트리 (mcp_registry.json 변경 시 자동 갱신)"""
+        try:
+            mtime = os.path.getmtime(MCP_REGISTRY_PATH)
+        except OSError:
+            mtime = None
+
+        if mtime != self._registry_mtime:
+            with self._registry_lock:
+                if mtime != self._registry_mtime:
+                    self._mcp_registry = self.load_mcp_registry()
+                    self._registry_hash = _hash_content(self._mcp_registry)
+                    self._registry_mtime = mtime
+        return self._mcp_registry
 
     def load_mcp_registry(self) -> Dict:
         """MCP 레지스트리 파일 로드"""
-        registry_path = os.path.join(os.path.dirname(__file__), 'mcp_registry.json')
         try:
-            with open(registry_path, 'r', encoding='utf-8') as f:
+            with open(MCP_REGISTRY_PATH, 'r', encoding='utf-8') as f:
                 return json.load(f)
         except Exception as e:
             print(f"[WARNING] Failed to load MCP registry: {e}")
@@ -52,34 +265,14 @@ class DynamicScriptGenerator:
         supabase = get_supabase_client()
 
         result = supabase.table('project_tasks')\
-            .select('*, project_agents!project_tasks_agent_project_id_agent_framework_agent_order_fkey(role)')\
+            .select(TASK_SELECT)\
             .eq('project_id', project_id)\
             .eq('framework', framework)\
             .eq('is_active', True)\
             .order('task_order')\
             .execute()
 
-        # Agent role 추가
-        tasks = []
-        for task in result.data:
-            agent_role = None
-            if task.get('project_agents'):
-                agent_role = task['project_agents'].get('role')
-
-            task_data = {
-                'project_id': task.get('project_id'),
-                'framework': task.get('framework'),
-                'task_order': task.get('task_order'),
-                'task_type': task.get('task_type'),
-                'description': task.get('description'),
-                'expected_output': task.get('expected_output'),
-                'agent_order': task.get('agent_order'),
-                'depends_on_task_order': task.get('depends_on_task_order'),
-                'agent_role': agent_role
-            }
-            tasks.append(task_data)
-
-        return tasks
+        return [_normalize_task(task) for task in result.data]
 
     def get_project_info(self, project_id: str) -> Optional[Dict]:
         """프로젝트 기본 정보 조회 (Supabase)"""
@@ -94,18 +287,69 @@ class DynamicScriptGenerator:
         if not result.data:
             return None
 
-        project = result.data[0]
-        # 'name' 필드를 'project_name'으로 매핑 (호환성)
-        return {
-            'project_id': project.get('project_id'),
-            'project_name': project.get('name'),
-            'framework': project.get('framework'),
-            'final_requirement': project.get('final_requirement'),
-            'status': project.get('status')
-        }
+        return _normalize_project(result.data[0])
 
-    def generate_crewai_script(self, project_id: str) -> str:
-        """CrewAI 실행 스크립트 생성"""
+    def fetch_projects_bulk(self, project_ids: List[str]) -> Dict[str, Dict]:
+        """
+        여러 프로젝트의 정보/Agent/Task를 일괄 조회 (청크마다 projects 1회, project_agents/project_tasks는 페이지 수만큼)
+
+        Returns:
+            Dict[str, Dict]: project_id -> {'project', 'agents', 'tasks'} (없는 프로젝트는 제외)
+        """
+        supabase = get_supabase_client()
+        bundles: Dict[str, Dict] = {}
+        agent_rows: List[Dict] = []
+        task_rows: List[Dict] = []
+
+        for start in range(0, len(project_ids), BULK_QUERY_CHUNK_SIZE):
+            chunk = project_ids[start:start + BULK_QUERY_CHUNK_SIZE]
+
+            projects = supabase.table('projects')\
+                .select('project_id, name, framework, final_requirement, status')\
+                .in_('project_id', chunk)\
+                .execute()
+            for row in projects.data:
+                bundles[row['project_id']] = {'project': _normalize_project(row), 'agents': [], 'tasks': []}
+
+            # 프로젝트 200개의 Agent/Task는 max-rows를 넘을 수 있으므로 페이지 단위로 조회
+            agent_rows.extend(_fetch_all_pages(
+                lambda: supabase.table('project_agents')
+                .select('*')
+                .in_('project_id', chunk)
+                .eq('is_active', True)
+                .order('project_id')
+                .order('agent_order')
+            ))
+
+            task_rows.extend(_fetch_all_pages(
+                lambda: supabase.table('project_tasks')
+                .select(TASK_SELECT)
+                .in_('project_id', chunk)
+                .eq('is_active', True)
+                .order('project_id')
+                .order('task_order')
+            ))
+
+        # 프로젝트의 프레임워크에 해당하는 Agent/Task만 분배 (정렬 순서 유지)
+        for agent in agent_rows:
+            bundle = bundles.get(agent.get('project_id'))
+            if bundle and agent.get('framework') == bundle['project']['framework']:
+                bundle['agents'].append(agent)
+
+        for task in task_rows:
+            bundle = bundles.get(task.get('project_id'))
+            if bundle and task.get('framework') == bundle['project']['framework']:
+                bundle['tasks'].append(_normalize_task(task))
+
+        return bundles
+
+    def generate_crewai_script(self, project_id: str, schedule_mode: Optional[str] = None) -> str:
+        """
+        CrewAI 실행 스크립트 생성
+
+        Args:
+            schedule_mode: 'sequential' 또는 'dag' (미지정 시 CREWAI_SCHEDULE_MODE 환경변수, 기본 sequential)
+        """
         # 프로젝트 정보 조회
         project = self.get_project_info(project_id)
         if not project:
@@ -118,21 +362,27 @@ class DynamicScriptGenerator:
         agents = self.get_project_agents(project_id, 'crewai')
         tasks = self.get_project_tasks(project_id, 'crewai')
 
+        return self.render_crewai_script(project, agents, tasks, schedule_mode)
+
+    def render_crewai_script(self, project: Dict, agents: List[Dict], tasks: List[Dict],
+                             schedule_mode: Optional[str] = None) -> str:
+        """조회된 프로젝트 데이터로 CrewAI 스크립트 렌더링"""
         # Agent들에서 선택된 도구 수집 (중복 제거)
-        selected_tools = set()
-        for agent in agents:
-            agent_tools = agent.get('tools', [])
-            if agent_tools:
-                selected_tools.update(agent_tools)
+        selected_tools = _collect_selected_tools(agents)
+
+        # Task 실행 순서 (dag 모드는 의존성 단계별 병렬 실행)
+        schedule_mode = _resolve_schedule_mode(schedule_mode)
+        scheduled_tasks = build_task_schedule(tasks, schedule_mode)
 
         # Jinja2 템플릿 렌더링
         template = self.env.get_template('crewai_dynamic.py.j2')
         script = template.render(
             project=project,
             agents=agents,
-            tasks=tasks,
+            tasks=scheduled_tasks,
+            schedule_mode=schedule_mode,
             mcp_registry=self.mcp_registry,
-            selected_tools=list(selected_tools)
+            selected_tools=selected_tools
         )
 
         return script
@@ -151,6 +401,10 @@ class DynamicScriptGenerator:
         agents = self.get_project_agents(project_id, 'metagpt')
         tasks = self.get_project_tasks(project_id, 'metagpt')
 
+        return self.render_metagpt_script(project, agents, tasks)
+
+    def render_metagpt_script(self, project: Dict, agents: List[Dict], tasks: List[Dict]) -> str:
+        """조회된 프로젝트 데이터로 MetaGPT 스크립트 렌더링"""
         # Jinja2 템플릿 렌더링
         template = self.env.get_template('metagpt_dynamic.py.j2')
         script = template.render(
@@ -201,26 +455,23 @@ class DynamicScriptGenerator:
     def save_all_project_files(self, project_id: str, script_content: str,
                                readme_content: str, requirements_content: str,
                                framework: str) -> Dict[str, str]:
-        """스크립트, README, requirements 모두 저장"""
+        """스크립트, README, requirements 모두 저장 (내용이 같은 파일은 다시 쓰지 않음)"""
         # 프로젝트 디렉토리 생성
-        project_dir = os.path.join(os.path.dirname(__file__), '..', 'Projects', project_id)
+        project_dir = self.get_project_dir(project_id)
         os.makedirs(project_dir, exist_ok=True)
 
         # 1. 스크립트 저장
         script_filename = f"{framework}_script.py"
         script_path = os.path.join(project_dir, script_filename)
-        with open(script_path, 'w', encoding='utf-8') as f:
-            f.write(script_content)
+        _write_if_changed(script_path, script_content)
 
         # 2. README 저장
         readme_path = os.path.join(project_dir, 'README.md')
-        with open(readme_path, 'w', encoding='utf-8') as f:
-            f.write(readme_content)
+        _write_if_changed(readme_path, readme_content)
 
         # 3. requirements.txt 저장
         requirements_path = os.path.join(project_dir, 'requirements.txt')
-        with open(requirements_path, 'w', encoding='utf-8') as f:
-            f.write(requirements_content)
+        _write_if_changed(requirements_path, requirements_content)
 
         return {
             'script_path': script_path,
@@ -228,6 +479,70 @@ class DynamicScriptGenerator:
             'requirements_path': requirements_path
         }
 
+    @staticmethod
+    def get_project_dir(project_id: str) -> str:
+        return os.path.join(os.path.dirname(__file__), '..', 'Projects', project_id)
+
+    # ==================== 증분 재생성 ====================
+
+    def build_fingerprint(self, project: Dict, agents: List[Dict], tasks: List[Dict],
+                          schedule_mode: Optional[str] = None) -> Dict[str, str]:
+        """
+        생성 결과에 영향을 주는 입력의 섹션별 해시
+
+        섹션: generator, project, agents, tasks, tools, schedule, template, registry
+        """
+        framework = project['framework']
+        script_template = 'crewai_dynamic.py.j2' if framework == 'crewai' else 'metagpt_dynamic.py.j2'
+        registry = self.mcp_registry
+        selected_tools = _collect_selected_tools(agents)
+
+        return {
+            'generator': str(FINGERPRINT_VERSION),
+            'project': _hash_content(project),
+            'agents': _hash_content(agents),
+            'tasks': _hash_content(tasks),
+            'tools': _hash_content({tool: registry.get(tool) for tool in selected_tools}),
+            'schedule': _resolve_schedule_mode(schedule_mode) if framework == 'crewai' else '',
+            'template': self._template_version([script_template, 'README.md.j2']),
+            'registry': self._registry_hash
+        }
+
+    def _template_version(self, template_names: List[str]) -> str:
+        """템플릿 파일 내용 해시 (mtime이 같으면 이전 해시 재사용)"""
+        hashes = []
+        for name in template_names:
+            path = os.path.join(TEMPLATE_DIR, name)
+            try:
+                mtime = os.path.getmtime(path)
+            except OSError:
+                hashes.append('')
+                continue
+
+            cached = self._template_hashes.get(name)
+            if cached is None or cached[0] != mtime:
+                with open(path, 'rb') as f:
+                    cached = (mtime, hashlib.sha256(f.read()).hexdigest())
+                self._template_hashes[name] = cached
+            hashes.append(cached[1])
+        return _hash_content(hashes)
+
+    @staticmethod
+    def load_fingerprint(project_dir: str) -> Optional[Dict]:
+        try:
+            with open(os.path.join(project_dir, FINGERPRINT_FILENAME), 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    @staticmethod
+    def save_fingerprint(project_dir: str, fingerprint: Dict[str, str], paths: Dict[str, str]) -> None:
+        record = {'sections': fingerprint, 'files': {key: os.path.basename(path) for key, path in paths.items()}}
+        _write_if_changed(
+            os.path.join(project_dir, FINGERPRINT_FILENAME),
+            json.dumps(record, indent=2, sort_keys=True)
+        )
+
     def save_script_to_file(self, project_id: str, script_content: str, framework: str) -> str:
         """생성된 스크립트를 파일로 저장 (레거시 호환성)"""
         # 프로젝트 디렉토리 생성
@@ -243,8 +558,14 @@ class DynamicScriptGenerator:
 
         return script_path
 
-    def generate_and_save(self, project_id: str) -> Dict[str, str]:
-        """스크립트 + README + requirements 생성 및 저장 (통합 메서드)"""
+    def generate_and_save(self, project_id: str, schedule_mode: Optional[str] = None,
+                          force: bool = False) -> Dict[str, str]:
+        """
+        스크립트 + README + requirements 생성 및 저장 (통합 메서드)
+
+        입력 지문이 이전 생성 때와 같고 파일이 모두 남아 있으면 렌더링과 쓰기를 생략 (force=True면 항상 생성).
+        결과의 changed_sections에 이전 대비 바뀐 섹션 목록을 담음
+        """
         # 1. 프로젝트 정보 조회
         project = self.get_project_info(project_id)
         if not project:
@@ -252,15 +573,77 @@ class DynamicScriptGenerator:
 
         framework = project['framework']
 
-        # 2. Agent 및 Task 조회 (README 생성용)
+        # 2. Agent 및 Task 조회 (스크립트/README 생성에 공통 사용)
         agents = self.get_project_agents(project_id, framework)
         tasks = self.get_project_tasks(project_id, framework)
 
+        return self._render_and_save(project, agents, tasks, schedule_mode, force)
+
+    def generate_and_save_many(self, project_ids: List[str], schedule_mode: Optional[str] = None,
+                               force: bool = False) -> Dict[str, List[Dict]]:
+        """
+        여러 프로젝트 스크립트 일괄 생성 (템플릿 변경 후 전체 재생성 등)
+
+        DB 조회는 fetch_projects_bulk로 한 번에 수행하며, 개별 프로젝트 실패는 errors에 기록하고 계속 진행
+
+        Returns:
+            Dict: {'results': generate_and_save 결과 목록, 'errors': [{'project_id', 'error'}]}
+        """
+        project_ids = list(dict.fromkeys(project_ids))
+        bundles = self.fetch_projects_bulk(project_ids)
+
+        results = []
+        errors = []
+        for project_id in project_ids:
+            bundle = bundles.get(project_id)
+            if bundle is None:
+                errors.append({'project_id': project_id, 'error': f"Project {project_id} not found"})
+                continue
+            try:
+                results.append(self._render_and_save(
+                    bundle['project'], bundle['agents'], bundle['tasks'], schedule_mode, force
+                ))
+            except Exception as e:
+                errors.append({'project_id': project_id, 'error': str(e)})
+
+        return {'results': results, 'errors': errors}
+
+    def _render_and_save(self, project: Dict, agents: List[Dict], tasks: List[Dict],
+                         schedule_mode: Optional[str], force: bool = False) -> Dict[str, str]:
+        project_id = project['project_id']
+        framework = project['framework']
+        project_dir = self.get_project_dir(project_id)
+
+        # 입력 지문 비교 - 변경이 없으면 기존 파일 그대로 사용
+        fingerprint = self.build_fingerprint(project, agents, tasks, schedule_mode)
+        previous = self.load_fingerprint(project_dir) or {}
+        previous_sections = previous.get('sections', {})
+        changed_sections = [
+            section for section, value in fingerprint.items()
+            if previous_sections.get(section) != value
+        ]
+
+        previous_paths = {
+            key: os.path.join(project_dir, filename)
+            for key, filename in previous.get('files', {}).items()
+        }
+        files_present = bool(previous_paths) and all(os.path.exists(path) for path in previous_paths.values())
+
+        if not force and not changed_sections and files_present:
+            return {
+                'project_id': project_id,
+                'framework': framework,
+                'status': 'success',
+                'changed': False,
+                'changed_sections': [],
+                **previous_paths
+            }
+
         # 3. 프레임워크별 스크립트 생성
         if framework == 'crewai':
-            script_content = self.generate_crewai_script(project_id)
+            script_content = self.render_crewai_script(project, agents, tasks, schedule_mode)
         elif framework == 'metagpt':
-            script_content = self.generate_metagpt_script(project_id)
+            script_content = self.render_metagpt_script(project, agents, tasks)
         else:
             raise ValueError(f"Unsupported framework: {framework}")
 
@@ -275,28 +658,61 @@ class DynamicScriptGenerator:
             project_id, script_content, readme_content,
             requirements_content, framework
         )
+        self.save_fingerprint(project_dir, fingerprint, paths)
 
         return {
             'project_id': project_id,
             'framework': framework,
             'status': 'success',
+            'changed': True,
+            'changed_sections': changed_sections,
             **paths  # script_path, readme_path, requirements_path 포함
         }
 
 
+# 프로세스 공용 생성기 (Jinja2 환경/컴파일된 템플릿/MCP 레지스트리 재사용)
+_generator: Optional[DynamicScriptGenerator] = None
+_generator_lock = threading.Lock()
+
+
+def get_script_generator() -> DynamicScriptGenerator:
+    """공용 생성기 인스턴스 반환"""
+    global _generator
+    if _generator is None:
+        with _generator_lock:
+            if _generator is None:
+                _generator = DynamicScriptGenerator()
+    return _generator
+
+
 # 편의 함수
-def generate_script(project_id: str) -> Dict[str, str]:
+def generate_script(project_id: str, schedule_mode: Optional[str] = None,
+                    force: bool = False) -> Dict[str, str]:
     """프로젝트 스크립트 생성 (단일 진입점)"""
-    generator = DynamicScriptGenerator()
-    return generator.generate_and_save(project_id)
+    return get_script_generator().generate_and_save(project_id, schedule_mode, force)
+
+
+def generate_scripts(project_ids: List[str], schedule_mode: Optional[str] = None,
+                     force: bool = False) -> Dict[str, List[Dict]]:
+    """여러 프로젝트 스크립트 일괄 생성"""
+    return get_script_generator().generate_and_save_many(project_ids, schedule_mode, force)
 
 
 if __name__ == '__main__':
     # 테스트 코드
     import sys
-    if len(sys.argv) > 1:
+    import time
+    if len(sys.argv) > 2:
+        started = time.perf_counter()
+        batch = generate_scripts(sys.argv[1:])
+        for result in batch['results']:
+            print(f"Script generated: {result['script_path']}")
+        for error in batch['errors']:
+            print(f"[ERROR] {error['project_id']}: {error['error']}")
+        print(f"{len(batch['results'])} scripts in {time.perf_counter() - started:.2f}s")
+    elif len(sys.argv) > 1:
         project_id = sys.argv[1]
         result = generate_script(project_id)
         print(f"Script generated: {result['script_path']}")
     else:
-        print("Usage: python dynamic_script_generator.py <project_id>")
+        print("Usage: python dynamic_script_generator.py <project_id> [<project_id> ...]")
@@ -18,6 +18,7 @@ from typing import Dict, Any, Optional, List, Tuple
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 from message_classifier import MessageClassifier, MessageType
 from project_state_manager import ProjectStateManager, ProjectStatus
+from resumable_index import get_resumable_index
 from project_template_system import ProjectTemplate, ProjectType, Framework
 
 class EnhancedProjectInitializer:
@@ -128,9 +129,10 @@ class EnhancedProjectInitializer:
             # 특정 프로젝트 재개
             project_path = os.path.join(self.base_projects_dir, specific_project)
             if os.path.exists(project_path):
-                manager = ProjectStateManager(project_path)
-                if manager.can_resume():
-                    resume_point = manager.get_resume_point()
+                # 상태 파일 1회 로드로 재개 가능 여부와 재개 지점 확인
+                status_data = ProjectStateManager(project_path, create=False).load_project_status()
+                if status_data and status_data.get('can_resume', False):
+                    resume_point = status_data.get('resume_point')
                     return {
                         'action': 'resume_specific_project',
                         'message': f"프로젝트 {specific_project}를 {resume_point} 단계부터 재개합니다.",
@@ -364,31 +366,11 @@ except Exception as e:
         return script_path
 
     def _find_resumable_projects(self) -> List[Dict[str, Any]]:
-        """재개 가능한 프로젝트 찾기"""
-        resumable_projects = []
-
+        """재개 가능한 프로젝트 찾기 (상태 저장 시 갱신되는 색인 조회 - 전체 디렉토리 스캔 없음)"""
         if not os.path.exists(self.base_projects_dir):
-            return resumable_projects
-
-        for project_name in os.listdir(self.base_projects_dir):
-            project_path = os.path.join(self.base_projects_dir, project_name)
-            if os.path.isdir(project_path):
-                try:
-                    manager = ProjectStateManager(project_path)
-                    if manager.can_resume():
-                        status_data = manager.load_project_status()
-                        resumable_projects.append({
-                            'id': project_name,
-                            'name': status_data.get('project_name', project_name),
-                            'resume_point': manager.get_resume_point(),
-                            'status': status_data.get('status'),
-                            'updated_at': status_data.get('updated_at')
-                        })
-                except Exception as e:
-                    print(f"프로젝트 {project_name} 상태 확인 오류: {e}")
-                    continue
-
-        return resumable_projects
+            return []
+
+        return get_resumable_index(self.base_projects_dir).list_resumable()
 
     def get_project_context(self, project_id: str) -> Optional[Dict[str, Any]]:
         """프로젝트 컨텍스트 조회"""
@@ -397,17 +379,18 @@ except Exception as e:
             return None
 
         try:
-            manager = ProjectStateManager(project_path)
+            manager = ProjectStateManager(project_path, create=False)
             status_data = manager.load_project_status()
             requirements_data = manager.load_original_requirements()
+            can_resume = bool(status_data and status_data.get('can_resume', False))
 
             return {
                 'project_id': project_id,
                 'project_path': project_path,
                 'status': status_data,
                 'requirements': requirements_data,
-                'can_resume': manager.can_resume(),
-                'resume_point': manager.get_resume_point()
+                'can_resume': can_resume,
+                'resume_point': status_data.get('resume_point') if can_resume else None
             }
         except Exception as e:
             print(f"프로젝트 컨텍스트 조회 오류: {e}")
@@ -6,7 +6,7 @@
 """
 
 import os
-from adaptive_script_generator import AdaptiveScriptGenerator
+from adaptive_script_generator import get_adaptive_script_generator
 from datetime import datetime
 
 def generate_enhanced_crewai_script(requirement, selected_models, project_path, execution_id, review_iterations=3, selected_tools=None, api_keys=None):
@@ -36,7 +36,7 @@ def generate_enhanced_crewai_script(requirement, selected_models, project_path,
 
     try:
         # 적응형 스크립트 생성기 초기화
-        generator = AdaptiveScriptGenerator("model_config.json")
+        generator = get_adaptive_script_generator("model_config.json")
 
         # 수동 모델 선택과 관계없이 항상 고품질 스크립트 생성
         if selected_models and any(selected_models.values()):
@@ -6,8 +6,12 @@
 """
 
 import re
+import copy
 import json
-from typing import Dict, List, Tuple
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Dict, Iterable, List, Set, Tuple
 from dataclasses import dataclass
 from enum import Enum
 
@@ -30,13 +34,119 @@ class RequirementAnalysis:
     keywords: List[str]
     analysis_details: Dict
 
+# 기능 수 추정 키워드
+FEATURE_KEYWORDS = ['기능', '모듈', '시스템', '서비스', '처리', '관리', '분석', '생성']
+
+# 복잡도 요인 / 기술 근거 판단에 쓰는 단어
+FACTOR_KEYWORDS = ['다양한', '여러', '통합', '연동', '자동화', '분석', 'python', '웹', 'api', '데이터']
+
+# 요구사항 분석 결과 캐시 크기 (프로세스 공유)
+ANALYSIS_CACHE_SIZE = 256
+
+
+class PatternMatcher:
+    """
+    Aho-Corasick 다중 패턴 매처
+
+    모든 패턴을 한 번에 컴파일하고 텍스트를 한 번만 훑어 등장한 패턴 집합을 반환.
+    겹치거나 포함 관계인 패턴도 모두 찾으므로 패턴별 `in` 검사와 결과가 같음
+    """
+
+    def __init__(self, patterns: Iterable[str]):
+        self.goto: List[Dict[str, int]] = [{}]
+        self.fail: List[int] = [0]
+        self.outputs: List[Set[str]] = [set()]
+
+        for pattern in set(patterns):
+            if pattern:
+                self._add(pattern)
+        self._build_failure_links()
+
+    def _add(self, pattern: str) -> None:
+        state = 0
+        for ch in pattern:
+            next_state = self.goto[state].get(ch)
+            if next_state is None:
+                next_state = len(self.goto)
+                self.goto[state][ch] = next_state
+                self.goto.append({})
+                self.fail.append(0)
+                self.outputs.append(set())
+            state = next_state
+        self.outputs[state].add(pattern)
+
+    def _build_failure_links(self) -> None:
+        queue = list(self.goto[0].values())
+        for state in queue:
+            for ch, next_state in self.goto[state].items():
+                queue.append(next_state)
+                fallback = self.fail[state]
+                while fallback and ch not in self.goto[fallback]:
+                    fallback = self.fail[fallback]
+                self.fail[next_state] = self.goto[fallback].get(ch, 0)
+                self.outputs[next_state] |= self.outputs[self.fail[next_state]]
+
+    def find_all(self, text: str) -> Set[str]:
+        """텍스트에 등장한 모든 패턴"""
+        found: Set[str] = set()
+        goto, fail, outputs = self.goto, self.fail, self.outputs
+        state = 0
+        for ch in text:
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            if outputs[state]:
+                found |= outputs[state]
+        return found
+
+
+# 요구사항 해시 -> 분석 결과 (생성 파이프라인의 여러 분석기 인스턴스가 공유)
+_analysis_cache: "OrderedDict[str, RequirementAnalysis]" = OrderedDict()
+_analysis_cache_lock = threading.Lock()
+
+
 class IntelligentRequirementAnalyzer:
     """지능형 요구사항 분석기"""
 
+    # 패턴 정의는 고정값이므로 매처는 클래스 단위로 한 번만 컴파일
+    _compiled_matcher = None
+    _matcher_lock = threading.Lock()
+
     def __init__(self):
         self.domain_patterns = self._load_domain_patterns()
         self.tech_stack_patterns = self._load_tech_patterns()
         self.complexity_indicators = self._load_complexity_indicators()
+        self.pattern_matcher = self._get_pattern_matcher()
+
+        # 마지막으로 스캔한 (요구사항, 매칭 패턴) - 분석 단계들이 같은 스캔 결과를 공유
+        self._last_scan: Tuple[str, Set[str]] = ('', set())
+
+    def _get_pattern_matcher(self) -> PatternMatcher:
+        cls = type(self)
+        if cls._compiled_matcher is None:
+            with cls._matcher_lock:
+                if cls._compiled_matcher is None:
+                    cls._compiled_matcher = PatternMatcher(self._collect_patterns())
+        return cls._compiled_matcher
+
+    def _collect_patterns(self) -> List[str]:
+        """도메인/기술/복잡도 패턴과 보조 키워드 전체"""
+        patterns = FEATURE_KEYWORDS + FACTOR_KEYWORDS
+        for domain_patterns in self.domain_patterns.values():
+            patterns += domain_patterns['keywords'] + domain_patterns['indicators']
+        for tech_patterns in self.tech_stack_patterns.values():
+            patterns += tech_patterns['patterns']
+        for indicators in self.complexity_indicators.values():
+            patterns += indicators['indicators'] + indicators['anti_indicators']
+        return patterns
+
+    def _find_patterns(self, requirement: str) -> Set[str]:
+        """요구사항에 등장한 패턴 집합 (같은 요구사항은 한 번만 스캔)"""
+        scanned_text, hits = self._last_scan
+        if scanned_text != requirement or not requirement:
+            hits = self.pattern_matcher.find_all(requirement)
+            self._last_scan = (requirement, hits)
+        return hits
 
     def _load_domain_patterns(self) -> Dict:
         """도메인 분류 패턴 정의"""
@@ -150,7 +260,26 @@ class IntelligentRequirementAnalyzer:
         }
 
     def analyze_requirement(self, requirement: str) -> RequirementAnalysis:
-        """요구사항 종합 분석"""
+        """요구사항 종합 분석 (요구사항 해시 기준 메모이즈)"""
+        cache_key = hashlib.sha256(requirement.encode('utf-8')).hexdigest()
+
+        with _analysis_cache_lock:
+            analysis = _analysis_cache.get(cache_key)
+            if analysis is not None:
+                _analysis_cache.move_to_end(cache_key)
+
+        if analysis is None:
+            analysis = self._analyze(requirement)
+            with _analysis_cache_lock:
+                _analysis_cache[cache_key] = analysis
+                while len(_analysis_cache) > ANALYSIS_CACHE_SIZE:
+                    _analysis_cache.popitem(last=False)
+
+        # 호출자가 결과 리스트를 수정해도 캐시가 오염되지 않도록 복사본 반환
+        return copy.deepcopy(analysis)
+
+    def _analyze(self, requirement: str) -> RequirementAnalysis:
+        """요구사항 종합 분석 (캐시 없이 계산)"""
 
         # 전처리
         requirement_lower = requirement.lower()
@@ -198,18 +327,19 @@ class IntelligentRequirementAnalyzer:
     def _analyze_domain(self, requirement: str) -> Tuple[str, float]:
         """도메인 분석"""
         domain_scores = {}
+        hits = self._find_patterns(requirement)
 
         for domain, patterns in self.domain_patterns.items():
             score = 0.0
 
             # 키워드 매칭
             for keyword in patterns['keywords']:
-                if keyword in requirement:
+                if keyword in hits:
                     score += patterns['weight']
 
             # 지표 매칭
             for indicator in patterns['indicators']:
-                if indicator in requirement:
+                if indicator in hits:
                     score += patterns['weight'] * 0.5
 
             domain_scores[domain] = score
@@ -225,16 +355,14 @@ class IntelligentRequirementAnalyzer:
     def _analyze_sub_domains(self, requirement: str, main_domain: str) -> List[str]:
         """서브 도메인 분석"""
         sub_domains = []
+        hits = self._find_patterns(requirement)
 
         # 주 도메인 외 다른 도메인 요소들 찾기
         for domain, patterns in self.domain_patterns.items():
             if domain == main_domain:
                 continue
 
-            score = 0
-            for keyword in patterns['keywords']:
-                if keyword in requirement:
-                    score += 1
+            score = sum(1 for keyword in patterns['keywords'] if keyword in hits)
 
             if score >= 2:  # 임계값
                 sub_domains.append(domain)
@@ -244,6 +372,7 @@ class IntelligentRequirementAnalyzer:
     def _analyze_complexity(self, requirement: str) -> ComplexityLevel:
         """복잡도 분석"""
         complexity_scores = {level: 0 for level in ComplexityLevel}
+        hits = self._find_patterns(requirement)
 
         # 문장 길이 기반 기본 점수
         word_count = len(requirement.split())
@@ -262,17 +391,16 @@ class IntelligentRequirementAnalyzer:
 
             # 긍정 지표
             for indicator in indicators['indicators']:
-                if indicator in requirement:
+                if indicator in hits:
                     complexity_scores[level] += 1
 
             # 부정 지표
             for anti_indicator in indicators['anti_indicators']:
-                if anti_indicator in requirement:
+                if anti_indicator in hits:
                     complexity_scores[level] -= 1
 
         # 기능 수 추정
-        feature_keywords = ['기능', '모듈', '시스템', '서비스', '처리', '관리', '분석', '생성']
-        feature_count = sum(1 for keyword in feature_keywords if keyword in requirement)
+        feature_count = sum(1 for keyword in FEATURE_KEYWORDS if keyword in hits)
 
         if feature_count <= 2:
             complexity_scores[ComplexityLevel.SIMPLE] += 1
@@ -305,11 +433,10 @@ class IntelligentRequirementAnalyzer:
             tech_stack.extend(domain_tech_map[domain])
 
         # 패턴 기반 추가 기술
+        hits = self._find_patterns(requirement)
         for tech_category, patterns in self.tech_stack_patterns.items():
-            for pattern in patterns['patterns']:
-                if pattern in requirement:
-                    tech_stack.append(tech_category.replace('_', ' ').title())
-                    break
+            if any(pattern in hits for pattern in patterns['patterns']):
+                tech_stack.append(tech_category.replace('_', ' ').title())
 
         return list(set(tech_stack))  # 중복 제거
 
@@ -318,10 +445,10 @@ class IntelligentRequirementAnalyzer:
         libraries = set(['crewai', 'python-dotenv', 'langchain-litellm'])  # 기본 라이브러리
 
         # 기술스택 기반 라이브러리 추가
+        hits = self._find_patterns(requirement)
         for tech_category, patterns in self.tech_stack_patterns.items():
-            for pattern in patterns['patterns']:
-                if pattern in requirement:
-                    libraries.update(patterns['libraries'])
+            if any(pattern in hits for pattern in patterns['patterns']):
+                libraries.update(patterns['libraries'])
 
         # 도메인별 추가 라이브러리
         domain_libraries = {
@@ -391,14 +518,15 @@ class IntelligentRequirementAnalyzer:
     def _get_complexity_factors(self, requirement: str) -> List[str]:
         """복잡도 결정 요인"""
         factors = []
+        hits = self._find_patterns(requirement)
 
-        if '다양한' in requirement or '여러' in requirement:
+        if '다양한' in hits or '여러' in hits:
             factors.append('다중 기능 요구')
-        if '통합' in requirement or '연동' in requirement:
+        if '통합' in hits or '연동' in hits:
             factors.append('시스템 통합 필요')
-        if '자동화' in requirement:
+        if '자동화' in hits:
             factors.append('자동화 프로세스')
-        if '분석' in requirement:
+        if '분석' in hits:
             factors.append('데이터 분석 포함')
         if len(requirement.split()) > 30:
             factors.append('상세한 요구사항')
@@ -408,16 +536,17 @@ class IntelligentRequirementAnalyzer:
     def _get_tech_reasoning(self, requirement: str, domain: str) -> str:
         """기술 선택 근거"""
         reasons = []
+        hits = self._find_patterns(requirement)
 
-        if 'python' in requirement:
+        if 'python' in hits:
             reasons.append('Python 명시적 요구')
         elif domain in ['data_analysis', 'automation', 'document_processing']:
             reasons.append('도메인 특성상 Python 최적')
 
-        if '웹' in requirement or 'api' in requirement:
+        if '웹' in hits or 'api' in hits:
             reasons.append('웹 개발 프레임워크 필요')
 
-        if '데이터' in requirement or '분석' in requirement:
+        if '데이터' in hits or '분석' in hits:
             reasons.append('데이터 처리 라이브러리 필요')
 
         return ', '.join(reasons) if reasons else '일반적인 기술스택 적용'
@@ -0,0 +1,138 @@
+# -*- coding: utf-8 -*-
+"""
+지연 로딩 (Lazy Loader)
+무거운 모듈/전역 인스턴스를 첫 사용 시점에 import·생성하는 프록시 - 서버 시작 시간 단축용
+"""
+
+import os
+import time
+import threading
+import importlib
+from typing import Any, Callable, Dict, List, Optional
+import logging
+
+logger = logging.getLogger(__name__)
+
+_UNSET = object()
+
+# 생성된 모든 프록시 (이름 -> 프록시) - 상태 조회/사전 로딩용
+_registry: Dict[str, "LazyObject"] = {}
+_registry_lock = threading.Lock()
+
+
+class LazyObject:
+    """
+    factory 결과를 첫 속성 접근/호출 시 한 번만 생성하는 프록시
+
+    기존 전역 인스턴스(db, crewai_logger 등)를 그대로 대체할 수 있도록
+    속성 접근, 호출, bool 판정을 실제 객체로 위임
+    """
+
+    __slots__ = ('_factory', '_name', '_target', '_lock', '_load_seconds')
+
+    def __init__(self, factory: Callable[[], Any], name: str):
+        object.__setattr__(self, '_factory', factory)
+        object.__setattr__(self, '_name', name)
+        object.__setattr__(self, '_target', _UNSET)
+        object.__setattr__(self, '_lock', threading.Lock())
+        object.__setattr__(self, '_load_seconds', None)
+
+        with _registry_lock:
+            _registry[name] = self
+
+    def resolve(self) -> Any:
+        """실제 객체 반환 (최초 1회 생성, 동시 호출 시에도 한 번만 생성)"""
+        target = self._target
+        if target is not _UNSET:
+            return target
+
+        with self._lock:
+            if self._target is _UNSET:
+                started = time.perf_counter()
+                target = self._factory()
+                object.__setattr__(self, '_load_seconds', round(time.perf_counter() - started, 4))
+                object.__setattr__(self, '_target', target)
+                logger.info(f"지연 로딩 완료: {self._name} ({self._load_seconds}s)")
+            return self._target
+
+    def is_loaded(self) -> bool:
+        return self._target is not _UNSET
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.resolve(), name)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        setattr(self.resolve(), name, value)
+
+    def __call__(self, *args, **kwargs) -> Any:
+        return self.resolve()(*args, **kwargs)
+
+    def __bool__(self) -> bool:
+        return bool(self.resolve())
+
+    def __repr__(self) -> str:
+        if self.is_loaded():
+            return repr(self._target)
+        return f"<LazyObject {self._name} (not loaded)>"
+
+
+def lazy_import(module_name: str, attribute: Optional[str] = None) -> LazyObject:
+    """
+    모듈 또는 모듈 속성의 지연 프록시
+
+    Args:
+        module_name: import할 모듈명
+        attribute: 모듈 안의 속성명 (미지정 시 모듈 자체)
+    """
+    name = f"{module_name}.{attribute}" if attribute else module_name
+
+    def load():
+        module = importlib.import_module(module_name)
+        return getattr(module, attribute) if attribute else module
+
+    return LazyObject(load, name)
+
+
+def resolve(value: Any) -> Any:
+    """프록시면 실제 객체, 아니면 그대로 반환 (isinstance 검사 등이 필요한 곳에서 사용)"""
+    return value.resolve() if isinstance(value, LazyObject) else value
+
+
+def get_lazy_status() -> Dict[str, Dict]:
+    """프록시별 로딩 여부와 로딩 소요 시간"""
+    with _registry_lock:
+        proxies = dict(_registry)
+    return {
+        name: {'loaded': proxy.is_loaded(), 'load_seconds': proxy._load_seconds}
+        for name, proxy in sorted(proxies.items())
+    }
+
+
+def preload(names: Optional[List[str]] = None) -> List[str]:
+    """등록된 프록시를 미리 로드 (실패한 항목은 건너뜀) - 로드된 이름 목록 반환"""
+    with _registry_lock:
+        proxies = dict(_registry)
+
+    loaded = []
+    for name, proxy in proxies.items():
+        if names is not None and name not in names:
+            continue
+        try:
+            proxy.resolve()
+            loaded.append(name)
+        except Exception as e:
+            logger.warning(f"사전 로딩 실패: {name} - {str(e)}")
+    return loaded
+
+
+def preload_async_from_env() -> Optional[threading.Thread]:
+    """
+    LAZY_PRELOAD=true이면 서버 시작 후 백그라운드에서 전체 사전 로딩
+
+    첫 요청의 지연을 없애고 싶을 때 사용 (시작 자체는 지연시키지 않음)
+    """
+    if os.getenv('LAZY_PRELOAD', 'false').lower() not in ('1', 'true', 'yes'):
+        return None
+    thread = threading.Thread(target=preload, daemon=True, name='lazy-preload')
+    thread.start()
+    return thread
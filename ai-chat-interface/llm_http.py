@@ -0,0 +1,217 @@
+# -*- coding: utf-8 -*-
+"""
+LLM HTTP 전송 계층 (LLM HTTP Transport)
+프로바이더별 공유 requests.Session - keep-alive 연결 풀, 재시도/백오프, 엔드포인트별 타임아웃, 지연시간 히스토그램
+"""
+
+import time
+import bisect
+import threading
+from typing import Dict, List, Optional, Tuple
+import logging
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+logger = logging.getLogger(__name__)
+
+# 프로바이더별 연결 풀 / 재시도 설정
+PROVIDER_CONFIGS = {
+    'gemini': {
+        'pool_connections': 4,
+        'pool_maxsize': 16,
+        'retry': {'total': 2, 'connect': 2, 'read': 0, 'status': 2, 'backoff_factor': 0.5}
+    },
+    'openai': {
+        'pool_connections': 4,
+        'pool_maxsize': 16,
+        'retry': {'total': 2, 'connect': 2, 'read': 0, 'status': 2, 'backoff_factor': 0.5}
+    },
+    'ollama': {
+        # 로컬 데몬 - 다운 상태에서 재시도하면 모델 목록 조회가 느려지므로 재시도 없음
+        'pool_connections': 1,
+        'pool_maxsize': 8,
+        'retry': {'total': 0, 'connect': 0, 'read': 0, 'status': 0, 'backoff_factor': 0}
+    }
+}
+
+# 엔드포인트별 (연결, 읽기) 타임아웃 (초)
+ENDPOINT_TIMEOUTS = {
+    'gemini': {'generate': (5, 60)},
+    'openai': {'chat': (5, 60)},
+    'ollama': {
+        'tags': (2, 5),
+        'generate': (2, 60),
+        'chat': (2, 60),
+        'show': (2, 10),
+        'pull': (2, 300),
+        'delete': (2, 30)
+    }
+}
+
+DEFAULT_TIMEOUT = (5, 60)
+
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+
+# 지연시간 히스토그램 버킷 상한 (초)
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0)
+
+
+class LatencyHistogram:
+    """고정 버킷 지연시간 히스토그램"""
+
+    def __init__(self, buckets: Tuple[float, ...] = LATENCY_BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.total = 0
+        self.sum_seconds = 0.0
+        self.max_seconds = 0.0
+        self.errors = 0
+
+    def observe(self, seconds: float, error: bool = False) -> None:
+        self.counts[bisect.bisect_left(self.buckets, seconds)] += 1
+        self.total += 1
+        self.sum_seconds += seconds
+        self.max_seconds = max(self.max_seconds, seconds)
+        if error:
+            self.errors += 1
+
+    def percentile(self, fraction: float) -> Optional[float]:
+        """버킷 상한 기준 근사 백분위수"""
+        if self.total == 0:
+            return None
+        target = fraction * self.total
+        cumulative = 0
+        for index, count in enumerate(self.counts):
+            cumulative += count
+            if cumulative >= target:
+                return self.buckets[index] if index < len(self.buckets) else self.max_seconds
+        return self.max_seconds
+
+    def to_dict(self) -> Dict:
+        labels = [f"le_{bound}" for bound in self.buckets] + ["le_inf"]
+        return {
+            'count': self.total,
+            'errors': self.errors,
+            'avg_seconds': round(self.sum_seconds / self.total, 4) if self.total else None,
+            'max_seconds': round(self.max_seconds, 4),
+            'p50_seconds': self.percentile(0.5),
+            'p95_seconds': self.percentile(0.95),
+            'buckets': dict(zip(labels, self.counts))
+        }
+
+
+class LLMTransport:
+    """프로바이더별 공유 HTTP 세션 관리자"""
+
+    def __init__(self):
+        self._sessions: Dict[str, requests.Session] = {}
+        self._histograms: Dict[Tuple[str, str], LatencyHistogram] = {}
+        self._lock = threading.Lock()
+
+    def get_session(self, provider: str) -> requests.Session:
+        """프로바이더 세션 반환 (최초 호출 시 생성)"""
+        session = self._sessions.get(provider)
+        if session is not None:
+            return session
+
+        with self._lock:
+            session = self._sessions.get(provider)
+            if session is None:
+                session = self._create_session(provider)
+                self._sessions[provider] = session
+        return session
+
+    def request(self, provider: str, endpoint: str, method: str, url: str, **kwargs) -> requests.Response:
+        """
+        공유 세션으로 HTTP 요청 수행 및 지연시간 기록
+
+        Args:
+            provider: 'gemini', 'openai', 'ollama'
+            endpoint: 타임아웃/지표 구분용 엔드포인트 이름 (예: 'generate', 'tags')
+            method: HTTP 메서드
+            url: 요청 URL
+        """
+        kwargs.setdefault('timeout', self.get_timeout(provider, endpoint))
+        session = self.get_session(provider)
+
+        started = time.perf_counter()
+        error = False
+        try:
+            response = session.request(method, url, **kwargs)
+            error = response.status_code >= 400
+            return response
+        except requests.exceptions.RequestException:
+            error = True
+            raise
+        finally:
+            # 스트리밍 응답은 헤더 수신까지의 시간(TTFB)이 기록됨
+            self._observe(provider, endpoint, time.perf_counter() - started, error)
+
+    def get(self, provider: str, endpoint: str, url: str, **kwargs) -> requests.Response:
+        return self.request(provider, endpoint, 'GET', url, **kwargs)
+
+    def post(self, provider: str, endpoint: str, url: str, **kwargs) -> requests.Response:
+        return self.request(provider, endpoint, 'POST', url, **kwargs)
+
+    def delete(self, provider: str, endpoint: str, url: str, **kwargs) -> requests.Response:
+        return self.request(provider, endpoint, 'DELETE', url, **kwargs)
+
+    @staticmethod
+    def get_timeout(provider: str, endpoint: str) -> Tuple[float, float]:
+        return ENDPOINT_TIMEOUTS.get(provider, {}).get(endpoint, DEFAULT_TIMEOUT)
+
+    def get_latency_stats(self) -> Dict[str, Dict[str, Dict]]:
+        """프로바이더/엔드포인트별 지연시간 히스토그램"""
+        with self._lock:
+            items = [(key, histogram.to_dict()) for key, histogram in self._histograms.items()]
+
+        stats: Dict[str, Dict[str, Dict]] = {}
+        for (provider, endpoint), data in items:
+            stats.setdefault(provider, {})[endpoint] = data
+        return stats
+
+    def close(self) -> None:
+        """모든 세션 종료 (연결 풀 해제)"""
+        with self._lock:
+            sessions: List[requests.Session] = list(self._sessions.values())
+            self._sessions.clear()
+        for session in sessions:
+            session.close()
+
+    def _observe(self, provider: str, endpoint: str, seconds: float, error: bool) -> None:
+        with self._lock:
+            histogram = self._histograms.get((provider, endpoint))
+            if histogram is None:
+                histogram = LatencyHistogram()
+                self._histograms[(provider, endpoint)] = histogram
+            histogram.observe(seconds, error)
+
+    @staticmethod
+    def _create_session(provider: str) -> requests.Session:
+        config = PROVIDER_CONFIGS.get(provider, PROVIDER_CONFIGS['openai'])
+        retry = Retry(
+            status_forcelist=RETRY_STATUS_CODES,
+            # 생성 요청(POST)은 상태 코드 재시도 제외 - 호출 측 재시도 루프와 중복되면 요청 1건이 여러 번 과금됨
+            # (연결 실패는 요청이 전송되지 않았으므로 메서드와 무관하게 재시도)
+            allowed_methods=frozenset(['GET', 'DELETE']),
+            respect_retry_after_header=True,
+            raise_on_status=False,
+            **config['retry']
+        )
+        adapter = HTTPAdapter(
+            pool_connections=config['pool_connections'],
+            pool_maxsize=config['pool_maxsize'],
+            max_retries=retry
+        )
+
+        session = requests.Session()
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        logger.info(f"LLM HTTP 세션 생성: {provider} (pool_maxsize={config['pool_maxsize']})")
+        return session
+
+
+# 전역 전송 계층 인스턴스
+llm_transport = LLMTransport()
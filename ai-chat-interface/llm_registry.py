@@ -0,0 +1,168 @@
+# -*- coding: utf-8 -*-
+"""
+LangChain LLM 클라이언트 레지스트리 (LLM Client Registry)
+(프로바이더, 모델, temperature, 옵션) 키로 생성된 클라이언트와 HTTP 풀을 요청 간 재사용
+"""
+
+import os
+import hashlib
+import threading
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+import logging
+
+logger = logging.getLogger(__name__)
+
+# 프로바이더별 API 키 환경변수 (앞쪽 우선)
+PROVIDER_API_KEY_ENVS = {
+    'openai': ('OPENAI_API_KEY',),
+    'gemini': ('GOOGLE_API_KEY', 'GEMINI_API_KEY'),
+    'anthropic': ('ANTHROPIC_API_KEY',)
+}
+
+# 서버 시작 시 미리 생성할 클라이언트 (provider, model, temperature, options)
+DEFAULT_WARMUP_SPECS = [
+    ('gemini', 'gemini-2.5-flash', 0.3, {'timeout': 90, 'max_retries': 2}),
+    ('gemini', 'gemini-2.0-flash-exp', 0.7, {}),
+    ('gemini', 'gemini-2.0-flash-exp', 0.3, {'timeout': 30, 'max_retries': 2})
+]
+
+
+def infer_provider(model_name: str) -> str:
+    """모델명으로 프로바이더 추론"""
+    name = (model_name or '').lower()
+    if name.startswith('gpt'):
+        return 'openai'
+    if name.startswith('claude'):
+        return 'anthropic'
+    return 'gemini'
+
+
+def _get_api_key(provider: str) -> Optional[str]:
+    for env_name in PROVIDER_API_KEY_ENVS.get(provider, ()):
+        value = os.getenv(env_name)
+        if value:
+            return value
+    return None
+
+
+def _key_fingerprint(api_key: Optional[str]) -> str:
+    """API 키 식별자 (키 원문은 보관하지 않음)"""
+    if not api_key:
+        return ''
+    return hashlib.sha256(api_key.encode('utf-8')).hexdigest()[:16]
+
+
+class LLMClientRegistry:
+    """키 기반 LangChain 채팅 모델 캐시"""
+
+    def __init__(self):
+        self._clients: Dict[Tuple, Any] = {}
+        self._lock = threading.Lock()
+        self._stats = {'hits': 0, 'created': 0, 'invalidated': 0}
+
+    def get(self, provider: str, model: str, temperature: float = 0.7, **options) -> Any:
+        """
+        캐시된 클라이언트 반환 (없으면 생성)
+
+        API 키 지문이 키에 포함되므로 환경변수의 키가 바뀌면 자동으로 새 클라이언트가 생성됨
+        """
+        api_key = _get_api_key(provider)
+        cache_key = (
+            provider,
+            model,
+            float(temperature),
+            tuple(sorted(options.items())),
+            _key_fingerprint(api_key)
+        )
+
+        with self._lock:
+            client = self._clients.get(cache_key)
+            if client is not None:
+                self._stats['hits'] += 1
+                return client
+
+            # 같은 설정의 이전 키 클라이언트 정리
+            stale_keys = [key for key in self._clients if key[:4] == cache_key[:4]]
+            for key in stale_keys:
+                del self._clients[key]
+                self._stats['invalidated'] += 1
+
+            client = self._create_client(provider, model, temperature, api_key, options)
+            self._clients[cache_key] = client
+            self._stats['created'] += 1
+
+        logger.info(f"LLM 클라이언트 생성: {provider}/{model} (temperature={temperature})")
+        return client
+
+    def get_for_model(self, model_name: str, temperature: float = 0.7, **options) -> Any:
+        """모델명으로 프로바이더를 추론하여 클라이언트 반환"""
+        return self.get(infer_provider(model_name), model_name, temperature, **options)
+
+    def invalidate(self, provider: Optional[str] = None) -> int:
+        """클라이언트 무효화 (API 키 변경 시 호출) - 제거된 개수 반환"""
+        with self._lock:
+            if provider is None:
+                removed = len(self._clients)
+                self._clients.clear()
+            else:
+                stale_keys = [key for key in self._clients if key[0] == provider]
+                for key in stale_keys:
+                    del self._clients[key]
+                removed = len(stale_keys)
+            self._stats['invalidated'] += removed
+
+        logger.info(f"LLM 클라이언트 무효화: {provider or '전체'} ({removed}개)")
+        return removed
+
+    def warm_up(self, specs: Iterable[Tuple[str, str, float, Dict]] = DEFAULT_WARMUP_SPECS) -> List[str]:
+        """자주 쓰는 클라이언트를 미리 생성 - API 키가 없는 프로바이더는 건너뜀"""
+        warmed = []
+        for provider, model, temperature, options in specs:
+            if not _get_api_key(provider):
+                continue
+            try:
+                self.get(provider, model, temperature, **options)
+                warmed.append(f"{provider}/{model}")
+            except Exception as e:
+                logger.warning(f"LLM 클라이언트 워밍업 실패: {provider}/{model} - {str(e)}")
+        return warmed
+
+    def warm_up_async(self, specs: Iterable[Tuple[str, str, float, Dict]] = DEFAULT_WARMUP_SPECS) -> threading.Thread:
+        """백그라운드 스레드에서 워밍업 (서버 시작을 지연시키지 않음)"""
+        thread = threading.Thread(target=self.warm_up, args=(list(specs),), daemon=True, name='llm-registry-warmup')
+        thread.start()
+        return thread
+
+    def get_stats(self) -> Dict:
+        with self._lock:
+            stats = dict(self._stats)
+            stats['size'] = len(self._clients)
+            stats['clients'] = [f"{key[0]}/{key[1]}@{key[2]}" for key in self._clients]
+        return stats
+
+    @staticmethod
+    def _create_client(provider: str, model: str, temperature: float,
+                       api_key: Optional[str], options: Dict) -> Any:
+        # LangChain 통합 패키지는 무거우므로 처음 필요할 때 import
+        if provider == 'openai':
+            from langchain_openai import ChatOpenAI
+            return ChatOpenAI(model=model, temperature=temperature, api_key=api_key, **options)
+
+        if provider == 'anthropic':
+            from langchain_anthropic import ChatAnthropic
+            return ChatAnthropic(model=model, temperature=temperature, anthropic_api_key=api_key, **options)
+
+        if provider == 'gemini':
+            from langchain_google_genai import ChatGoogleGenerativeAI
+            return ChatGoogleGenerativeAI(model=model, temperature=temperature, google_api_key=api_key, **options)
+
+        raise ValueError(f"지원하지 않는 LLM 프로바이더: {provider}")
+
+
+# 전역 LLM 클라이언트 레지스트리
+llm_registry = LLMClientRegistry()
+
+
+def invalidate_llm_clients(provider: Optional[str] = None) -> int:
+    """API 키 변경 시 호출하는 무효화 훅"""
+    return llm_registry.invalidate(provider)
@@ -0,0 +1,345 @@
+# -*- coding: utf-8 -*-
+"""
+MetaGPT 비동기 실행 작업 (MetaGPT Jobs)
+metagpt_bridge.py 실행을 요청 스레드가 아닌 작업 스레드에서 수행하고, stdout 진행 로그를 단계별 진행 상황/이벤트로 작업 저장소에 기록
+클라이언트는 실행 ID로 롱폴링(since/wait) 또는 SSE 구독하여 완료를 확인
+"""
+
+import os
+import re
+import json
+import time
+import threading
+import subprocess
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional
+import logging
+
+logger = logging.getLogger(__name__)
+
+# MetaGPT 5단계 워크플로우 (metagpt_workflow_stages 행 기본값)
+METAGPT_WORKFLOW_STAGES = [
+    {'stage_number': 1, 'stage_name': '요구사항 분석', 'responsible_role': 'Product Manager', 'role_icon': '📋'},
+    {'stage_number': 2, 'stage_name': '시스템 설계', 'responsible_role': 'Architect', 'role_icon': '🏗️'},
+    {'stage_number': 3, 'stage_name': '프로젝트 계획', 'responsible_role': 'Project Manager', 'role_icon': '📊'},
+    {'stage_number': 4, 'stage_name': '코드 개발', 'responsible_role': 'Engineer', 'role_icon': '💻'},
+    {'stage_number': 5, 'stage_name': '품질 보증', 'responsible_role': 'QA Engineer', 'role_icon': '🧪'}
+]
+ROLE_STAGES = {stage['responsible_role']: stage['stage_number'] for stage in METAGPT_WORKFLOW_STAGES}
+
+# metagpt_bridge.py 진행 로그 형식: "[HH:MM:SS] 역할: 메시지 (진행률%)"
+PROGRESS_LINE_RE = re.compile(r'^\[(\d{2}:\d{2}:\d{2})\] ([^:]+): (.*) \((\d+)%\)$')
+
+# 작업별로 보관하는 최대 이벤트 수 / 출력 꼬리 줄 수 (전체 출력은 메모리에 쌓지 않음)
+MAX_EVENTS_PER_JOB = 500
+OUTPUT_TAIL_LINES = 200
+
+# 롱폴링 최대 대기 시간 (초)
+MAX_WAIT_SECONDS = 30.0
+
+# 동기 모드 대기 시간 여유 (초) - 실행 제한 시간 이후 종료 처리/DB 저장에 걸리는 시간
+SYNC_WAIT_GRACE_SECONDS = 30.0
+
+# 동기 모드 최대 대기 시간 (초) - 대기열이 길어도 요청 스레드를 이 이상 붙잡지 않음
+SYNC_WAIT_MAX_SECONDS = 1200.0
+
+FINISHED_STATUSES = ('completed', 'failed', 'timeout')
+
+
+class MetaGPTJobStore:
+    """실행 작업 상태/이벤트 저장소 - 변경 시 대기 중인 롱폴링을 깨움"""
+
+    def __init__(self, retention_seconds: float = 3600.0, max_events: int = MAX_EVENTS_PER_JOB):
+        self.retention_seconds = retention_seconds
+        self.max_events = max_events
+        self._jobs: Dict[str, Dict] = {}
+        self._condition = threading.Condition()
+
+    def create(self, execution_id: str, requirement: str, selected_models: Dict) -> None:
+        now = datetime.utcnow()
+        job = {
+            'execution_id': execution_id,
+            'status': 'queued',
+            'requirement': requirement,
+            'role_llm_mapping': selected_models,
+            'progress': 0,
+            'current_stage': None,
+            'stages': [dict(stage, status='pending', progress_percentage=0) for stage in METAGPT_WORKFLOW_STAGES],
+            'created_at': now.isoformat(),
+            'started_at': None,
+            'completed_at': None,
+            'duration_seconds': None,
+            'result': None,
+            'error': None,
+            'database_id': None,
+            'last_seq': 0,
+            'events': deque(maxlen=self.max_events),
+            '_finished_at': None
+        }
+        with self._condition:
+            self._prune_locked()
+            self._jobs[execution_id] = job
+        self.add_event(execution_id, 'queued', {'message': '실행 대기 중'})
+
+    def add_event(self, execution_id: str, event_type: str, data: Dict, **fields) -> None:
+        """이벤트 추가 (+ 작업 필드 갱신)"""
+        with self._condition:
+            job = self._jobs.get(execution_id)
+            if job is None:
+                return
+            job.update(fields)
+            job['last_seq'] += 1
+            job['events'].append({
+                'seq': job['last_seq'],
+                'type': event_type,
+                'data': data,
+                'timestamp': datetime.utcnow().isoformat()
+            })
+            if job['status'] in FINISHED_STATUSES and job['_finished_at'] is None:
+                job['_finished_at'] = time.time()
+            self._condition.notify_all()
+
+    def record_progress(self, execution_id: str, role: str, progress: int, message: str) -> None:
+        """역할별 진행 로그를 단계 상태/전체 진행률에 반영"""
+        with self._condition:
+            job = self._jobs.get(execution_id)
+            if job is None:
+                return
+            stage_number = ROLE_STAGES.get(role)
+            if stage_number is not None:
+                for stage in job['stages']:
+                    if stage['stage_number'] < stage_number:
+                        stage['status'], stage['progress_percentage'] = 'completed', 100
+                    elif stage['stage_number'] == stage_number:
+                        stage['status'] = 'completed' if progress >= 100 else 'in_progress'
+                        stage['progress_percentage'] = progress
+                job['current_stage'] = stage_number
+                job['progress'] = max(job['progress'], int(((stage_number - 1) * 100 + progress) / len(job['stages'])))
+
+        self.add_event(execution_id, 'progress', {
+            'role': role, 'stage_number': stage_number, 'progress': progress, 'message': message
+        })
+
+    def complete_stages(self, execution_id: str) -> None:
+        """성공 종료 시 남은 단계를 모두 완료 처리"""
+        with self._condition:
+            job = self._jobs.get(execution_id)
+            for stage in (job['stages'] if job else []):
+                stage['status'], stage['progress_percentage'] = 'completed', 100
+
+    def get(self, execution_id: str, since: int = 0) -> Optional[Dict]:
+        """작업 스냅샷 (since 이후 이벤트만 포함)"""
+        with self._condition:
+            job = self._jobs.get(execution_id)
+            return self._snapshot_locked(job, since) if job is not None else None
+
+    def wait(self, execution_id: str, since: int = 0, timeout: float = MAX_WAIT_SECONDS) -> Optional[Dict]:
+        """since 이후 새 이벤트가 생기거나 작업이 끝날 때까지 대기 (최대 timeout초)"""
+        deadline = time.monotonic() + max(0.0, min(timeout, MAX_WAIT_SECONDS))
+        with self._condition:
+            while True:
+                job = self._jobs.get(execution_id)
+                if job is None:
+                    return None
+                remaining = deadline - time.monotonic()
+                if job['last_seq'] > since or job['status'] in FINISHED_STATUSES or remaining <= 0:
+                    return self._snapshot_locked(job, since)
+                self._condition.wait(remaining)
+
+    def _snapshot_locked(self, job: Dict, since: int) -> Dict:
+        snapshot = {key: value for key, value in job.items() if key not in ('events', '_finished_at')}
+        snapshot['stages'] = [dict(stage) for stage in job['stages']]
+        snapshot['events'] = [event for event in job['events'] if event['seq'] > since]
+        return snapshot
+
+    def _prune_locked(self) -> None:
+        """보관 기간이 지난 완료 작업 정리"""
+        cutoff = time.time() - self.retention_seconds
+        for execution_id in [eid for eid, job in self._jobs.items()
+                             if job['_finished_at'] is not None and job['_finished_at'] < cutoff]:
+            del self._jobs[execution_id]
+
+    def count_active(self) -> int:
+        """대기/실행 중인 작업 수"""
+        with self._condition:
+            return sum(1 for job in self._jobs.values() if job['status'] not in FINISHED_STATUSES)
+
+    def get_stats(self) -> Dict:
+        with self._condition:
+            counts: Dict[str, int] = {}
+            for job in self._jobs.values():
+                counts[job['status']] = counts.get(job['status'], 0) + 1
+        return {'jobs': counts, 'retention_seconds': self.retention_seconds}
+
+
+class MetaGPTJobRunner:
+    """
+    MetaGPT 브릿지 실행기 - 동시 실행 수를 제한한 작업 스레드에서 실행
+
+    on_complete: 성공한 작업 스냅샷을 받아 DB 저장 후 저장 ID를 반환하는 함수
+    """
+
+    def __init__(self, store: MetaGPTJobStore, max_concurrent: int = 2, timeout: float = 1200.0,
+                 on_complete: Optional[Callable[[Dict], Any]] = None):
+        self.store = store
+        self.timeout = timeout
+        self.max_concurrent = max_concurrent
+        self.on_complete = on_complete
+        self._executor = ThreadPoolExecutor(max_workers=max(1, max_concurrent), thread_name_prefix='metagpt-job')
+
+    def submit(self, requirement: str, selected_models: Dict, cmd: List[str], cwd: str,
+               execution_id: str) -> Dict:
+        """작업 등록 후 즉시 반환 (실행은 작업 스레드에서)"""
+        self.store.create(execution_id, requirement, selected_models)
+        self._executor.submit(self._run, execution_id, cmd, cwd)
+        return self.store.get(execution_id)
+
+    def sync_wait_seconds(self) -> float:
+        """
+        동기 모드 최대 대기 시간 - 실행 제한 시간 + 앞선 작업들의 대기 시간 (방금 등록한 작업 포함 기준)
+
+        SYNC_WAIT_MAX_SECONDS를 넘지 않음 (넘으면 호출 측은 작업 상태 URL로 안내)
+        """
+        queued_rounds = max(0, self.store.count_active() - 1) // max(1, self.max_concurrent)
+        return min(self.timeout * (1 + queued_rounds) + SYNC_WAIT_GRACE_SECONDS, SYNC_WAIT_MAX_SECONDS)
+
+    def _run(self, execution_id: str, cmd: List[str], cwd: str) -> None:
+        """작업 스레드 진입점 - 예상치 못한 오류도 반드시 failed로 종료 (대기 중인 요청/SSE가 끝나도록)"""
+        started = time.time()
+        try:
+            self._execute(execution_id, cmd, cwd, started)
+        except Exception as e:
+            logger.exception(f"MetaGPT 작업 처리 오류: {execution_id}")
+            self._finish(execution_id, started, 'failed', error=f'MetaGPT 실행 중 오류: {str(e)}')
+
+    def _execute(self, execution_id: str, cmd: List[str], cwd: str, started: float) -> None:
+        self.store.add_event(execution_id, 'started', {'message': 'MetaGPT 실행 시작'},
+                             status='running', started_at=datetime.utcnow().isoformat())
+
+        try:
+            process = subprocess.Popen(
+                cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                text=True, encoding='utf-8', errors='replace', cwd=cwd
+            )
+        except Exception as e:
+            self._finish(execution_id, started, 'failed', error=f'MetaGPT 실행 중 오류: {str(e)}')
+            return
+
+        timed_out = threading.Event()
+
+        def kill_on_timeout():
+            timed_out.set()
+            process.kill()
+
+        timer = threading.Timer(self.timeout, kill_on_timeout)
+        timer.daemon = True
+        timer.start()
+
+        stderr_tail: deque = deque(maxlen=OUTPUT_TAIL_LINES)
+        stderr_thread = threading.Thread(
+            target=lambda: stderr_tail.extend(line.rstrip('\n') for line in process.stderr), daemon=True
+        )
+        stderr_thread.start()
+
+        try:
+            result_lines, stdout_tail = self._consume_stdout(execution_id, process.stdout)
+            process.wait()
+            stderr_thread.join(timeout=5)
+        except BaseException:
+            process.kill()
+            raise
+        finally:
+            timer.cancel()
+
+        output = {'stdout': '\n'.join(stdout_tail), 'stderr': '\n'.join(stderr_tail)}
+        if timed_out.is_set():
+            self._finish(execution_id, started, 'timeout',
+                         error=f'MetaGPT 실행 시간 초과 ({int(self.timeout // 60)}분)', **output)
+            return
+        if process.returncode != 0:
+            self._finish(execution_id, started, 'failed', returncode=process.returncode,
+                         error=f'MetaGPT 실행 실패 (exit code: {process.returncode})', **output)
+            return
+
+        try:
+            result = json.loads(''.join(result_lines))
+        except json.JSONDecodeError:
+            self._finish(execution_id, started, 'failed', error='MetaGPT 결과 파싱 오류',
+                         raw_output=''.join(result_lines) or output['stdout'], **output)
+            return
+
+        # metagpt_bridge.py는 실패 시에도 exit code 0으로 {"error": ...}를 출력
+        if not isinstance(result, dict) or result.get('error'):
+            error = result.get('error') if isinstance(result, dict) else '예상하지 못한 결과 형식'
+            self._finish(execution_id, started, 'failed', error=f'MetaGPT 실행 실패: {error}',
+                         result=result, **output)
+            return
+
+        self.store.complete_stages(execution_id)
+
+        database_id = None
+        if self.on_complete:
+            try:
+                snapshot = self.store.get(execution_id)
+                snapshot.update(result=result, duration_seconds=round(time.time() - started, 3))
+                database_id = self.on_complete(snapshot)
+            except Exception as e:
+                logger.error(f"MetaGPT 실행 결과 저장 실패: {str(e)}")
+
+        self._finish(execution_id, started, 'completed', result=result, progress=100,
+                     database_id=database_id, agents_involved=result.get('agents_involved', []))
+
+    def _consume_stdout(self, execution_id: str, stdout) -> tuple:
+        """
+        stdout을 줄 단위로 처리 - 진행 로그는 이벤트로, 마지막 JSON 결과만 모음
+
+        결과 JSON은 '{'로 시작하는 줄부터 끝까지 (metagpt_bridge.py는 마지막에 결과를 출력)
+        """
+        result_lines: List[str] = []
+        stdout_tail: deque = deque(maxlen=OUTPUT_TAIL_LINES)
+        for line in stdout:
+            if result_lines or line.startswith('{'):
+                result_lines.append(line)
+                continue
+
+            stripped = line.rstrip('\n')
+            stdout_tail.append(stripped)
+            match = PROGRESS_LINE_RE.match(stripped)
+            if match:
+                _, role, message, progress = match.groups()
+                self.store.record_progress(execution_id, role.strip(), int(progress), message)
+        return result_lines, stdout_tail
+
+    def _finish(self, execution_id: str, started: float, status: str, **fields) -> None:
+        fields.update(
+            status=status,
+            completed_at=datetime.utcnow().isoformat(),
+            duration_seconds=round(time.time() - started, 3)
+        )
+        self.store.add_event(execution_id, status, {
+            'error': fields.get('error'), 'database_id': fields.get('database_id')
+        }, **fields)
+        print(f"MetaGPT 실행 {status}: {execution_id} ({fields['duration_seconds']}s)")
+
+    def get_stats(self) -> Dict:
+        stats = self.store.get_stats()
+        stats.update(max_concurrent=self.max_concurrent, timeout_seconds=self.timeout)
+        return stats
+
+
+def create_metagpt_job_runner_from_env(on_complete: Optional[Callable[[Dict], Any]] = None) -> MetaGPTJobRunner:
+    """환경변수 기반 실행기 생성
+
+    METAGPT_JOB_MAX_CONCURRENT: 동시에 실행할 MetaGPT 작업 수 (기본 2, 초과분은 대기열)
+    METAGPT_JOB_TIMEOUT_SECONDS: 작업 하나의 최대 실행 시간 (기본 1200초)
+    METAGPT_JOB_RETENTION_SECONDS: 완료된 작업 상태 보관 시간 (기본 3600초)
+    """
+    store = MetaGPTJobStore(retention_seconds=float(os.getenv('METAGPT_JOB_RETENTION_SECONDS', '3600')))
+    return MetaGPTJobRunner(
+        store,
+        max_concurrent=int(os.getenv('METAGPT_JOB_MAX_CONCURRENT', '2')),
+        timeout=float(os.getenv('METAGPT_JOB_TIMEOUT_SECONDS', '1200')),
+        on_complete=on_complete
+    )
@@ -0,0 +1,481 @@
+# -*- coding: utf-8 -*-
+"""
+MetaGPT 워커 풀 (MetaGPT Worker Pool)
+run_step_by_step.py를 단계마다 새 프로세스로 띄우지 않고, import를 유지한 상주 워커 프로세스에서 실행
+Flask <-> 워커는 stdin/stdout JSON Lines 프로토콜, 세션별로 같은 워커에 고정(affinity)하여 단계 간 메모리 상태 재사용
+
+워커 프로토콜 (한 줄에 JSON 하나):
+    요청: {"id", "op": "run", "session_id", "argv": [...], "drop_sessions": [...]}
+    응답: {"id", "returncode", "stdout", "stderr", "duration_seconds"}
+    시작 시 워커가 {"type": "ready", "pid"} 한 줄을 먼저 보냄
+
+스크립트는 워커 안에서 `__name__ == '__main__'`으로 실행되며 sys.argv는 기존 CLI 인자와 동일.
+전역 METAGPT_SESSION(dict)은 같은 세션의 다음 단계 실행 때 그대로 전달됨.
+세션 ID는 클라이언트마다 new_session_id()로 발급하며, 워커가 재시작되면 그 워커의 세션 상태는 사라짐
+"""
+
+import os
+import sys
+import json
+import time
+import queue
+import uuid
+import atexit
+import threading
+import subprocess
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+import logging
+
+logger = logging.getLogger(__name__)
+
+# 워커가 준비 신호를 보낼 때까지 기다리는 최대 시간 (초)
+WORKER_START_TIMEOUT = 30.0
+
+# 배정된 워커가 다른 요청을 처리 중일 때 기다리는 최대 시간 (초) - 단계 제한 시간에서 차감
+WORKER_BUSY_WAIT = 5.0
+
+# 워커 시작 시 미리 import할 모듈 (없으면 건너뜀)
+PRELOAD_MODULES = ['metagpt']
+
+
+class MetaGPTWorkerError(Exception):
+    """워커 프로세스 시작/통신 실패"""
+
+
+class MetaGPTSessionLostError(MetaGPTWorkerError):
+    """세션이 배정된 워커가 재시작되어 이전 단계의 세션 상태가 사라짐"""
+
+
+class MetaGPTWorkerBusyError(MetaGPTWorkerError):
+    """배정된 워커가 다른 요청을 처리 중이라 대기 시간 안에 실행하지 못함"""
+
+
+def new_session_id() -> str:
+    """클라이언트별 세션 ID 발급 (요구사항이 같아도 사용자끼리 상태를 공유하지 않음)"""
+    return 'sess-' + uuid.uuid4().hex
+
+
+def build_step_argv(script_path: str, requirement: str, step_number: Any,
+                    user_input: Optional[Dict] = None) -> List[str]:
+    """기존 run_step_by_step.py CLI 인자 (요구사항, 단계 번호, [사용자 입력 JSON])"""
+    argv = [script_path, requirement, str(step_number)]
+    if user_input:
+        argv.append(json.dumps(user_input))
+    return argv
+
+
+class MetaGPTWorker:
+    """상주 워커 프로세스 하나 (한 번에 요청 하나만 처리)"""
+
+    def __init__(self, index: int, script_path: str, start_timeout: float = WORKER_START_TIMEOUT):
+        self.index = index
+        self.script_path = script_path
+        self.start_timeout = start_timeout
+
+        self.process: Optional[subprocess.Popen] = None
+        self._responses: Optional[queue.Queue] = None
+        self._next_id = 0
+        # 프로세스 세대 - 재시작될 때마다 증가 (세션 상태 유효성 확인용)
+        self.generation = 0
+        # 요청 직렬화용 (프로세스 stdin/stdout은 동시에 한 요청만 사용)
+        self.lock = threading.Lock()
+        self.stats = {'requests': 0, 'starts': 0, 'timeouts': 0, 'crashes': 0, 'busy_rejections': 0,
+                      'last_duration_seconds': None}
+
+    def is_alive(self) -> bool:
+        return self.process is not None and self.process.poll() is None
+
+    def _start_locked(self) -> None:
+        """워커 프로세스 시작 후 준비 신호 대기"""
+        self._stop_locked()
+
+        process = subprocess.Popen(
+            [sys.executable, os.path.abspath(__file__), self.script_path],
+            stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=None,
+            text=True, encoding='utf-8', errors='replace', bufsize=1
+        )
+        responses: queue.Queue = queue.Queue()
+        threading.Thread(
+            target=self._read_responses, args=(process, responses),
+            daemon=True, name=f'metagpt-worker-{self.index}-reader'
+        ).start()
+
+        try:
+            ready = responses.get(timeout=self.start_timeout)
+        except queue.Empty:
+            ready = None
+        if not ready or ready.get('type') != 'ready':
+            process.kill()
+            raise MetaGPTWorkerError(f"MetaGPT 워커 {self.index} 시작 실패")
+
+        self.process = process
+        self._responses = responses
+        self.generation += 1
+        self.stats['starts'] += 1
+        logger.info(f"MetaGPT 워커 {self.index} 시작 (pid={ready.get('pid')})")
+
+    @staticmethod
+    def _read_responses(process: subprocess.Popen, responses: queue.Queue) -> None:
+        """워커 stdout의 JSON 줄을 큐로 전달 (종료 시 None)"""
+        for line in process.stdout:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                responses.put(json.loads(line))
+            except json.JSONDecodeError:
+                logger.warning(f"MetaGPT 워커 응답 파싱 실패: {line[:200]}")
+        responses.put(None)
+
+    def is_busy(self) -> bool:
+        return self.lock.locked()
+
+    def call(self, session_id: str, argv: List[str], timeout: float,
+             drop_sessions: Optional[List[str]] = None,
+             generation: Optional[int] = None,
+             busy_wait: float = WORKER_BUSY_WAIT) -> Tuple[subprocess.CompletedProcess, int]:
+        """
+        스크립트 한 단계 실행 - (결과, 실행한 프로세스 세대) 반환
+
+        워커가 다른 요청을 처리 중이면 최대 busy_wait초(단계 제한 시간 이내)만 기다리고
+        MetaGPTWorkerBusyError 발생 - 기다린 시간은 timeout에서 차감.
+        generation을 주면 그 세대의 프로세스에서만 실행 (재시작되었으면 MetaGPTSessionLostError).
+        타임아웃 시 워커를 종료하고(다음 요청에서 재시작) subprocess.TimeoutExpired 발생
+        """
+        call_started = time.perf_counter()
+        if not self.lock.acquire(timeout=max(0.0, min(busy_wait, timeout))):
+            self.stats['busy_rejections'] += 1
+            raise MetaGPTWorkerBusyError(f"MetaGPT 워커 {self.index}가 다른 요청을 처리 중입니다")
+        try:
+            remaining = timeout - (time.perf_counter() - call_started)
+            if remaining <= 0:
+                # 대기만으로 제한 시간을 다 씀 - 실행 전이므로 워커는 그대로 둠
+                raise subprocess.TimeoutExpired(argv, timeout)
+            return self._call_locked(session_id, argv, remaining, drop_sessions, generation)
+        finally:
+            self.lock.release()
+
+    def _call_locked(self, session_id: str, argv: List[str], timeout: float,
+                     drop_sessions: Optional[List[str]], generation: Optional[int]) -> Tuple[subprocess.CompletedProcess, int]:
+        """lock을 잡은 상태에서 요청 전송 후 응답 대기 (timeout = 대기 후 남은 제한 시간)"""
+        if not self.is_alive():
+            if self.process is not None:
+                self.stats['crashes'] += 1
+            self._start_locked()
+
+        if generation is not None and generation != self.generation:
+            raise MetaGPTSessionLostError(
+                f"MetaGPT 워커 {self.index}가 재시작되어 세션 {session_id}의 상태가 사라졌습니다"
+            )
+
+        self._next_id += 1
+        request_id = self._next_id
+        request = {
+            'id': request_id,
+            'op': 'run',
+            'session_id': session_id,
+            'argv': argv,
+            'drop_sessions': drop_sessions or []
+        }
+
+        started = time.perf_counter()
+        try:
+            self.process.stdin.write(json.dumps(request, ensure_ascii=False) + '\n')
+            self.process.stdin.flush()
+        except (BrokenPipeError, OSError) as e:
+            self.stats['crashes'] += 1
+            self._stop_locked()
+            raise MetaGPTWorkerError(f"MetaGPT 워커 {self.index} 요청 전송 실패: {str(e)}")
+
+        deadline = started + timeout
+        while True:
+            remaining = deadline - time.perf_counter()
+            try:
+                if remaining <= 0:
+                    raise queue.Empty
+                response = self._responses.get(timeout=remaining)
+            except queue.Empty:
+                self.stats['timeouts'] += 1
+                self._stop_locked()
+                raise subprocess.TimeoutExpired(argv, timeout)
+
+            if response is None:
+                self.stats['crashes'] += 1
+                self._stop_locked()
+                raise MetaGPTWorkerError(f"MetaGPT 워커 {self.index}가 실행 중 종료되었습니다")
+            if response.get('id') == request_id:
+                break
+
+        self.stats['requests'] += 1
+        self.stats['last_duration_seconds'] = round(time.perf_counter() - started, 3)
+        result = subprocess.CompletedProcess(
+            argv, response.get('returncode', 1),
+            response.get('stdout', ''), response.get('stderr', '')
+        )
+        return result, self.generation
+
+    def _stop_locked(self) -> None:
+        process, self.process, self._responses = self.process, None, None
+        if process is None:
+            return
+        try:
+            if process.poll() is None:
+                process.kill()
+            process.wait(timeout=5)
+        except Exception:
+            pass
+
+    def stop(self) -> None:
+        with self.lock:
+            self._stop_locked()
+
+
+class MetaGPTWorkerPool:
+    """세션 고정(affinity) MetaGPT 워커 풀 - 워커는 첫 요청 시 시작"""
+
+    def __init__(self, script_path: str, size: int = 2, max_sessions: int = 256,
+                 session_ttl: float = 1800.0, start_timeout: float = WORKER_START_TIMEOUT,
+                 busy_wait: float = WORKER_BUSY_WAIT):
+        self.script_path = script_path
+        self.max_sessions = max_sessions
+        self.session_ttl = session_ttl
+        self.busy_wait = busy_wait
+        self.workers = [MetaGPTWorker(index, script_path, start_timeout) for index in range(max(1, size))]
+
+        # 세션 ID -> (워커 번호, 마지막 사용 시각, 워커 프로세스 세대 또는 None=첫 단계 실행 전) - 오래된 순
+        self._sessions: "OrderedDict[str, tuple]" = OrderedDict()
+        # 워커 번호 -> 다음 요청 때 워커에 알릴 만료 세션 목록
+        self._dropped: Dict[int, List[str]] = {worker.index: [] for worker in self.workers}
+        self._lock = threading.Lock()
+        self._stats = {'session_hits': 0, 'session_misses': 0, 'sessions_expired': 0, 'sessions_lost': 0}
+
+    def _assign_worker(self, session_id: str, require_session: bool = False) -> Tuple[MetaGPTWorker, Optional[int]]:
+        """
+        세션이 이미 배정된 워커와 세션 상태가 있는 프로세스 세대,
+        없으면 유휴 워커 중 세션이 가장 적은 워커 (모두 실행 중이면 세션이 가장 적은 워커)
+
+        require_session이면 모르는 세션(만료/유실/잘못된 ID)에 새 워커를 배정하지 않고 MetaGPTSessionLostError
+        """
+        now = time.time()
+        with self._lock:
+            self._expire_sessions_locked(now)
+
+            entry = self._sessions.get(session_id)
+            if entry is not None:
+                index, _, generation = entry
+                self._stats['session_hits'] += 1
+            elif require_session:
+                self._stats['sessions_lost'] += 1
+                raise MetaGPTSessionLostError(f"세션 {session_id}의 상태가 없습니다 (만료 또는 워커 재시작)")
+            else:
+                loads = {worker.index: 0 for worker in self.workers}
+                for assigned, _, _ in self._sessions.values():
+                    loads[assigned] += 1
+                busy = {worker.index: worker.is_busy() for worker in self.workers}
+                index = min(loads, key=lambda i: (busy[i], loads[i], i))
+                generation = None
+                self._stats['session_misses'] += 1
+
+            self._sessions[session_id] = (index, now, generation)
+            self._sessions.move_to_end(session_id)
+            while len(self._sessions) > self.max_sessions:
+                self._drop_session_locked(*self._sessions.popitem(last=False))
+            return self.workers[index], generation
+
+    def _expire_sessions_locked(self, now: float) -> None:
+        while self._sessions:
+            session_id, entry = next(iter(self._sessions.items()))
+            if now - entry[1] <= self.session_ttl:
+                break
+            self._sessions.popitem(last=False)
+            self._drop_session_locked(session_id, entry)
+
+    def _drop_session_locked(self, session_id: str, entry: tuple) -> None:
+        if entry[2] is not None:
+            self._dropped[entry[0]].append(session_id)
+        self._stats['sessions_expired'] += 1
+
+    def run_step(self, session_id: str, requirement: str, step_number: Any,
+                 user_input: Optional[Dict] = None, timeout: float = 60.0,
+                 require_session: bool = False) -> subprocess.CompletedProcess:
+        """
+        run_step_by_step.py 한 단계 실행 (subprocess.run과 같은 결과/예외 형태)
+
+        Args:
+            session_id: 클라이언트별 세션 ID (new_session_id()로 발급한 값)
+            timeout: 워커 대기 시간을 포함한 단계 제한 시간
+            require_session: 이전 단계를 이어가는 요청 - 풀이 모르는 세션이면 실행하지 않음
+
+        Raises:
+            subprocess.TimeoutExpired: 제한 시간 초과 (실행 중이었다면 해당 워커는 재시작됨)
+            MetaGPTSessionLostError: 세션을 모르거나 세션의 워커가 재시작되어 이전 단계 상태가 없음
+                (새 세션으로 다시 시작해야 함)
+            MetaGPTWorkerBusyError: 세션의 워커가 다른 요청을 처리 중 (잠시 후 다시 시도)
+            MetaGPTWorkerError: 워커 시작/통신 실패
+        """
+        if not session_id:
+            raise ValueError('session_id가 필요합니다 (new_session_id()로 발급)')
+
+        worker, generation = self._assign_worker(session_id, require_session)
+        argv = build_step_argv(self.script_path, requirement, step_number, user_input)
+
+        with self._lock:
+            drop_sessions, self._dropped[worker.index] = self._dropped[worker.index], []
+        try:
+            result, alive_generation = worker.call(session_id, argv, timeout, drop_sessions, generation,
+                                                   busy_wait=self.busy_wait)
+        except MetaGPTSessionLostError:
+            # 같은 워커의 다른 세션도 각자 다음 요청 때 세대 불일치로 유실이 보고됨
+            with self._lock:
+                self._sessions.pop(session_id, None)
+                self._stats['sessions_lost'] += 1
+            raise
+        except (subprocess.TimeoutExpired, MetaGPTWorkerError):
+            # 워커가 종료됨 - 기존 세션들은 다음 요청 때 세대 불일치로 세션 유실 처리, 첫 단계였던 세션만 제거
+            # (워커 대기 중 실패한 경우에도 기존 세션은 그대로 유지)
+            if generation is None:
+                with self._lock:
+                    self._sessions.pop(session_id, None)
+            raise
+
+        with self._lock:
+            entry = self._sessions.get(session_id)
+            if entry is not None:
+                self._sessions[session_id] = (entry[0], entry[1], alive_generation)
+        return result
+
+    def shutdown(self) -> None:
+        for worker in self.workers:
+            worker.stop()
+
+    def get_stats(self) -> Dict:
+        with self._lock:
+            stats = dict(self._stats)
+            stats['active_sessions'] = len(self._sessions)
+        stats['script_path'] = self.script_path
+        stats['workers'] = [
+            dict(worker.stats, index=worker.index, alive=worker.is_alive(),
+                 pid=worker.process.pid if worker.is_alive() else None)
+            for worker in self.workers
+        ]
+        return stats
+
+
+def run_step_subprocess(script_path: str, requirement: str, step_number: Any,
+                        user_input: Optional[Dict] = None, timeout: float = 60.0) -> subprocess.CompletedProcess:
+    """워커 풀을 사용하지 않을 때의 기존 방식 (단계마다 새 프로세스)"""
+    argv = build_step_argv(script_path, requirement, step_number, user_input)
+    return subprocess.run([sys.executable] + argv, capture_output=True, text=True, timeout=timeout)
+
+
+def create_metagpt_worker_pool_from_env(script_path: str) -> Optional[MetaGPTWorkerPool]:
+    """환경변수 기반 워커 풀 생성 (프로세스는 첫 요청 시 시작)
+
+    METAGPT_WORKER_POOL_SIZE: 상주 워커 수 (기본 2, 0이면 단계마다 새 프로세스 실행)
+    METAGPT_WORKER_SESSION_TTL_SECONDS: 세션 상태 유지 시간 (기본 1800초)
+    METAGPT_WORKER_MAX_SESSIONS: 동시에 유지할 최대 세션 수 (기본 256)
+    METAGPT_WORKER_BUSY_WAIT_SECONDS: 세션의 워커가 실행 중일 때 기다리는 최대 시간 (기본 5초)
+    """
+    size = int(os.getenv('METAGPT_WORKER_POOL_SIZE', '2'))
+    if size <= 0:
+        return None
+
+    pool = MetaGPTWorkerPool(
+        script_path,
+        size=size,
+        max_sessions=int(os.getenv('METAGPT_WORKER_MAX_SESSIONS', '256')),
+        session_ttl=float(os.getenv('METAGPT_WORKER_SESSION_TTL_SECONDS', '1800')),
+        busy_wait=float(os.getenv('METAGPT_WORKER_BUSY_WAIT_SECONDS', str(WORKER_BUSY_WAIT)))
+    )
+    atexit.register(pool.shutdown)
+    return pool
+
+
+# ==================== 워커 프로세스 ====================
+
+def _load_script(script_path: str, cache: Dict) -> Any:
+    """스크립트 컴파일 결과 캐시 (파일 수정 시 다시 컴파일)"""
+    mtime = os.stat(script_path).st_mtime_ns
+    if cache.get('mtime') != mtime:
+        with open(script_path, 'r', encoding='utf-8') as f:
+            cache['code'] = compile(f.read(), script_path, 'exec')
+        cache['mtime'] = mtime
+    return cache['code']
+
+
+def _run_script(script_path: str, argv: List[str], session: Dict, cache: Dict) -> Dict:
+    """스크립트를 __main__으로 실행하고 stdout/stderr/종료 코드 수집"""
+    import io
+    import traceback
+    from contextlib import redirect_stdout, redirect_stderr
+
+    stdout, stderr = io.StringIO(), io.StringIO()
+    returncode = 0
+    saved_argv = sys.argv
+    sys.argv = list(argv)
+    try:
+        with redirect_stdout(stdout), redirect_stderr(stderr):
+            try:
+                code = _load_script(script_path, cache)
+                exec(code, {
+                    '__name__': '__main__',
+                    '__file__': script_path,
+                    '__builtins__': __builtins__,
+                    'METAGPT_SESSION': session
+                })
+            except SystemExit as e:
+                if isinstance(e.code, int):
+                    returncode = e.code
+                elif e.code is not None:
+                    print(e.code, file=sys.stderr)
+                    returncode = 1
+            except BaseException:
+                traceback.print_exc()
+                returncode = 1
+    finally:
+        sys.argv = saved_argv
+
+    return {'returncode': returncode, 'stdout': stdout.getvalue(), 'stderr': stderr.getvalue()}
+
+
+def _worker_main(script_path: str) -> None:
+    """워커 프로세스 진입점 - stdin 요청을 순서대로 처리"""
+    # 프로토콜 전용 출력 확보 후, 라이브러리가 직접 쓰는 stdout은 stderr로 돌림
+    protocol = os.fdopen(os.dup(1), 'w', encoding='utf-8', buffering=1)
+    os.dup2(2, 1)
+
+    script_dir = os.path.dirname(os.path.abspath(script_path))
+    sys.path.insert(0, script_dir)
+    for module_name in PRELOAD_MODULES:
+        try:
+            __import__(module_name)
+        except Exception:
+            pass
+
+    def send(message: Dict) -> None:
+        protocol.write(json.dumps(message, ensure_ascii=False) + '\n')
+        protocol.flush()
+
+    sessions: Dict[str, Dict] = {}
+    code_cache: Dict = {}
+    send({'type': 'ready', 'pid': os.getpid()})
+
+    for line in sys.stdin:
+        line = line.strip()
+        if not line:
+            continue
+        request = json.loads(line)
+        for session_id in request.get('drop_sessions', []):
+            sessions.pop(session_id, None)
+
+        started = time.perf_counter()
+        session = sessions.setdefault(request.get('session_id') or '', {})
+        result = _run_script(script_path, request['argv'], session, code_cache)
+        result['id'] = request.get('id')
+        result['duration_seconds'] = round(time.perf_counter() - started, 3)
+        send(result)
+
+
+if __name__ == '__main__':
+    _worker_main(sys.argv[1])
@@ -0,0 +1,216 @@
+# -*- coding: utf-8 -*-
+"""
+LLM 모델 카탈로그 (Model Catalog)
+클라우드 모델 목록과 Ollama 로컬 모델을 백그라운드에서 주기적으로 갱신하고, 요청에는 캐시된 스냅샷(ETag 포함)을 제공
+"""
+
+import os
+import json
+import time
+import hashlib
+import threading
+from typing import Any, Callable, Dict, List, Optional, Tuple
+import logging
+
+logger = logging.getLogger(__name__)
+
+# 화면 표시용 모델명
+FRIENDLY_NAMES = {
+    'gpt-4': 'GPT-4',
+    'gpt-3.5-turbo': 'GPT-3.5 Turbo',
+    'gemini-2.5-flash': 'Gemini 2.5 Flash',
+    'gemini-2.5-pro': 'Gemini 2.5 Pro',
+    'gemini-flash': 'Gemini Flash',
+    'gemini-pro': 'Gemini Pro',
+    'claude-3': 'Claude-3 Sonnet',
+    'claude-3-opus': 'Claude-3 Opus',
+    'deepseek-coder': 'DeepSeek Coder'
+}
+
+# 모델 설명
+DESCRIPTIONS = {
+    'gpt-4': '범용 고성능 모델',
+    'gpt-3.5-turbo': '빠른 응답 범용 모델',
+    'gemini-2.5-flash': '최신 고속 멀티모달 모델',
+    'gemini-2.5-pro': '최신 고성능 추론 모델',
+    'gemini-flash': '빠른 응답 멀티모달 모델',
+    'gemini-pro': '균형잡힌 멀티모달 모델',
+    'claude-3': '추론 특화 모델',
+    'claude-3-opus': '최고 품질 창작 모델',
+    'deepseek-coder': '코딩 전문 모델'
+}
+
+
+def build_cloud_models(allocator) -> List[Dict]:
+    """SmartModelAllocator 설정으로 클라우드 모델 목록 생성"""
+    cloud_models = []
+    for model_name in allocator.get_available_models():
+        model_info = allocator.get_model_info(model_name)
+        if not model_info:
+            continue
+
+        strengths = model_info.get('strengths', [])
+        cloud_models.append({
+            'id': model_name,
+            'name': FRIENDLY_NAMES.get(model_name, model_name.title()),
+            'description': DESCRIPTIONS.get(model_name, strengths[0] if strengths else '범용 모델'),
+            'provider': model_info['api_provider'].title(),
+            'type': 'cloud',
+            'cost_level': model_info.get('cost_level', 'medium'),
+            'speed_level': model_info.get('speed_level', 'medium'),
+            'strengths': strengths,
+            'env_key': model_info.get('env_key', ''),
+            'available': allocator.check_model_availability(model_name)
+        })
+    return cloud_models
+
+
+class ModelCatalog:
+    """주기적으로 갱신되는 모델 목록 스냅샷"""
+
+    def __init__(self,
+                 allocator_getter: Callable[[], Any],
+                 ollama_client: Any,
+                 refresh_interval: float = 30.0):
+        self.allocator_getter = allocator_getter
+        self.ollama_client = ollama_client
+        self.refresh_interval = refresh_interval
+
+        self._snapshot: Optional[Dict] = None
+        self._etag: Optional[str] = None
+        self._cloud_signature: Optional[Tuple] = None
+        self._local_models: List[Dict] = []
+        self._ollama_available = False
+
+        self._lock = threading.Lock()
+        self._refresh_lock = threading.Lock()
+        self._wake_event = threading.Event()
+        # 첫 Ollama 조회가 끝나기 전에는 클라우드 모델만 담긴 스냅샷 제공
+        self._local_loaded = False
+        self._thread: Optional[threading.Thread] = None
+        self._stats = {'refreshes': 0, 'refresh_errors': 0, 'last_refresh_seconds': None}
+
+    # ==================== 조회 ====================
+
+    def get_snapshot(self) -> Tuple[Dict, str]:
+        """
+        현재 스냅샷과 ETag 반환
+
+        Ollama 조회는 요청 스레드에서 하지 않음 - 백그라운드 스레드의 첫 갱신 전에는 클라우드 모델만 반환.
+        클라우드 모델은 네트워크 호출이 없으므로 설정/환경변수가 바뀌면 즉시 다시 구성
+        """
+        self._ensure_worker()
+
+        allocator = self.allocator_getter()
+        if self._snapshot is None or self._make_cloud_signature(allocator) != self._cloud_signature:
+            with self._lock:
+                self._publish_locked(allocator)
+
+        with self._lock:
+            return self._snapshot, self._etag
+
+    def request_refresh(self) -> None:
+        """다음 주기를 기다리지 않고 백그라운드 갱신 요청 (요청 스레드는 기다리지 않음)"""
+        self._ensure_worker()
+        self._wake_event.set()
+
+    # ==================== 갱신 ====================
+
+    def refresh(self) -> None:
+        """Ollama 모델 목록 조회 후 스냅샷 교체 (동시 갱신은 하나만 수행)"""
+        with self._refresh_lock:
+            started = time.perf_counter()
+            local_models, ollama_available = self._fetch_local_models()
+            allocator = self.allocator_getter()
+
+            with self._lock:
+                self._local_models = local_models
+                self._ollama_available = ollama_available
+                self._local_loaded = True
+                self._publish_locked(allocator)
+                self._stats['refreshes'] += 1
+                self._stats['last_refresh_seconds'] = round(time.perf_counter() - started, 3)
+
+    def _fetch_local_models(self) -> Tuple[List[Dict], bool]:
+        """Ollama 모델 조회 - 태그 조회 한 번으로 가용성까지 판단"""
+        try:
+            result = self.ollama_client.get_models()
+        except Exception as e:
+            logger.warning(f"Ollama 모델 목록 갱신 실패: {str(e)}")
+            self._stats['refresh_errors'] += 1
+            return [], False
+
+        if not result.get('success'):
+            return [], False
+
+        local_models = []
+        for model in result.get('models', []):
+            model = dict(model)
+            model['type'] = 'local'
+            model['available'] = True
+            local_models.append(model)
+        return local_models, True
+
+    def _publish_locked(self, allocator) -> None:
+        cloud_models = build_cloud_models(allocator)
+        all_models = cloud_models + self._local_models
+
+        snapshot = {
+            'success': True,
+            'models': all_models,
+            'count': len(all_models),
+            'cloud_count': len(cloud_models),
+            'local_count': len(self._local_models),
+            'ollama_available': self._ollama_available,
+            'local_models_loading': not self._local_loaded,
+            'available_models': len([m for m in all_models if m.get('available', True)]),
+            'env_status': allocator.env_status
+        }
+
+        body = json.dumps(snapshot, sort_keys=True, ensure_ascii=False, default=str)
+        self._snapshot = snapshot
+        self._etag = hashlib.sha256(body.encode('utf-8')).hexdigest()[:32]
+        self._cloud_signature = self._make_cloud_signature(allocator)
+
+    @staticmethod
+    def _make_cloud_signature(allocator) -> Tuple:
+        stats = allocator.get_stats()
+        return (id(allocator), stats['config_version'], tuple(allocator.env_status['available_keys']))
+
+    # ==================== 백그라운드 스레드 ====================
+
+    def _ensure_worker(self) -> None:
+        if self._thread is not None and self._thread.is_alive():
+            return
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._thread = threading.Thread(target=self._run, daemon=True, name='model-catalog-refresh')
+            self._thread.start()
+
+    def _run(self) -> None:
+        # 시작 직후 첫 스냅샷을 만들고, 이후 주기마다 (또는 갱신 요청 시) 다시 조회
+        while True:
+            try:
+                self.refresh()
+            except Exception as e:
+                self._stats['refresh_errors'] += 1
+                logger.error(f"모델 카탈로그 갱신 오류: {str(e)}")
+            self._wake_event.wait(self.refresh_interval)
+            self._wake_event.clear()
+
+    def get_stats(self) -> Dict:
+        with self._lock:
+            stats = dict(self._stats)
+            stats['refresh_interval'] = self.refresh_interval
+            stats['etag'] = self._etag
+        return stats
+
+
+def create_model_catalog_from_env(allocator_getter: Callable[[], Any], ollama_client: Any) -> ModelCatalog:
+    """환경변수 기반 카탈로그 생성
+
+    MODEL_CATALOG_REFRESH_SECONDS: Ollama/클라우드 모델 목록 갱신 주기 (기본 30초)
+    """
+    refresh_interval = float(os.getenv('MODEL_CATALOG_REFRESH_SECONDS', '30'))
+    return ModelCatalog(allocator_getter, ollama_client, refresh_interval=refresh_interval)
@@ -4,12 +4,13 @@ Ollama Local LLM Client
 로컬 Ollama 서비스와의 통신을 위한 클라이언트
 """
 
-import requests
 import json
 import time
 from typing import Dict, List, Any, Optional, Generator
 from datetime import datetime
 
+from llm_http import llm_transport
+
 class OllamaClient:
     """Ollama 로컬 LLM 클라이언트"""
 
@@ -20,7 +21,7 @@ class OllamaClient:
     def is_available(self) -> bool:
         """Ollama 서비스 가용성 확인"""
         try:
-            response = requests.get(f"{self.api_url}/tags", timeout=5)
+            response = llm_transport.get('ollama', 'tags', f"{self.api_url}/tags")
             return response.status_code == 200
         except:
             return False
@@ -28,7 +29,7 @@ class OllamaClient:
     def get_models(self) -> Dict[str, Any]:
         """사용 가능한 모델 목록 조회"""
         try:
-            response = requests.get(f"{self.api_url}/tags", timeout=10)
+            response = llm_transport.get('ollama', 'tags', f"{self.api_url}/tags")
             if response.status_code == 200:
                 data = response.json()
                 models = []
@@ -82,10 +83,10 @@ class OllamaClient:
             if system:
                 payload['system'] = system
 
-            response = requests.post(
+            response = llm_transport.post(
+                'ollama', 'generate',
                 f"{self.api_url}/generate",
-                json=payload,
-                timeout=60
+                json=payload
             )
 
             if response.status_code == 200:
@@ -131,11 +132,11 @@ class OllamaClient:
             if system:
                 payload['system'] = system
 
-            response = requests.post(
+            response = llm_transport.post(
+                'ollama', 'generate',
                 f"{self.api_url}/generate",
                 json=payload,
-                stream=True,
-                timeout=60
+                stream=True
             )
 
             if response.status_code == 200:
@@ -183,10 +184,10 @@ class OllamaClient:
                 }
             }
 
-            response = requests.post(
+            response = llm_transport.post(
+                'ollama', 'chat',
                 f"{self.api_url}/chat",
-                json=payload,
-                timeout=60
+                json=payload
             )
 
             if response.status_code == 200:
@@ -223,10 +224,10 @@ class OllamaClient:
     def pull_model(self, model_name: str) -> Dict[str, Any]:
         """모델 다운로드"""
         try:
-            response = requests.post(
+            response = llm_transport.post(
+                'ollama', 'pull',
                 f"{self.api_url}/pull",
-                json={'name': model_name},
-                timeout=300  # 5분 타임아웃
+                json={'name': model_name}  # 5분 타임아웃 (ENDPOINT_TIMEOUTS)
             )
 
             if response.status_code == 200:
@@ -251,10 +252,10 @@ class OllamaClient:
     def delete_model(self, model_name: str) -> Dict[str, Any]:
         """모델 삭제"""
         try:
-            response = requests.delete(
+            response = llm_transport.delete(
+                'ollama', 'delete',
                 f"{self.api_url}/delete",
-                json={'name': model_name},
-                timeout=30
+                json={'name': model_name}
             )
 
             if response.status_code == 200:
@@ -279,10 +280,10 @@ class OllamaClient:
     def get_model_info(self, model_name: str) -> Dict[str, Any]:
         """특정 모델 정보 조회"""
         try:
-            response = requests.post(
+            response = llm_transport.post(
+                'ollama', 'show',
                 f"{self.api_url}/show",
-                json={'name': model_name},
-                timeout=10
+                json={'name': model_name}
             )
 
             if response.status_code == 200:
@@ -43,6 +43,7 @@
     let selectedFramework = activeFrameworkBtn && activeFrameworkBtn.dataset.framework ? activeFrameworkBtn.dataset.framework : 'crewai';
     let currentModel = 'gemini-2.5-flash';
     let suggestedRequirement = null;
+    let chatSessionId = null;
     let currentProjectId = null;
     let agents = [];
     let editingAgentOrder = null;
@@ -54,6 +55,7 @@
           framework: selectedFramework,
           history: conversationHistory,
           requirement: suggestedRequirement,
+          sessionId: chatSessionId,
           timestamp: new Date().toISOString()
         };
         localStorage.setItem(`pre_analysis_${selectedFramework}`, JSON.stringify(data));
@@ -71,6 +73,7 @@
         const data = JSON.parse(saved);
         conversationHistory = Array.isArray(data.history) ? [...data.history] : [];
         suggestedRequirement = data.requirement || null;
+        chatSessionId = data.sessionId || null;
         restoreMessages();
         if (suggestedRequirement) {
           finalRequirementText.textContent = suggestedRequirement;
@@ -118,6 +121,86 @@
       }
     }
 
+    function createStreamingMessage() {
+      const wrapper = document.createElement('div');
+      wrapper.className = 'message ai';
+      wrapper.innerHTML = '<div class="message-icon">🤖</div><div class="message-bubble"></div>';
+      messagesArea.appendChild(wrapper);
+      const bubble = wrapper.querySelector('.message-bubble');
+      let text = '';
+      return {
+        append(chunk) {
+          text += chunk;
+          bubble.innerHTML = text.replace(/\n/g, '<br>');
+          messagesArea.scrollTop = messagesArea.scrollHeight;
+        },
+        finish(finalText) {
+          text = finalText || text || '응답을 받을 수 없습니다.';
+          bubble.innerHTML = text.replace(/\n/g, '<br>');
+          conversationHistory.push({ role: 'ai', content: text });
+          saveConversation();
+        },
+        remove() {
+          wrapper.remove();
+        },
+        hasContent() {
+          return text.length > 0;
+        }
+      };
+    }
+
+    async function streamChat(payload, onEvent) {
+      const request = body => fetch('/api/pre-analysis/chat/stream', {
+        method: 'POST',
+        headers: { 'Content-Type': 'application/json', 'Accept': 'text/event-stream' },
+        body: JSON.stringify(body)
+      });
+
+      let response = await request(payload);
+      if (response.status === 409) {
+        // 서버 세션 만료 - 전체 이력으로 새 세션 생성
+        response = await request({ ...payload, sessionId: null, conversationHistory });
+      }
+
+      if (!response.ok || !response.body) {
+        const errorData = await response.json().catch(() => ({ }));
+        throw new Error(errorData.error || `HTTP ${response.status}`);
+      }
+
+      const reader = response.body.getReader();
+      const decoder = new TextDecoder('utf-8');
+      let buffer = '';
+
+      while (true) {
+        const { value, done } = await reader.read();
+        if (done) break;
+        buffer += decoder.decode(value, { stream: true });
+
+        let boundary;
+        while ((boundary = buffer.indexOf('\n\n')) !== -1) {
+          const rawEvent = buffer.slice(0, boundary);
+          buffer = buffer.slice(boundary + 2);
+
+          let eventName = 'message';
+          let dataText = '';
+          rawEvent.split('\n').forEach(line => {
+            if (line.startsWith('event:')) eventName = line.slice(6).trim();
+            else if (line.startsWith('data:')) dataText += line.slice(5).trim();
+          });
+          if (dataText) {
+            onEvent(eventName, JSON.parse(dataText));
+          }
+        }
+      }
+    }
+
+    function showSuggestedRequirement(requirement) {
+      suggestedRequirement = requirement;
+      finalRequirementText.textContent = suggestedRequirement;
+      finalizeSection.classList.add('show');
+      saveConversation();
+    }
+
     async function sendMessage() {
       const message = userInput.value.trim();
       if (!message) return;
@@ -129,34 +212,52 @@
       }
       sendBtn.disabled = true;
 
+      const streamingMessage = createStreamingMessage();
+
       try {
-        const response = await fetch('/api/pre-analysis/chat', {
-          method: 'POST',
-          headers: { 'Content-Type': 'application/json' },
-          body: JSON.stringify({
-            userMessage: message,
-            conversationHistory,
-            model: currentModel
-          })
+        let finalData = null;
+        let streamError = null;
+
+        // 세션이 있으면 이력은 서버에 있으므로 새 메시지만 전송
+        await streamChat({
+          userMessage: message,
+          sessionId: chatSessionId,
+          historyLength: conversationHistory.length,
+          conversationHistory: chatSessionId ? [] : conversationHistory,
+          model: currentModel
+        }, (eventName, data) => {
+          if (eventName === 'session') {
+            chatSessionId = data.sessionId || null;
+          } else if (eventName === 'token') {
+            if (loadingIndicator) {
+              loadingIndicator.classList.remove('show');
+            }
+            streamingMessage.append(data.content || '');
+          } else if (eventName === 'requirement' && data.suggestedRequirement) {
+            finalRequirementText.textContent = data.suggestedRequirement;
+            finalizeSection.classList.add('show');
+          } else if (eventName === 'done') {
+            finalData = data;
+          } else if (eventName === 'error') {
+            streamError = new Error(data.error || '스트리밍 오류');
+          }
         });
 
-        if (!response.ok) {
-          const errorData = await response.json().catch(() => ({ }));
-          throw new Error(errorData.error || `HTTP ${response.status}`);
+        if (streamError) {
+          throw streamError;
         }
 
-        const data = await response.json();
-        const aiMessage = data.analysis || '응답을 받을 수 없습니다.';
-        addMessage('ai', aiMessage);
+        const data = finalData || {};
+        streamingMessage.finish(data.analysis);
 
         if (data.canFinalize && data.suggestedRequirement) {
-          suggestedRequirement = data.suggestedRequirement;
-          finalRequirementText.textContent = suggestedRequirement;
-          finalizeSection.classList.add('show');
-          saveConversation();
+          showSuggestedRequirement(data.suggestedRequirement);
         }
       } catch (error) {
         console.error('[pre_analysis] sendMessage error:', error);
+        if (!streamingMessage.hasContent()) {
+          streamingMessage.remove();
+        }
         addMessage('ai', `오류가 발생했습니다. 다시 시도해주세요.\n(${error.message})`);
       } finally {
         if (loadingIndicator) {
@@ -572,6 +673,7 @@
     function resetConversation(persist = true) {
       conversationHistory = [];
       suggestedRequirement = null;
+      chatSessionId = null;
       messagesArea.innerHTML = '';
       finalizeSection.classList.remove('show');
       finalRequirementText.textContent = '';
@@ -2,19 +2,35 @@
 Pre-analysis Chat API
 사용자와 LLM 간의 대화를 통해 요구사항을 명확히 하는 API
 """
-from flask import Blueprint, request, jsonify
+from flask import Blueprint, request, jsonify, Response, stream_with_context
 import os
-from typing import List, Dict
+import json
+from typing import List, Dict, Iterator, Optional
 import re
-from langchain_google_genai import ChatGoogleGenerativeAI
-from langchain_openai import ChatOpenAI
-try:
-    from langchain_anthropic import ChatAnthropic
-    ANTHROPIC_AVAILABLE = True
-except ImportError:
-    ANTHROPIC_AVAILABLE = False
-    ChatAnthropic = None
-from langchain.schema import HumanMessage, AIMessage, SystemMessage
+import importlib.util
+from lazy_loader import lazy_import
+from llm_registry import llm_registry
+from chat_history_manager import ChatHistoryManager, ChatSession, build_summary_prompt, normalize_history
+
+# LangChain 메시지 클래스는 첫 대화 요청 시 import (서버 시작 시간 단축)
+HumanMessage = lazy_import('langchain.schema', 'HumanMessage')
+AIMessage = lazy_import('langchain.schema', 'AIMessage')
+SystemMessage = lazy_import('langchain.schema', 'SystemMessage')
+
+ANTHROPIC_AVAILABLE = importlib.util.find_spec('langchain_anthropic') is not None
+
+# 로컬 Ollama 모델 접두사 (예: "ollama:gemma2:2b")
+OLLAMA_MODEL_PREFIX = 'ollama:'
+
+FINALIZE_KEYWORDS = [
+    '최종 요구사항을 정리했습니다',
+    '다음과 같이 요구사항을 정리했습니다',
+    '요구사항 정리',
+    '최종 요구사항',
+    '이상으로 정리',
+    '확인해 주실 수 있을까요',
+    '검토해 주실 수 있을까요'
+]
 
 pre_analysis_bp = Blueprint('pre_analysis', __name__)
 
@@ -40,71 +56,178 @@ class PreAnalysisService:
 - 요구사항 정리가 가능한 경우: "다음과 같이 요구사항을 정리했습니다:" 로 시작하는 요약
 """
 
+        # 세션별 대화 이력 (최근 대화 원문 + 오래된 대화 누적 요약)
+        self.history_manager = ChatHistoryManager(
+            keep_recent_turns=int(os.getenv('PRE_ANALYSIS_KEEP_TURNS', '6')),
+            token_budget=int(os.getenv('PRE_ANALYSIS_HISTORY_TOKENS', '3000'))
+        )
+
     def get_llm(self, model_name: str):
-        """모델명에 따라 LLM 반환"""
+        """모델명에 따라 LLM 반환 (레지스트리에서 재사용)"""
         if model_name.startswith('gpt'):
-            return ChatOpenAI(
-                model=model_name,
-                temperature=0.7,
-                api_key=os.getenv('OPENAI_API_KEY')
-            )
+            return llm_registry.get('openai', model_name, 0.7)
         elif model_name.startswith('gemini'):
-            return ChatGoogleGenerativeAI(
-                model=model_name,
-                temperature=0.7,
-                google_api_key=os.getenv('GOOGLE_API_KEY')
-            )
+            return llm_registry.get('gemini', model_name, 0.7)
         elif model_name.startswith('claude'):
             if ANTHROPIC_AVAILABLE:
-                return ChatAnthropic(
-                    model=model_name,
-                    temperature=0.7,
-                    anthropic_api_key=os.getenv('ANTHROPIC_API_KEY')
-                )
+                return llm_registry.get('anthropic', model_name, 0.7)
             else:
                 # Claude 사용 불가능한 경우 Gemini로 폴백
                 print(f"Warning: Claude model requested but langchain_anthropic not available. Falling back to Gemini.")
-                return ChatGoogleGenerativeAI(
-                    model='gemini-2.0-flash-exp',
-                    temperature=0.7,
-                    google_api_key=os.getenv('GOOGLE_API_KEY')
-                )
+                return llm_registry.get('gemini', 'gemini-2.0-flash-exp', 0.7)
         else:
             # 기본값
-            return ChatGoogleGenerativeAI(
-                model='gemini-2.0-flash-exp',
-                temperature=0.7,
-                google_api_key=os.getenv('GOOGLE_API_KEY')
-            )
+            return llm_registry.get('gemini', 'gemini-2.0-flash-exp', 0.7)
 
     def chat(
         self,
         user_message: str,
         conversation_history: List[Dict],
-        model: str = 'gemini-2.0-flash-exp'
+        model: str = 'gemini-2.0-flash-exp',
+        session_id: Optional[str] = None
     ) -> Dict:
         """
         사전분석 대화 처리
 
         Args:
             user_message: 사용자 메시지
-            conversation_history: 이전 대화 이력
+            conversation_history: 이전 대화 이력 (세션이 있으면 무시)
             model: 사용할 LLM 모델
+            session_id: 서버 측 대화 세션 ID (없으면 새로 생성)
 
         Returns:
             {
                 'analysis': AI 응답,
                 'canFinalize': 요구사항 확정 가능 여부,
-                'suggestedRequirement': 제안된 최종 요구사항 (canFinalize=True인 경우)
+                'suggestedRequirement': 제안된 최종 요구사항 (canFinalize=True인 경우),
+                'sessionId': 대화 세션 ID
             }
         """
+        session = self._resolve_session(session_id, conversation_history, user_message)
+        context = self.history_manager.get_context(session)
+
         llm = self.get_llm(model)
+        messages = self._build_messages(user_message, context)
+
+        # LLM 호출
+        response = llm.invoke(messages)
+        ai_message = response.content
+
+        self._record_exchange(session, user_message, ai_message, model)
+
+        result = self._build_result(ai_message)
+        result['sessionId'] = session.session_id
+        return result
+
+    def chat_stream(
+        self,
+        user_message: str,
+        conversation_history: List[Dict],
+        model: str = 'gemini-2.0-flash-exp',
+        session_id: Optional[str] = None
+    ) -> Iterator[Dict]:
+        """
+        사전분석 대화 스트리밍 처리
+
+        Yields:
+            {'type': 'session', 'sessionId': 세션 ID}
+            {'type': 'token', 'content': 토큰}
+            {'type': 'finalize', 'canFinalize': True} - 누적 응답에서 확정 문구가 처음 감지된 시점
+            {'type': 'requirement', 'suggestedRequirement': 중간 정리 결과} - 확정 감지 후 줄 단위 갱신
+            {'type': 'done', ...chat()과 동일한 결과}
+        """
+        session = self._resolve_session(session_id, conversation_history, user_message)
+        context = self.history_manager.get_context(session)
+        yield {'type': 'session', 'sessionId': session.session_id}
+
+        accumulated = ''
+        can_finalize = False
+        max_keyword_length = max(len(keyword) for keyword in FINALIZE_KEYWORDS)
 
-        # 메시지 구성
+        for chunk in self._stream_tokens(user_message, context, model):
+            if not chunk:
+                continue
+            accumulated += chunk
+            yield {'type': 'token', 'content': chunk}
+
+            if not can_finalize:
+                # 새 토큰 주변만 검사 (키워드가 토큰 경계에 걸쳐도 감지되도록 여유분 포함)
+                window = accumulated[-(len(chunk) + max_keyword_length):]
+                if self._can_finalize(window):
+                    can_finalize = True
+                    yield {'type': 'finalize', 'canFinalize': True}
+            elif '\n' in chunk:
+                yield {'type': 'requirement', 'suggestedRequirement': self._extract_requirement(accumulated)}
+
+        self._record_exchange(session, user_message, accumulated, model)
+
+        result = self._build_result(accumulated)
+        result['sessionId'] = session.session_id
+        result['type'] = 'done'
+        yield result
+
+    def _resolve_session(self, session_id: Optional[str], conversation_history: List[Dict],
+                         user_message: str) -> ChatSession:
+        """기존 세션 조회, 없으면 클라이언트 이력으로 새 세션 생성"""
+        session = self.history_manager.get_session(session_id)
+        if session is not None:
+            return session
+
+        history = normalize_history(conversation_history)
+        # 클라이언트가 현재 메시지를 이력에 먼저 추가해서 보내는 경우 중복 제거
+        if history and history[-1]['role'] == 'user' and history[-1]['content'] == user_message:
+            history = history[:-1]
+        return self.history_manager.get_session(self.history_manager.create_session(history))
+
+    def _record_exchange(self, session: ChatSession, user_message: str, ai_message: str, model: str) -> None:
+        """대화 기록 - 토큰 예산 초과 시 오래된 대화를 요약으로 압축"""
+        if not ai_message:
+            return
+
+        def summarize(previous_summary: str, transcript: str) -> str:
+            llm = self.get_llm(model)
+            response = llm.invoke([HumanMessage(content=build_summary_prompt(previous_summary, transcript))])
+            return response.content
+
+        self.history_manager.record_exchange(session, user_message, ai_message, model, summarize)
+
+    def _stream_tokens(self, user_message: str, context: Dict, model: str) -> Iterator[str]:
+        """모델별 토큰 스트림 (Ollama는 generate_stream, 그 외는 LangChain .stream())"""
+        if model.startswith(OLLAMA_MODEL_PREFIX):
+            from ollama_client import ollama_client
+
+            prompt = self._build_ollama_prompt(user_message, context)
+            system = self.system_prompt
+            if context.get('summary'):
+                system = f"{system}\n\n이전 대화 요약:\n{context['summary']}"
+            for event in ollama_client.generate_stream(
+                model=model[len(OLLAMA_MODEL_PREFIX):],
+                prompt=prompt,
+                system=system,
+                max_tokens=2048
+            ):
+                if not event.get('success'):
+                    raise RuntimeError(event.get('error', 'Ollama 스트림 오류'))
+                yield event.get('response', '')
+            return
+
+        llm = self.get_llm(model)
+        for chunk in llm.stream(self._build_messages(user_message, context)):
+            content = chunk.content
+            if isinstance(content, list):
+                # 일부 프로바이더는 content를 파트 리스트로 반환
+                content = ''.join(part.get('text', '') if isinstance(part, dict) else str(part) for part in content)
+            yield content
+
+    def _build_messages(self, user_message: str, context: Dict) -> List:
+        """시스템 프롬프트 + 누적 요약 + 최근 대화 + 현재 메시지로 LangChain 메시지 구성"""
         messages = [SystemMessage(content=self.system_prompt)]
 
-        # 대화 이력 추가
-        for msg in conversation_history:
+        if context.get('summary'):
+            messages.append(SystemMessage(content=f"이전 대화 요약:\n{context['summary']}"))
+
+        # 최근 대화 원문 추가
+        for msg in context.get('turns', []):
             if msg['role'] == 'user':
                 messages.append(HumanMessage(content=msg['content']))
             elif msg['role'] == 'assistant':
@@ -112,11 +235,23 @@ class PreAnalysisService:
 
         # 현재 사용자 메시지 추가
         messages.append(HumanMessage(content=user_message))
+        return messages
 
-        # LLM 호출
-        response = llm.invoke(messages)
-        ai_message = response.content
+    @staticmethod
+    def _build_ollama_prompt(user_message: str, context: Dict) -> str:
+        """Ollama generate API용 단일 프롬프트 구성"""
+        labels = {'user': '사용자', 'assistant': 'AI'}
+        lines = [
+            f"{labels[msg['role']]}: {msg['content']}"
+            for msg in context.get('turns', [])
+            if msg.get('role') in labels
+        ]
+        lines.append(f"사용자: {user_message}")
+        lines.append("AI:")
+        return '\n\n'.join(lines)
 
+    def _build_result(self, ai_message: str) -> Dict:
+        """AI 응답으로 최종 결과 구성"""
         # 요구사항 확정 가능 여부 판단
         can_finalize = self._can_finalize(ai_message)
         suggested_requirement = None
@@ -197,16 +332,7 @@ class PreAnalysisService:
 
     def _can_finalize(self, ai_message: str) -> bool:
         """AI 응답에서 요구사항 확정 가능 여부 판단"""
-        finalize_keywords = [
-            '최종 요구사항을 정리했습니다',
-            '다음과 같이 요구사항을 정리했습니다',
-            '요구사항 정리',
-            '최종 요구사항',
-            '이상으로 정리',
-            '확인해 주실 수 있을까요',
-            '검토해 주실 수 있을까요'
-        ]
-        return any(keyword in ai_message for keyword in finalize_keywords)
+        return any(keyword in ai_message for keyword in FINALIZE_KEYWORDS)
 
 
     def _extract_requirement(self, ai_message: str) -> str:
@@ -280,6 +406,10 @@ class PreAnalysisService:
 
 
 
+# 사전분석 서비스 인스턴스 (요청마다 생성하지 않음)
+pre_analysis_chat_service = PreAnalysisService()
+
+
 # Flask 라우트
 @pre_analysis_bp.route('/api/pre-analysis/chat', methods=['POST'])
 def pre_analysis_chat():
@@ -289,10 +419,12 @@ def pre_analysis_chat():
     Request Body:
     {
         "userMessage": "전자상거래 웹사이트를 만들고 싶어요",
+        "sessionId": "이전 응답의 sessionId" (선택 - 있으면 서버 측 이력 사용),
+        "historyLength": 클라이언트에 표시된 메시지 수 (선택),
         "conversationHistory": [
             {"role": "assistant", "content": "어떤 프로젝트를 만들고 싶으신가요?"},
             {"role": "user", "content": "쇼핑몰을 만들고 싶어요"}
-        ],
+        ] (sessionId가 없거나 만료된 경우에만 필요),
         "model": "gemini-2.0-flash-exp"
     }
 
@@ -300,8 +432,11 @@ def pre_analysis_chat():
     {
         "analysis": "AI의 응답",
         "canFinalize": true/false,
-        "suggestedRequirement": "정리된 최종 요구사항" (canFinalize=true인 경우)
+        "suggestedRequirement": "정리된 최종 요구사항" (canFinalize=true인 경우),
+        "sessionId": "대화 세션 ID"
     }
+
+    세션이 만료되었는데 이력 없이 요청하면 409 (code: session_expired) - 클라이언트는 conversationHistory를 포함해 재요청
     """
     try:
         data = request.get_json()
@@ -309,16 +444,20 @@ def pre_analysis_chat():
         user_message = data.get('userMessage')
         conversation_history = data.get('conversationHistory', [])
         model = data.get('model', 'gemini-2.0-flash-exp')
+        session_id = data.get('sessionId')
 
         if not user_message:
             return jsonify({'error': 'User message is required'}), 400
 
+        if _is_session_lost(data):
+            return _session_expired_response()
+
         # 사전분석 서비스 실행
-        service = PreAnalysisService()
-        result = service.chat(
+        result = pre_analysis_chat_service.chat(
             user_message=user_message,
             conversation_history=conversation_history,
-            model=model
+            model=model,
+            session_id=session_id
         )
 
         return jsonify(result), 200
@@ -327,6 +466,78 @@ def pre_analysis_chat():
         return jsonify({'error': str(e)}), 500
 
 
+@pre_analysis_bp.route('/api/pre-analysis/chat/stream', methods=['POST'])
+def pre_analysis_chat_stream():
+    """
+    사전분석 대화 스트리밍 API (Server-Sent Events)
+
+    Request Body: /api/pre-analysis/chat 과 동일
+
+    Response (text/event-stream):
+        event: session      data: {"sessionId": "..."}
+        event: token        data: {"content": "..."}
+        event: finalize     data: {"canFinalize": true}
+        event: requirement  data: {"suggestedRequirement": "..."}
+        event: done         data: {"analysis": ..., "canFinalize": ..., "suggestedRequirement": ...}
+        event: error        data: {"error": "..."}
+    """
+    data = request.get_json(silent=True) or {}
+
+    user_message = data.get('userMessage')
+    conversation_history = data.get('conversationHistory', [])
+    model = data.get('model', 'gemini-2.0-flash-exp')
+    session_id = data.get('sessionId')
+
+    if not user_message:
+        return jsonify({'error': 'User message is required'}), 400
+
+    if _is_session_lost(data):
+        return _session_expired_response()
+
+    def generate():
+        try:
+            for event in pre_analysis_chat_service.chat_stream(
+                user_message=user_message,
+                conversation_history=conversation_history,
+                model=model,
+                session_id=session_id
+            ):
+                yield _format_sse(event.pop('type'), event)
+        except Exception as e:
+            yield _format_sse('error', {'error': str(e)})
+
+    return Response(
+        stream_with_context(generate()),
+        mimetype='text/event-stream',
+        headers={
+            'Cache-Control': 'no-cache',
+            'X-Accel-Buffering': 'no'  # 리버스 프록시 버퍼링 비활성화
+        }
+    )
+
+
+def _is_session_lost(data: Dict) -> bool:
+    """서버 세션이 만료되었고 클라이언트도 이력을 보내지 않아 문맥이 유실되는지 확인"""
+    session_id = data.get('sessionId')
+    if not session_id or data.get('conversationHistory'):
+        return False
+    if pre_analysis_chat_service.history_manager.get_session(session_id) is not None:
+        return False
+    return int(data.get('historyLength') or 0) > 1
+
+
+def _session_expired_response():
+    return jsonify({
+        'error': 'Chat session expired',
+        'code': 'session_expired'
+    }), 409
+
+
+def _format_sse(event: str, payload: Dict) -> str:
+    """SSE 이벤트 직렬화"""
+    return f"event: {event}\ndata: {json.dumps(payload, ensure_ascii=False)}\n\n"
+
+
 @pre_analysis_bp.route('/api/pre-analysis/initial', methods=['POST'])
 def get_initial_question():
     """
@@ -12,10 +12,16 @@ import requests
 from typing import Dict, List, Optional, Tuple
 import logging
 
+from llm_http import llm_transport
+from analysis_cache import create_analysis_cache_from_env, make_cache_key, normalize_request_text
+
 # 로깅 설정
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# 분석 프롬프트 버전 - _create_analysis_prompt 변경 시 올려야 기존 캐시가 무효화됨
+ANALYSIS_PROMPT_VERSION = "1"
+
 class PreAnalysisService:
     """사전 분석 서비스 - LLM을 통한 구조화된 프로젝트 계획 생성"""
 
@@ -100,6 +106,9 @@ class PreAnalysisService:
             'ollama-qwen3-coder-30b': 'gemini-2.5-flash'
         }
 
+        # LLM 응답 캐시 (동일 요청 재시도/수정 시 재사용)
+        self.response_cache = create_analysis_cache_from_env()
+
     def analyze_user_request(self,
                            user_request: str,
                            framework: str = 'crewai',
@@ -135,12 +144,21 @@ class PreAnalysisService:
                 logger.error(error_msg)
                 raise ValueError(error_msg)
 
-            # LLM 호출
-            analysis_result = self._call_llm(
-                system_prompt=system_prompt,
-                user_request=user_request,
-                model=actual_model  # 변환된 모델명 사용
+            # LLM 호출 (캐시 조회 - 동일 요청의 동시 호출은 하나로 병합)
+            cache_key = self._make_cache_key(user_request, framework, actual_model)
+            analysis_result, cache_hit = self.response_cache.get_or_compute(
+                cache_key,
+                lambda: self._call_llm(
+                    system_prompt=system_prompt,
+                    user_request=user_request,
+                    model=actual_model  # 변환된 모델명 사용
+                )
             )
+            if cache_hit:
+                logger.info(f"사전 분석 캐시 적중: {analysis_id}")
+            if not (analysis_result or '').strip():
+                # 빈 응답은 재시도될 수 있도록 캐시에서 제거
+                self.response_cache.invalidate(cache_key)
 
             # 결과 구조화
             structured_analysis = self._structure_analysis_result(
@@ -157,6 +175,19 @@ class PreAnalysisService:
             logger.error(f"사전 분석 실패: {str(e)}")
             return self._create_error_response(str(e))
 
+    def _make_cache_key(self, user_request: str, framework: str, model: str) -> str:
+        """정규화된 요청 + 프레임워크 + 모델 + 프롬프트 버전 기반 캐시 키"""
+        return make_cache_key(
+            ANALYSIS_PROMPT_VERSION,
+            framework,
+            model,
+            normalize_request_text(user_request)
+        )
+
+    def get_cache_stats(self) -> Dict:
+        """응답 캐시 적중/실패 지표"""
+        return self.response_cache.get_stats()
+
     def _create_analysis_prompt(self, framework: str) -> str:
         """프레임워크별 분석 프롬프트 생성"""
 
@@ -278,7 +309,11 @@ class PreAnalysisService:
                 timeout = 60 if attempt == 0 else 90  # 첫 시도는 60초, 재시도는 90초
                 logger.info(f"Gemini API 호출 시도 {attempt + 1}/{max_retries}, 타임아웃: {timeout}초")
 
-                response = requests.post(url, json=payload, headers=headers, timeout=timeout)
+                connect_timeout, _ = llm_transport.get_timeout('gemini', 'generate')
+                response = llm_transport.post(
+                    'gemini', 'generate', url,
+                    json=payload, headers=headers, timeout=(connect_timeout, timeout)
+                )
                 response.raise_for_status()
 
                 result = response.json()
@@ -320,11 +355,11 @@ class PreAnalysisService:
             "temperature": 0.7
         }
 
-        response = requests.post(
+        response = llm_transport.post(
+            'openai', 'chat',
             model_config['endpoint'],
             json=payload,
-            headers=headers,
-            timeout=60
+            headers=headers
         )
         response.raise_for_status()
 
@@ -10,7 +10,7 @@ from datetime import datetime, timedelta
 import os
 import re
 import uuid
-from langchain_google_genai import ChatGoogleGenerativeAI
+from llm_registry import llm_registry
 from project_name_generator import generate_project_name_from_requirement
 
 project_init_bp = Blueprint('project_init', __name__)
@@ -18,12 +18,13 @@ project_init_bp = Blueprint('project_init', __name__)
 DEFAULT_METAGPT_LLM = 'gemini-2.5-flash'
 
 def get_llm(model_name="gemini-2.5-flash"):
-    """LLM 인스턴스를 생성하는 헬퍼 함수"""
+    """LLM 인스턴스를 반환하는 헬퍼 함수 (레지스트리에서 재사용)"""
     if not os.getenv("GOOGLE_API_KEY"):
         raise ValueError("GOOGLE_API_KEY 환경변수가 설정되지 않았습니다.")
-    return ChatGoogleGenerativeAI(
-        model=model_name,
-        temperature=0.3,
+    return llm_registry.get(
+        'gemini',
+        model_name,
+        0.3,
         timeout=90,  # 90초 타임아웃
         max_retries=2  # 최대 2번 재시도
     )
@@ -4,11 +4,18 @@ Project Initializer & DB Entry Management
 프로젝트 초기화 및 데이터베이스 항목 관리
 """
 
+from __future__ import annotations
+
 import os
 import uuid
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
+
+from lazy_loader import lazy_import
+
+if TYPE_CHECKING:
+    from supabase import Client
 
-from supabase import create_client, Client
+create_client = lazy_import('supabase', 'create_client')
 
 def get_supabase_client() -> Optional[Client]:
     """Supabase 클라이언트를 반환합니다."""
@@ -8,9 +8,10 @@
 import re
 import os
 from typing import Optional
-from langchain_google_genai import ChatGoogleGenerativeAI
 import json
 
+from llm_registry import llm_registry
+
 
 def generate_project_name_from_requirement(requirement: str, max_length: int = 50) -> str:
     """
@@ -30,9 +31,10 @@ def generate_project_name_from_requirement(requirement: str, max_length: int = 5
             print("[WARN] No API key found, using fallback method")
             return _generate_name_by_keywords(requirement, max_length)
 
-        llm = ChatGoogleGenerativeAI(
-            model="gemini-2.0-flash-exp",
-            temperature=0.3,
+        llm = llm_registry.get(
+            'gemini',
+            "gemini-2.0-flash-exp",
+            0.3,
             timeout=30,
             max_retries=2
         )
@@ -14,6 +14,8 @@ from datetime import datetime
 from typing import Dict, Any, Optional, List
 from enum import Enum
 
+from resumable_index import get_resumable_index
+
 class ProjectStatus(Enum):
     """프로젝트 상태 열거형"""
     CREATED = "created"
@@ -39,14 +41,28 @@ class AgentStatus(Enum):
 class ProjectStateManager:
     """프로젝트 상태 관리 클래스"""
 
-    def __init__(self, project_path: str):
+    def __init__(self, project_path: str, create: bool = True):
         self.project_path = project_path
         self.requirements_file = os.path.join(project_path, "original_requirements.json")
         self.status_file = os.path.join(project_path, "project_status.json")
         self.execution_log_file = os.path.join(project_path, "execution_log.json")
 
-        # 디렉토리가 없으면 생성
-        os.makedirs(project_path, exist_ok=True)
+        # 디렉토리가 없으면 생성 (조회만 하는 경우 create=False)
+        if create:
+            os.makedirs(project_path, exist_ok=True)
+
+    @property
+    def resumable_index(self):
+        """상위 기본 디렉토리의 재개 가능 프로젝트 색인"""
+        return get_resumable_index(os.path.dirname(os.path.abspath(self.project_path)))
+
+    def _save_project_status(self, status_data: Dict[str, Any], was_resumable: bool = True):
+        """상태 파일 저장 + 재개 가능 여부가 관련된 경우 색인 갱신"""
+        with open(self.status_file, 'w', encoding='utf-8') as f:
+            json.dump(status_data, f, ensure_ascii=False, indent=2)
+
+        if was_resumable or status_data.get("can_resume", False):
+            self.resumable_index.update(os.path.basename(os.path.abspath(self.project_path)), status_data)
 
     def save_original_requirements(self, requirements: str, additional_info: Dict[str, Any] = None):
         """원본 요구사항 저장"""
@@ -111,8 +127,8 @@ class ProjectStateManager:
             "execution_id": str(uuid.uuid4())
         }
 
-        with open(self.status_file, 'w', encoding='utf-8') as f:
-            json.dump(status_data, f, ensure_ascii=False, indent=2)
+        # 기존 프로젝트를 다시 초기화하는 경우도 있으므로 색인에서 제거
+        self._save_project_status(status_data)
 
         # 실행 로그 초기화
         self.log_execution_event("project_initialized", {
@@ -128,6 +144,7 @@ class ProjectStateManager:
         if not status_data:
             return False
 
+        was_resumable = status_data.get("can_resume", False)
         status_data["status"] = status.value
         status_data["updated_at"] = datetime.now().isoformat()
 
@@ -139,8 +156,7 @@ class ProjectStateManager:
             status_data["can_resume"] = True
             status_data["resume_point"] = status.value
 
-        with open(self.status_file, 'w', encoding='utf-8') as f:
-            json.dump(status_data, f, ensure_ascii=False, indent=2)
+        self._save_project_status(status_data, was_resumable)
 
         return True
 
@@ -172,8 +188,7 @@ class ProjectStateManager:
         total_progress = sum(agent["progress"] for agent in status_data["agents"].values()) // 3
         status_data["progress_percentage"] = total_progress
 
-        with open(self.status_file, 'w', encoding='utf-8') as f:
-            json.dump(status_data, f, ensure_ascii=False, indent=2)
+        self._save_project_status(status_data, status_data.get("can_resume", False))
 
         return True
 
@@ -9,9 +9,11 @@ import os
 import uuid
 from datetime import datetime
 from typing import Dict, List, Any, Optional
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, asdict, fields
 from enum import Enum
 
+from template_index import TemplateSearchIndex, WatchedTemplateIndex
+
 class ProjectType(Enum):
     """프로젝트 유형 정의"""
     WEB_APP = "web_app"
@@ -81,6 +83,16 @@ class ProjectTemplateManager:
         self._ensure_templates_dir()
         self._load_default_templates()
 
+        # 파일 mtime (경로 -> mtime_ns) - 직접 저장한 파일은 다시 읽지 않음
+        self._file_mtimes: Dict[str, int] = {}
+        self._remember_file_mtimes()
+
+        # templates/*.json이 바뀌면 변경된 템플릿 파일을 다시 읽고 검색 색인 재구축
+        self._index = WatchedTemplateIndex(
+            self.templates_dir, self._build_index,
+            extra_signature=lambda: tuple(self.templates)
+        )
+
     def _ensure_templates_dir(self):
         """템플릿 디렉토리 생성"""
         if not os.path.exists(self.templates_dir):
@@ -274,6 +286,61 @@ class ProjectTemplateManager:
             with open(file_path, 'w', encoding='utf-8') as f:
                 json.dump(template.to_dict(), f, indent=2, ensure_ascii=False)
 
+    def _remember_file_mtimes(self):
+        for template_id in self.templates:
+            path = os.path.join(self.templates_dir, f"{template_id}.json")
+            try:
+                self._file_mtimes[path] = os.stat(path).st_mtime_ns
+            except OSError:
+                pass
+
+    def _reload_changed_template_files(self):
+        """직접 수정된 템플릿 JSON 파일 반영 (ProjectTemplate 형식이 아닌 파일은 무시)"""
+        template_fields = {field.name for field in fields(ProjectTemplate)}
+
+        for template_id in list(self.templates):
+            path = os.path.join(self.templates_dir, f"{template_id}.json")
+            try:
+                mtime = os.stat(path).st_mtime_ns
+            except OSError:
+                continue
+            if self._file_mtimes.get(path) == mtime:
+                continue
+
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+                data = {key: value for key, value in data.items() if key in template_fields}
+                data['llm_mappings'] = [LLMMapping(**mapping) for mapping in data.get('llm_mappings', [])]
+                template = ProjectTemplate(**data)
+                template.usage_count = self.templates[template_id].usage_count
+                self.templates[template_id] = template
+            except Exception as e:
+                print(f"템플릿 파일 재로드 실패 ({path}): {e}")
+            self._file_mtimes[path] = mtime
+
+    def _build_index(self) -> TemplateSearchIndex:
+        """템플릿 검색 색인 구축 (표시명/이름 > 태그 > 설명 순 가중치)"""
+        self._reload_changed_template_files()
+
+        documents = []
+        for template in self.templates.values():
+            documents.append({
+                "id": template.id,
+                "fields": [
+                    (template.display_name, 3.0),
+                    (template.name, 3.0),
+                    (" ".join(template.tags), 2.0),
+                    (template.description, 1.0)
+                ],
+                "facets": {
+                    "project_type": template.project_type,
+                    "framework": template.framework,
+                    "difficulty": template.difficulty
+                }
+            })
+        return TemplateSearchIndex(documents)
+
     def get_all_templates(self) -> List[ProjectTemplate]:
         """모든 템플릿 조회"""
         return list(self.templates.values())
@@ -294,20 +361,20 @@ class ProjectTemplateManager:
         """추천 템플릿 조회"""
         return [t for t in self.templates.values() if t.is_featured]
 
-    def search_templates(self, query: str) -> List[ProjectTemplate]:
-        """템플릿 검색"""
-        query = query.lower()
-        results = []
-
-        for template in self.templates.values():
-            # 이름, 설명, 태그에서 검색
-            if (query in template.name.lower() or
-                query in template.display_name.lower() or
-                query in template.description.lower() or
-                any(query in tag.lower() for tag in template.tags)):
-                results.append(template)
-
-        return results
+    def search_templates(self, query: str, project_type: Optional[str] = None,
+                         framework: Optional[str] = None, limit: Optional[int] = None) -> List[ProjectTemplate]:
+        """템플릿 검색 (이름, 설명, 태그 - 관련도 순, 유형/프레임워크 필터)"""
+        ranked = self._index.get().search(
+            query, {"project_type": project_type, "framework": framework}, limit
+        )
+        return [self.templates[template_id] for template_id, _ in ranked]
+
+    def get_search_facets(self, query: Optional[str] = None) -> Dict[str, Dict[str, int]]:
+        """유형/프레임워크/난이도별 템플릿 수 (query 지정 시 검색 결과 기준)"""
+        index = self._index.get()
+        if not query:
+            return index.facet_counts()
+        return index.facet_counts(template_id for template_id, _ in index.search(query))
 
     def create_project_from_template(self, template_id: str, project_name: str,
                                    custom_settings: Dict[str, Any] = None) -> Dict[str, Any]:
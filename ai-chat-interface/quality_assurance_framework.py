@@ -9,8 +9,10 @@ import ast
 import re
 import os
 import json
+import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Tuple, Optional
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
 
@@ -40,6 +42,43 @@ class QualityReport:
     passed_checks: List[str]
     recommendations: List[str]
     is_production_ready: bool
+    stage_timings: Dict[str, float] = field(default_factory=dict)  # 단계별 소요 시간 (ms)
+    skipped_stages: List[str] = field(default_factory=list)        # 구문 오류로 생략된 단계
+
+# 미리 컴파일한 검사 정규식
+PASCAL_CASE_FUNCTION_RE = re.compile(r'def\s+([A-Z][a-zA-Z0-9_]*)\s*\(')
+WINDOWS_DRIVE_PATH_RE = re.compile(r'["\'][A-Z]:')
+API_KEY_RES = [
+    re.compile(r'api_key\s*=\s*["\'][^"\']{20,}["\']', re.IGNORECASE),
+    re.compile(r'token\s*=\s*["\'][^"\']{20,}["\']', re.IGNORECASE),
+    re.compile(r'key\s*=\s*["\'][^"\']{20,}["\']', re.IGNORECASE)
+]
+INEFFICIENT_PATTERN_RES = [
+    (re.compile(r'for.*in.*range\(len\('), '비효율적인 리스트 순회'),
+    (re.compile(r'time\.sleep\(\d+\)'), '긴 sleep 구문'),
+    (re.compile(r'while\s+True:.*time\.sleep'), '무한 루프와 sleep 조합')
+]
+
+# 구문 검사 이후 병렬로 실행하는 독립 단계 (결과는 이 순서로 합침)
+PARALLEL_STAGES = ['logic', 'requirements', 'execution', 'security', 'performance']
+
+# 단계 병렬 실행용 공유 스레드 풀
+_stage_executor = ThreadPoolExecutor(max_workers=len(PARALLEL_STAGES), thread_name_prefix='qa-stage')
+
+
+class ScriptArtifact:
+    """단계들이 공유하는 사전 파싱 결과 (원문, 소문자 원문, 줄 목록, AST)"""
+
+    def __init__(self, script_content: str):
+        self.content = script_content
+        self.content_lower = script_content.lower()
+        self.lines = script_content.split('\n')
+        self.tree: Optional[ast.AST] = None
+        self.syntax_error: Optional[SyntaxError] = None
+        try:
+            self.tree = ast.parse(script_content)
+        except SyntaxError as e:
+            self.syntax_error = e
 
 class QualityAssuranceFramework:
     """품질 보증 프레임워크"""
@@ -55,55 +94,61 @@ class QualityAssuranceFramework:
         }
 
     def assess_quality(self, script_content: str, requirement: str,
-                      project_path: str) -> QualityReport:
-        """종합 품질 평가"""
+                      project_path: str, fail_fast: bool = True) -> QualityReport:
+        """
+        종합 품질 평가
+
+        스크립트는 한 번만 파싱하여 모든 단계가 공유하며, 구문 검사 이후 나머지 5단계는 병렬 실행.
+        fail_fast=True이면 구문 오류(AST 파싱 실패) 시 나머지 단계를 생략하고 0점 처리
+        """
 
         issues = []
         passed_checks = []
         stage_scores = {}
+        stage_timings = {}
+        skipped_stages = []
+
+        artifact = ScriptArtifact(script_content)
 
         # Stage 1: 구문 및 문법 검사
-        syntax_score, syntax_issues, syntax_passed = self._check_syntax(script_content)
+        started = time.perf_counter()
+        syntax_score, syntax_issues, syntax_passed = self._check_syntax(artifact)
+        stage_timings['syntax'] = round((time.perf_counter() - started) * 1000, 3)
         stage_scores['syntax'] = syntax_score
         issues.extend(syntax_issues)
         passed_checks.extend(syntax_passed)
 
-        # Stage 2: 로직 완성도 검증
-        logic_score, logic_issues, logic_passed = self._check_logic_completeness(script_content)
-        stage_scores['logic'] = logic_score
-        issues.extend(logic_issues)
-        passed_checks.extend(logic_passed)
-
-        # Stage 3: 요구사항 반영도 평가
-        req_score, req_issues, req_passed = self._check_requirements_coverage(script_content, requirement)
-        stage_scores['requirements'] = req_score
-        issues.extend(req_issues)
-        passed_checks.extend(req_passed)
-
-        # Stage 4: 실행 가능성 시뮬레이션
-        exec_score, exec_issues, exec_passed = self._check_execution_readiness(script_content, project_path)
-        stage_scores['execution'] = exec_score
-        issues.extend(exec_issues)
-        passed_checks.extend(exec_passed)
-
-        # Stage 5: 보안 검토
-        sec_score, sec_issues, sec_passed = self._check_security(script_content)
-        stage_scores['security'] = sec_score
-        issues.extend(sec_issues)
-        passed_checks.extend(sec_passed)
-
-        # Stage 6: 성능 검토
-        perf_score, perf_issues, perf_passed = self._check_performance(script_content)
-        stage_scores['performance'] = perf_score
-        issues.extend(perf_issues)
-        passed_checks.extend(perf_passed)
+        if fail_fast and artifact.syntax_error is not None:
+            for stage in PARALLEL_STAGES:
+                stage_scores[stage] = 0.0
+            skipped_stages = list(PARALLEL_STAGES)
+        else:
+            # Stage 2~6: 로직 완성도 / 요구사항 반영도 / 실행 가능성 / 보안 / 성능 (병렬)
+            stage_functions = {
+                'logic': lambda: self._check_logic_completeness(artifact),
+                'requirements': lambda: self._check_requirements_coverage(artifact, requirement),
+                'execution': lambda: self._check_execution_readiness(artifact, project_path),
+                'security': lambda: self._check_security(artifact),
+                'performance': lambda: self._check_performance(artifact)
+            }
+            futures = {
+                stage: _stage_executor.submit(self._run_timed_stage, stage_functions[stage])
+                for stage in PARALLEL_STAGES
+            }
+
+            for stage in PARALLEL_STAGES:
+                (score, stage_issues, stage_passed), elapsed_ms = futures[stage].result()
+                stage_scores[stage] = score
+                stage_timings[stage] = elapsed_ms
+                issues.extend(stage_issues)
+                passed_checks.extend(stage_passed)
 
         # 종합 점수 계산
         overall_score = self._calculate_overall_score(stage_scores)
         quality_level = self._determine_quality_level(overall_score)
 
         # 추천사항 생성
-        recommendations = self._generate_recommendations(stage_scores, issues)
+        recommendations = self._generate_recommendations(stage_scores, issues, skipped_stages)
 
         # 프로덕션 준비 여부
         is_production_ready = self._assess_production_readiness(stage_scores, issues)
@@ -115,20 +160,28 @@ class QualityAssuranceFramework:
             issues=issues,
             passed_checks=passed_checks,
             recommendations=recommendations,
-            is_production_ready=is_production_ready
+            is_production_ready=is_production_ready,
+            stage_timings=stage_timings,
+            skipped_stages=skipped_stages
         )
 
-    def _check_syntax(self, script_content: str) -> Tuple[float, List[QualityIssue], List[str]]:
+    @staticmethod
+    def _run_timed_stage(stage_function) -> Tuple[Tuple[float, List[QualityIssue], List[str]], float]:
+        started = time.perf_counter()
+        result = stage_function()
+        return result, round((time.perf_counter() - started) * 1000, 3)
+
+    def _check_syntax(self, artifact: ScriptArtifact) -> Tuple[float, List[QualityIssue], List[str]]:
         """Stage 1: 구문 및 문법 검사"""
         issues = []
         passed_checks = []
         score = 1.0
 
-        try:
-            # Python AST 파싱
-            ast.parse(script_content)
+        # Python AST 파싱 결과 (ScriptArtifact 생성 시 1회 파싱)
+        e = artifact.syntax_error
+        if e is None:
             passed_checks.append("Python 구문 검사 통과")
-        except SyntaxError as e:
+        else:
             issues.append(QualityIssue(
                 category="syntax",
                 severity="critical",
@@ -139,8 +192,7 @@ class QualityAssuranceFramework:
             score -= 0.5
 
         # 들여쓰기 일관성 검사
-        lines = script_content.split('\n')
-        indentation_issues = self._check_indentation_consistency(lines)
+        indentation_issues = self._check_indentation_consistency(artifact.lines)
         if indentation_issues:
             for issue in indentation_issues:
                 issues.append(issue)
@@ -149,7 +201,7 @@ class QualityAssuranceFramework:
             passed_checks.append("들여쓰기 일관성 검사 통과")
 
         # 기본 코딩 컨벤션 검사
-        convention_issues = self._check_coding_conventions(script_content)
+        convention_issues = self._check_coding_conventions(artifact)
         if convention_issues:
             issues.extend(convention_issues)
             score -= len(convention_issues) * 0.05
@@ -157,7 +209,7 @@ class QualityAssuranceFramework:
             passed_checks.append("기본 코딩 컨벤션 검사 통과")
 
         # UTF-8 인코딩 검사
-        if 'utf-8' in script_content:
+        if 'utf-8' in artifact.content:
             passed_checks.append("UTF-8 인코딩 지원 확인")
         else:
             issues.append(QualityIssue(
@@ -194,13 +246,12 @@ class QualityAssuranceFramework:
 
         return issues
 
-    def _check_coding_conventions(self, script_content: str) -> List[QualityIssue]:
+    def _check_coding_conventions(self, artifact: ScriptArtifact) -> List[QualityIssue]:
         """기본 코딩 컨벤션 검사"""
         issues = []
 
         # 함수명 컨벤션 (snake_case)
-        function_pattern = r'def\s+([A-Z][a-zA-Z0-9_]*)\s*\('
-        if re.search(function_pattern, script_content):
+        if PASCAL_CASE_FUNCTION_RE.search(artifact.content):
             issues.append(QualityIssue(
                 category="syntax",
                 severity="low",
@@ -209,8 +260,7 @@ class QualityAssuranceFramework:
             ))
 
         # 긴 줄 검사 (120자 초과)
-        lines = script_content.split('\n')
-        long_lines = [i+1 for i, line in enumerate(lines) if len(line) > 120]
+        long_lines = [i+1 for i, line in enumerate(artifact.lines) if len(line) > 120]
         if long_lines:
             issues.append(QualityIssue(
                 category="syntax",
@@ -221,11 +271,12 @@ class QualityAssuranceFramework:
 
         return issues
 
-    def _check_logic_completeness(self, script_content: str) -> Tuple[float, List[QualityIssue], List[str]]:
+    def _check_logic_completeness(self, artifact: ScriptArtifact) -> Tuple[float, List[QualityIssue], List[str]]:
         """Stage 2: 로직 완성도 검증"""
         issues = []
         passed_checks = []
         score = 1.0
+        script_content = artifact.content
 
         # CrewAI 필수 요소 검사
         required_elements = {
@@ -278,7 +329,7 @@ class QualityAssuranceFramework:
 
         # 출력 처리 검사
         output_patterns = ['output', 'save', 'write', 'result']
-        has_output = any(pattern in script_content.lower() for pattern in output_patterns)
+        has_output = any(pattern in artifact.content_lower for pattern in output_patterns)
 
         if has_output:
             passed_checks.append("결과 출력 처리 확인")
@@ -293,11 +344,12 @@ class QualityAssuranceFramework:
 
         return max(score, 0.0), issues, passed_checks
 
-    def _check_requirements_coverage(self, script_content: str, requirement: str) -> Tuple[float, List[QualityIssue], List[str]]:
+    def _check_requirements_coverage(self, artifact: ScriptArtifact, requirement: str) -> Tuple[float, List[QualityIssue], List[str]]:
         """Stage 3: 요구사항 반영도 평가"""
         issues = []
         passed_checks = []
         score = 1.0
+        script_content = artifact.content
 
         # 요구사항 키워드 추출
         req_keywords = self._extract_requirement_keywords(requirement)
@@ -305,7 +357,7 @@ class QualityAssuranceFramework:
         # 키워드 매칭 검사
         matched_keywords = 0
         for keyword in req_keywords:
-            if keyword.lower() in script_content.lower():
+            if keyword.lower() in artifact.content_lower:
                 matched_keywords += 1
 
         coverage_ratio = matched_keywords / len(req_keywords) if req_keywords else 1.0
@@ -334,7 +386,7 @@ class QualityAssuranceFramework:
         implemented_features = 0
 
         for feature in specific_features:
-            if self._check_feature_implementation(feature, script_content):
+            if self._check_feature_implementation(feature, artifact):
                 implemented_features += 1
                 passed_checks.append(f"{feature} 기능 구현 확인")
             else:
@@ -394,7 +446,7 @@ class QualityAssuranceFramework:
 
         return features
 
-    def _check_feature_implementation(self, feature: str, script_content: str) -> bool:
+    def _check_feature_implementation(self, feature: str, artifact: ScriptArtifact) -> bool:
         """기능 구현 여부 확인"""
         feature_keywords = {
             '분석': ['analyze', 'analysis', '분석', 'research'],
@@ -406,13 +458,14 @@ class QualityAssuranceFramework:
         }
 
         keywords = feature_keywords.get(feature, [])
-        return any(keyword.lower() in script_content.lower() for keyword in keywords)
+        return any(keyword.lower() in artifact.content_lower for keyword in keywords)
 
-    def _check_execution_readiness(self, script_content: str, project_path: str) -> Tuple[float, List[QualityIssue], List[str]]:
+    def _check_execution_readiness(self, artifact: ScriptArtifact, project_path: str) -> Tuple[float, List[QualityIssue], List[str]]:
         """Stage 4: 실행 가능성 시뮬레이션"""
         issues = []
         passed_checks = []
         score = 1.0
+        script_content = artifact.content
 
         # import 문 검사
         required_imports = ['crewai', 'Agent', 'Task', 'Crew']
@@ -439,7 +492,7 @@ class QualityAssuranceFramework:
         else:
             # API 키 관련 키워드가 있으면 환경변수 사용 권장
             api_keywords = ['api_key', 'key', 'token']
-            if any(keyword in script_content.lower() for keyword in api_keywords):
+            if any(keyword in artifact.content_lower for keyword in api_keywords):
                 issues.append(QualityIssue(
                     category="execution",
                     severity="medium",
@@ -451,7 +504,7 @@ class QualityAssuranceFramework:
         # 파일 경로 처리 검사
         if 'Path(' in script_content or 'pathlib' in script_content:
             passed_checks.append("안전한 경로 처리 확인")
-        elif '\\' in script_content or re.search(r'["\'][A-Z]:', script_content):
+        elif '\\' in script_content or WINDOWS_DRIVE_PATH_RE.search(script_content):
             issues.append(QualityIssue(
                 category="execution",
                 severity="medium",
@@ -487,21 +540,16 @@ class QualityAssuranceFramework:
 
         return max(score, 0.0), issues, passed_checks
 
-    def _check_security(self, script_content: str) -> Tuple[float, List[QualityIssue], List[str]]:
+    def _check_security(self, artifact: ScriptArtifact) -> Tuple[float, List[QualityIssue], List[str]]:
         """Stage 5: 보안 검토"""
         issues = []
         passed_checks = []
         score = 1.0
+        script_content = artifact.content
 
         # API 키 하드코딩 검사
-        api_key_patterns = [
-            r'api_key\s*=\s*["\'][^"\']{20,}["\']',
-            r'token\s*=\s*["\'][^"\']{20,}["\']',
-            r'key\s*=\s*["\'][^"\']{20,}["\']'
-        ]
-
-        for pattern in api_key_patterns:
-            if re.search(pattern, script_content, re.IGNORECASE):
+        for pattern in API_KEY_RES:
+            if pattern.search(script_content):
                 issues.append(QualityIssue(
                     category="security",
                     severity="critical",
@@ -559,7 +607,7 @@ class QualityAssuranceFramework:
 
         # 로깅 보안 검사
         if 'logging' in script_content:
-            if any(sensitive in script_content.lower() for sensitive in ['password', 'token', 'key']):
+            if any(sensitive in artifact.content_lower for sensitive in ['password', 'token', 'key']):
                 issues.append(QualityIssue(
                     category="security",
                     severity="medium",
@@ -572,21 +620,16 @@ class QualityAssuranceFramework:
 
         return max(score, 0.0), issues, passed_checks
 
-    def _check_performance(self, script_content: str) -> Tuple[float, List[QualityIssue], List[str]]:
+    def _check_performance(self, artifact: ScriptArtifact) -> Tuple[float, List[QualityIssue], List[str]]:
         """Stage 6: 성능 검토"""
         issues = []
         passed_checks = []
         score = 1.0
+        script_content = artifact.content
 
         # 비효율적 패턴 검사
-        inefficient_patterns = {
-            r'for.*in.*range\(len\(': '비효율적인 리스트 순회',
-            r'time\.sleep\(\d+\)': '긴 sleep 구문',
-            r'while\s+True:.*time\.sleep': '무한 루프와 sleep 조합'
-        }
-
-        for pattern, description in inefficient_patterns.items():
-            if re.search(pattern, script_content):
+        for pattern, description in INEFFICIENT_PATTERN_RES:
+            if pattern.search(script_content):
                 issues.append(QualityIssue(
                     category="performance",
                     severity="medium",
@@ -676,17 +719,24 @@ class QualityAssuranceFramework:
             return QualityLevel.CRITICAL
 
     def _generate_recommendations(self, stage_scores: Dict[str, float],
-                                issues: List[QualityIssue]) -> List[str]:
+                                issues: List[QualityIssue],
+                                skipped_stages: Optional[List[str]] = None) -> List[str]:
         """추천사항 생성"""
         recommendations = []
+        skipped_stages = skipped_stages or []
 
         # 심각한 이슈 우선 해결
         critical_issues = [issue for issue in issues if issue.severity == "critical"]
         if critical_issues:
             recommendations.append(f"🔴 {len(critical_issues)}개 치명적 이슈 즉시 해결 필요")
 
+        if skipped_stages:
+            recommendations.append(f"⏭️  구문 오류로 {len(skipped_stages)}개 단계 검사 생략 - 구문 수정 후 재검증 필요")
+
         # 단계별 개선사항
         for stage, score in stage_scores.items():
+            if stage in skipped_stages:
+                continue
             if score < self.quality_thresholds[stage]:
                 stage_names = {
                     'syntax': '구문 및 문법',
@@ -731,6 +781,8 @@ class QualityAssuranceFramework:
             "quality_level": report.quality_level.value,
             "stage_scores": report.stage_scores,
             "is_production_ready": report.is_production_ready,
+            "stage_timings": report.stage_timings,
+            "skipped_stages": report.skipped_stages,
             "issues": [
                 {
                     "category": issue.category,
@@ -0,0 +1,261 @@
+# -*- coding: utf-8 -*-
+"""
+요청 속도 제한 (Rate Limiter)
+슬라이딩 윈도우 카운터 - 키당 O(1) 메모리, 유휴 키 LRU 제거, 다중 워커 공유용 SQLite 백엔드, 신뢰 프록시 기반 클라이언트 IP 판별
+"""
+
+import os
+import time
+import math
+import sqlite3
+import ipaddress
+import threading
+from collections import OrderedDict
+from functools import wraps
+from typing import List, Optional, Tuple
+import logging
+
+from flask import request, jsonify
+
+logger = logging.getLogger(__name__)
+
+
+class MemoryBackend:
+    """프로세스 내 슬라이딩 윈도우 카운터 (키 수 제한 LRU)"""
+
+    def __init__(self, max_keys: int = 10000):
+        self.max_keys = max_keys
+        # key -> [윈도우 시작 시각, 현재 윈도우 카운트, 이전 윈도우 카운트]
+        self._counters: "OrderedDict[str, List[float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def hit(self, key: str, limit: int, window_seconds: int, now: float) -> Tuple[bool, float]:
+        window_start = math.floor(now / window_seconds) * window_seconds
+
+        with self._lock:
+            counter = self._counters.get(key)
+            if counter is None:
+                counter = [window_start, 0, 0]
+                self._counters[key] = counter
+            else:
+                self._counters.move_to_end(key)
+
+            _roll_window(counter, window_start, window_seconds)
+            allowed, estimate = _evaluate(counter, limit, window_seconds, now)
+
+            while len(self._counters) > self.max_keys:
+                self._counters.popitem(last=False)
+
+        return allowed, estimate
+
+
+class SQLiteBackend:
+    """여러 gunicorn 워커가 공유하는 SQLite 슬라이딩 윈도우 카운터"""
+
+    def __init__(self, db_path: str, max_keys: int = 10000):
+        self.db_path = db_path
+        self.max_keys = max_keys
+        self._local = threading.local()
+        self._hits_since_prune = 0
+        self._prune_lock = threading.Lock()
+
+        conn = self._connect()
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS rate_limits (
+                rate_key TEXT PRIMARY KEY,
+                window_start REAL NOT NULL,
+                current_count INTEGER NOT NULL,
+                previous_count INTEGER NOT NULL,
+                last_seen REAL NOT NULL
+            )
+        """)
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_rate_limits_last_seen ON rate_limits (last_seen)")
+        conn.commit()
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, timeout=5, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            self._local.conn = conn
+        return conn
+
+    def hit(self, key: str, limit: int, window_seconds: int, now: float) -> Tuple[bool, float]:
+        window_start = math.floor(now / window_seconds) * window_seconds
+        conn = self._connect()
+
+        # 워커 간 경쟁을 막기 위해 쓰기 잠금을 먼저 획득
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            row = conn.execute(
+                "SELECT window_start, current_count, previous_count FROM rate_limits WHERE rate_key = ?",
+                (key,)
+            ).fetchone()
+            counter = list(row) if row else [window_start, 0, 0]
+
+            _roll_window(counter, window_start, window_seconds)
+            allowed, estimate = _evaluate(counter, limit, window_seconds, now)
+
+            conn.execute(
+                "INSERT OR REPLACE INTO rate_limits (rate_key, window_start, current_count, previous_count, last_seen) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (key, counter[0], counter[1], counter[2], now)
+            )
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+
+        with self._prune_lock:
+            self._hits_since_prune += 1
+            should_prune = self._hits_since_prune >= 1000
+            if should_prune:
+                self._hits_since_prune = 0
+        if should_prune:
+            self._prune(conn)
+
+        return allowed, estimate
+
+    def _prune(self, conn: sqlite3.Connection) -> None:
+        """가장 오래 사용되지 않은 키부터 제한 개수를 넘는 만큼 삭제"""
+        conn.execute(
+            "DELETE FROM rate_limits WHERE rate_key IN ("
+            "SELECT rate_key FROM rate_limits ORDER BY last_seen DESC LIMIT -1 OFFSET ?)",
+            (self.max_keys,)
+        )
+
+
+def _roll_window(counter: List[float], window_start: float, window_seconds: int) -> None:
+    """현재 시각의 윈도우로 카운터 이동"""
+    if window_start <= counter[0]:
+        # 같은 윈도우 (워커 간 시계 오차로 과거 시각이 들어온 경우 포함)
+        return
+    if window_start - counter[0] == window_seconds:
+        counter[2] = counter[1]
+    else:
+        counter[2] = 0
+    counter[0] = window_start
+    counter[1] = 0
+
+
+def _evaluate(counter: List[float], limit: int, window_seconds: int, now: float) -> Tuple[bool, float]:
+    """이전 윈도우 가중치를 반영한 추정 요청 수로 허용 여부 판단 (허용 시 카운트 증가)"""
+    elapsed_fraction = (now - counter[0]) / window_seconds
+    estimate = counter[2] * (1 - elapsed_fraction) + counter[1]
+    if estimate >= limit:
+        return False, estimate
+    counter[1] += 1
+    return True, estimate + 1
+
+
+class RateLimiter:
+    """슬라이딩 윈도우 요청 제한기"""
+
+    def __init__(self, backend=None, trusted_proxies: Optional[List[str]] = None):
+        self.backend = backend or MemoryBackend()
+        self.trusted_proxies = [
+            ipaddress.ip_network(proxy.strip(), strict=False)
+            for proxy in (trusted_proxies or [])
+            if proxy.strip()
+        ]
+
+    def hit(self, key: str, limit: int, window_seconds: int) -> Tuple[bool, int, int]:
+        """
+        요청 1회 기록
+
+        Returns:
+            Tuple[bool, int, int]: (허용 여부, 남은 요청 수, 재시도 대기 초)
+        """
+        now = time.time()
+        try:
+            allowed, estimate = self.backend.hit(key, limit, window_seconds, now)
+        except Exception as e:
+            # 백엔드 장애로 서비스 전체가 막히지 않도록 허용 처리
+            logger.error(f"Rate limit 백엔드 오류 (요청 허용): {str(e)}")
+            return True, limit, 0
+
+        remaining = max(0, int(limit - estimate))
+        retry_after = 0 if allowed else int(math.ceil(window_seconds - (now % window_seconds)))
+        return allowed, remaining, retry_after
+
+    def get_client_ip(self, environ: dict) -> str:
+        """
+        클라이언트 IP 판별
+
+        직접 연결한 주소가 신뢰 프록시일 때만 X-Forwarded-For를 사용하며,
+        오른쪽부터 신뢰 프록시를 건너뛴 첫 주소를 클라이언트로 간주 (위조된 왼쪽 값 무시)
+        """
+        remote_addr = environ.get('REMOTE_ADDR', 'unknown')
+        if not self._is_trusted(remote_addr):
+            return remote_addr
+
+        forwarded_for = environ.get('HTTP_X_FORWARDED_FOR', '')
+        hops = [hop.strip() for hop in forwarded_for.split(',') if hop.strip()]
+        for hop in reversed(hops):
+            if not self._is_trusted(hop):
+                return hop
+        return hops[0] if hops else remote_addr
+
+    def _is_trusted(self, address: str) -> bool:
+        if not self.trusted_proxies:
+            return False
+        try:
+            ip = ipaddress.ip_address(address)
+        except ValueError:
+            return False
+        return any(ip in network for network in self.trusted_proxies)
+
+
+def create_rate_limiter_from_env() -> RateLimiter:
+    """환경변수 기반 제한기 생성
+
+    RATE_LIMIT_DB: SQLite 파일 경로 (설정 시 워커 간 공유, 미설정 시 프로세스 메모리)
+    RATE_LIMIT_MAX_KEYS: 보관할 최대 클라이언트 키 수 (기본 10000)
+    TRUSTED_PROXIES: X-Forwarded-For를 신뢰할 프록시 IP/CIDR 목록 (쉼표 구분)
+    """
+    max_keys = int(os.getenv('RATE_LIMIT_MAX_KEYS', '10000'))
+    db_path = os.getenv('RATE_LIMIT_DB')
+    trusted_proxies = os.getenv('TRUSTED_PROXIES', '').split(',')
+
+    backend = None
+    if db_path:
+        try:
+            backend = SQLiteBackend(db_path, max_keys=max_keys)
+        except sqlite3.Error as e:
+            logger.warning(f"SQLite rate limit 백엔드 초기화 실패, 메모리 사용: {str(e)}")
+
+    return RateLimiter(backend or MemoryBackend(max_keys=max_keys), trusted_proxies)
+
+
+# 전역 제한기 인스턴스
+rate_limiter = create_rate_limiter_from_env()
+
+
+def rate_limit(max_requests=60, window_seconds=60):
+    """Rate limiting decorator (클라이언트 IP + 엔드포인트 단위)"""
+    def decorator(f):
+        scope = f"{f.__module__}.{f.__name__}"
+
+        @wraps(f)
+        def decorated(*args, **kwargs):
+            client_ip = rate_limiter.get_client_ip(request.environ)
+            allowed, remaining, retry_after = rate_limiter.hit(
+                f"{scope}:{client_ip}", max_requests, window_seconds
+            )
+
+            if not allowed:
+                response = jsonify({
+                    'error': 'Rate limit exceeded',
+                    'message': f'최대 {max_requests}개의 요청이 {window_seconds}초 내에 허용됩니다',
+                    'retry_after': retry_after
+                })
+                response.status_code = 429
+                response.headers['Retry-After'] = str(retry_after)
+                response.headers['X-RateLimit-Limit'] = str(max_requests)
+                response.headers['X-RateLimit-Remaining'] = '0'
+                return response
+
+            return f(*args, **kwargs)
+
+        return decorated
+    return decorator
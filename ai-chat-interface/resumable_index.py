@@ -0,0 +1,214 @@
+# -*- coding: utf-8 -*-
+"""
+재개 가능 프로젝트 색인 (Resumable Project Index)
+프로젝트 기본 디렉토리마다 SQLite 파일 하나에 재개 가능한 프로젝트만 기록 - ProjectStateManager가 상태 저장 시 갱신
+채팅의 재개 요청은 전체 디렉토리 스캔/JSON 파싱 없이 색인만 조회 (여러 프로세스가 같은 색인을 공유)
+"""
+
+import os
+import json
+import sqlite3
+import threading
+from contextlib import closing, contextmanager
+from typing import Any, Dict, Iterator, List, Optional
+import logging
+
+logger = logging.getLogger(__name__)
+
+INDEX_FILENAME = '.resumable_projects.db'
+STATUS_FILENAME = 'project_status.json'
+
+# 색인 구조가 바뀌면 올려서 기존 색인을 다시 구축
+INDEX_VERSION = '1'
+
+
+def resumable_entry(project_id: str, status_data: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    """상태 데이터에서 색인 항목 생성 (재개 불가면 None)"""
+    if not status_data or not status_data.get('can_resume', False):
+        return None
+    return {
+        'id': project_id,
+        'name': status_data.get('project_name', project_id),
+        'resume_point': status_data.get('resume_point'),
+        'status': status_data.get('status'),
+        'updated_at': status_data.get('updated_at')
+    }
+
+
+class ResumableProjectIndex:
+    """기본 디렉토리 하나의 재개 가능 프로젝트 색인 (SQLite 실패 시 디렉토리 스캔으로 대체)"""
+
+    def __init__(self, base_dir: str):
+        self.base_dir = base_dir
+        self.sqlite_path: Optional[str] = os.path.join(base_dir, INDEX_FILENAME)
+        self._lock = threading.Lock()
+        self._stats = {'lookups': 0, 'updates': 0, 'rebuilds': 0, 'stale_removed': 0}
+        self._init_sqlite()
+
+    # ==================== 공개 API ====================
+
+    def update(self, project_id: str, status_data: Optional[Dict[str, Any]]) -> None:
+        """프로젝트 상태 저장 후 호출 - 재개 가능하면 추가/갱신, 아니면 제거"""
+        if not self.sqlite_path:
+            return
+        entry = resumable_entry(project_id, status_data)
+        try:
+            with self._connect() as conn:
+                if entry is None:
+                    conn.execute("DELETE FROM resumable_projects WHERE project_id = ?", (project_id,))
+                else:
+                    conn.execute(
+                        "INSERT OR REPLACE INTO resumable_projects "
+                        "(project_id, name, resume_point, status, updated_at) VALUES (?, ?, ?, ?, ?)",
+                        (project_id, entry['name'], entry['resume_point'], entry['status'], entry['updated_at'])
+                    )
+            with self._lock:
+                self._stats['updates'] += 1
+        except sqlite3.Error as e:
+            logger.warning(f"재개 가능 프로젝트 색인 갱신 실패: {str(e)}")
+
+    def list_resumable(self) -> List[Dict[str, Any]]:
+        """재개 가능한 프로젝트 목록 (최근 갱신 순) - 색인이 없으면 최초 1회 구축"""
+        with self._lock:
+            self._stats['lookups'] += 1
+        if not self.sqlite_path:
+            return self.scan()
+
+        try:
+            with self._connect() as conn:
+                if self._get_meta(conn, 'version') != INDEX_VERSION:
+                    self._rebuild(conn)
+                rows = conn.execute(
+                    "SELECT project_id, name, resume_point, status, updated_at FROM resumable_projects "
+                    "ORDER BY updated_at DESC"
+                ).fetchall()
+
+                # 색인 이후 삭제된 프로젝트 정리 (재개 가능 항목 수만큼만 확인)
+                projects = []
+                for project_id, name, resume_point, status, updated_at in rows:
+                    if not os.path.isdir(os.path.join(self.base_dir, project_id)):
+                        conn.execute("DELETE FROM resumable_projects WHERE project_id = ?", (project_id,))
+                        with self._lock:
+                            self._stats['stale_removed'] += 1
+                        continue
+                    projects.append({
+                        'id': project_id,
+                        'name': name,
+                        'resume_point': resume_point,
+                        'status': status,
+                        'updated_at': updated_at
+                    })
+                return projects
+        except sqlite3.Error as e:
+            logger.warning(f"재개 가능 프로젝트 색인 조회 실패, 디렉토리 스캔으로 대체: {str(e)}")
+            return self.scan()
+
+    def rebuild(self) -> None:
+        """디렉토리 전체를 다시 스캔하여 색인 재구축 (상태 파일을 외부에서 직접 수정한 경우 등)"""
+        if not self.sqlite_path:
+            return
+        try:
+            with self._connect() as conn:
+                self._rebuild(conn)
+        except sqlite3.Error as e:
+            logger.warning(f"재개 가능 프로젝트 색인 재구축 실패: {str(e)}")
+
+    def scan(self) -> List[Dict[str, Any]]:
+        """전체 디렉토리 스캔 (프로젝트당 상태 파일 1회 파싱)"""
+        projects = []
+        try:
+            entries = list(os.scandir(self.base_dir))
+        except OSError:
+            return projects
+
+        for entry in entries:
+            if entry.name.startswith('.') or not entry.is_dir():
+                continue
+            status_file = os.path.join(entry.path, STATUS_FILENAME)
+            if not os.path.exists(status_file):
+                continue
+            try:
+                with open(status_file, 'r', encoding='utf-8') as f:
+                    project = resumable_entry(entry.name, json.load(f))
+            except Exception as e:
+                print(f"프로젝트 {entry.name} 상태 확인 오류: {e}")
+                continue
+            if project is not None:
+                projects.append(project)
+
+        projects.sort(key=lambda project: str(project['updated_at'] or ''), reverse=True)
+        return projects
+
+    def get_stats(self) -> Dict:
+        with self._lock:
+            stats = dict(self._stats)
+        stats['sqlite_path'] = self.sqlite_path
+        return stats
+
+    # ==================== SQLite ====================
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """블록 종료 시 커밋(예외 시 롤백)하고 연결을 닫음"""
+        # 실행 스크립트(별도 프로세스)와 서버가 동시에 쓰므로 잠금 대기 허용
+        with closing(sqlite3.connect(self.sqlite_path, timeout=5.0)) as conn:
+            try:
+                yield conn
+                conn.commit()
+            except BaseException:
+                conn.rollback()
+                raise
+
+    def _init_sqlite(self) -> None:
+        try:
+            os.makedirs(self.base_dir, exist_ok=True)
+            with self._connect() as conn:
+                conn.execute("""
+                    CREATE TABLE IF NOT EXISTS resumable_projects (
+                        project_id TEXT PRIMARY KEY,
+                        name TEXT,
+                        resume_point TEXT,
+                        status TEXT,
+                        updated_at TEXT
+                    )
+                """)
+                conn.execute("CREATE TABLE IF NOT EXISTS index_meta (key TEXT PRIMARY KEY, value TEXT)")
+        except (sqlite3.Error, OSError) as e:
+            logger.warning(f"재개 가능 프로젝트 색인 초기화 실패, 디렉토리 스캔 사용: {str(e)}")
+            self.sqlite_path = None
+
+    @staticmethod
+    def _get_meta(conn: sqlite3.Connection, key: str) -> Optional[str]:
+        row = conn.execute("SELECT value FROM index_meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def _rebuild(self, conn: sqlite3.Connection) -> None:
+        projects = self.scan()
+        conn.execute("DELETE FROM resumable_projects")
+        conn.executemany(
+            "INSERT OR REPLACE INTO resumable_projects "
+            "(project_id, name, resume_point, status, updated_at) VALUES (?, ?, ?, ?, ?)",
+            [(p['id'], p['name'], p['resume_point'], p['status'], p['updated_at']) for p in projects]
+        )
+        conn.execute("INSERT OR REPLACE INTO index_meta (key, value) VALUES ('version', ?)", (INDEX_VERSION,))
+        with self._lock:
+            self._stats['rebuilds'] += 1
+        logger.info(f"재개 가능 프로젝트 색인 구축: {self.base_dir} ({len(projects)}개)")
+
+
+# 기본 디렉토리별 색인 인스턴스
+_indexes: Dict[str, ResumableProjectIndex] = {}
+_indexes_lock = threading.Lock()
+
+
+def get_resumable_index(base_dir: str) -> ResumableProjectIndex:
+    """기본 디렉토리의 색인 인스턴스 반환 (프로세스당 디렉토리별 1개)"""
+    key = os.path.abspath(base_dir)
+    index = _indexes.get(key)
+    if index is None:
+        with _indexes_lock:
+            index = _indexes.get(key)
+            if index is None:
+                index = ResumableProjectIndex(key)
+                _indexes[key] = index
+    return index
@@ -8,9 +8,62 @@ CrewAI 스크립트 검증 시스템
 import os
 import ast
 import sys
+import copy
+import time
+import hashlib
+import threading
+import importlib.util
+from collections import OrderedDict
 from typing import Dict, List, Optional
 from datetime import datetime
 
+# 검증 결과 캐시 크기 (스크립트 해시 + 인터프리터 환경 기준)
+VALIDATION_CACHE_SIZE = 512
+
+# 미설치 판정 유지 시간 (초) - 서버 실행 중 패키지를 설치해도 이 시간 뒤에는 다시 확인
+MODULE_MISS_TTL_SECONDS = 30
+
+# 설치 확인된 모듈명 (프로세스 공유, 실제 import 없이 find_spec으로 확인)
+_available_modules: set = set()
+# 모듈명 -> 미설치 판정 시각
+_missing_modules: Dict[str, float] = {}
+_module_lock = threading.Lock()
+
+# 캐시 키 -> 문법/Import 검증까지의 validation_results
+_validation_cache: "OrderedDict[str, Dict]" = OrderedDict()
+_validation_lock = threading.Lock()
+
+
+def is_module_available(module_name: str) -> bool:
+    """최상위 모듈 설치 여부 (모듈 코드를 실행하지 않음)"""
+    top_module = module_name.split('.')[0]
+    if top_module in _available_modules:
+        return True
+
+    checked_at = _missing_modules.get(top_module)
+    if checked_at is not None:
+        if time.monotonic() - checked_at < MODULE_MISS_TTL_SECONDS:
+            return False
+        # 그 사이 설치되었을 수 있으므로 경로 탐색 캐시를 비우고 다시 확인
+        importlib.invalidate_caches()
+
+    try:
+        available = importlib.util.find_spec(top_module) is not None
+    except (ImportError, ValueError):
+        available = False
+    with _module_lock:
+        if available:
+            _available_modules.add(top_module)
+            _missing_modules.pop(top_module, None)
+        else:
+            _missing_modules[top_module] = time.monotonic()
+    return available
+
+
+def _environment_fingerprint() -> str:
+    """인터프리터 환경 식별자 (실행 파일, 버전, 모듈 검색 경로)"""
+    return '\n'.join([sys.executable, sys.version] + list(sys.path))
+
 
 class ScriptValidator:
     """생성된 CrewAI 스크립트 검증 클래스"""
@@ -22,6 +75,7 @@ class ScriptValidator:
         """
         self.script_path = script_path
         self.script_content = None
+        self._tree: Optional[ast.AST] = None
         self.validation_results = {
             'overall_valid': True,
             'checks': [],
@@ -63,8 +117,10 @@ class ScriptValidator:
                 return self.validation_results['errors'][0]
 
         try:
-            # compile() 함수로 바이트코드 컴파일 시도
-            compile(self.script_content, self.script_path, 'exec')
+            # AST 파싱 후 바이트코드 컴파일 시도 (AST는 Import 검증에서 재사용)
+            tree = ast.parse(self.script_content, self.script_path)
+            compile(tree, self.script_path, 'exec')
+            self._tree = tree
 
             result = {
                 'valid': True,
@@ -118,7 +174,7 @@ class ScriptValidator:
                 return self.validation_results['errors'][0]
 
         try:
-            tree = ast.parse(self.script_content)
+            tree = self._tree or ast.parse(self.script_content)
         except SyntaxError:
             # 문법 오류가 있으면 import 검증 불가
             result = {
@@ -140,15 +196,8 @@ class ScriptValidator:
                 if node.module:
                     imports.append(node.module)
 
-        # 필수 모듈 확인
-        missing_modules = []
-        for module in imports:
-            # 하위 모듈은 최상위 모듈만 확인
-            top_module = module.split('.')[0]
-            try:
-                __import__(top_module)
-            except ImportError:
-                missing_modules.append(module)
+        # 필수 모듈 확인 (하위 모듈은 최상위 모듈만, import 없이 find_spec으로 확인)
+        missing_modules = [module for module in imports if not is_module_available(module)]
 
         if missing_modules:
             result = {
@@ -222,19 +271,49 @@ class ScriptValidator:
 
         Returns:
             dict: 전체 검증 결과
+
+        같은 내용의 스크립트는 문법/Import 검증 결과를 캐시에서 재사용하고 환경변수 검증만 다시 수행
         """
-        # 1. 문법 검증 (가장 중요)
-        syntax_result = self.validate_syntax()
+        if self.script_content is None and not self._read_script():
+            return self.validation_results
 
-        if not syntax_result['valid'] and quick_mode:
+        cache_key = hashlib.sha256(
+            (_environment_fingerprint() + '\0' + self.script_content).encode('utf-8')
+        ).hexdigest()
+
+        with _validation_lock:
+            cached = _validation_cache.get(cache_key)
+            if cached is not None:
+                _validation_cache.move_to_end(cache_key)
+
+        if cached is not None:
+            validated_at = self.validation_results['validated_at']
+            self.validation_results = copy.deepcopy(cached)
+            self.validation_results['validated_at'] = validated_at
+            self.validation_results['cache_hit'] = True
+            syntax_valid = self.validation_results['checks'][0]['valid']
+        else:
+            # 1. 문법 검증 (가장 중요)
+            syntax_valid = self.validate_syntax()['valid']
+
+            # 2. Import 검증 (문법 통과 시에만)
+            if syntax_valid:
+                self.validate_imports()
+
+            # 미설치 모듈이 있는 결과는 설치 후 달라지므로 캐시하지 않음
+            if not self.validation_results['warnings']:
+                with _validation_lock:
+                    _validation_cache[cache_key] = copy.deepcopy(self.validation_results)
+                    while len(_validation_cache) > VALIDATION_CACHE_SIZE:
+                        _validation_cache.popitem(last=False)
+            self.validation_results['cache_hit'] = False
+
+        if not syntax_valid and quick_mode:
             # 문법 오류 발견 시 즉시 중단
             return self.validation_results
 
-        # 2. Import 검증 (문법 통과 시에만)
-        if syntax_result['valid']:
-            self.validate_imports()
-
-            # 3. 환경변수 검증
+        # 3. 환경변수 검증 (문법 통과 시에만, 실행 시점 환경변수를 반영하므로 캐시하지 않음)
+        if syntax_valid:
             self.validate_environment()
 
         return self.validation_results
@@ -10,6 +10,7 @@ from typing import Dict, Any, List, Optional
 from functools import wraps
 from flask import request, jsonify
 from database import db
+from auth_cache import token_cache, memoize_per_request, hash_token
 
 class InputValidator:
     """입력 데이터 검증 및 정화 클래스"""
@@ -324,6 +325,25 @@ def check_request_security(data: Dict[str, Any]) -> List[str]:
 
 # ==================== AUTHENTICATION DECORATORS ====================
 
+def verify_token_cached(token: str) -> Dict[str, Any]:
+    """JWT 검증 (검증된 payload는 만료 시각까지 캐시, 같은 요청 안에서는 한 번만 검증)"""
+    error_holder = {}
+
+    def verifier(raw_token: str) -> Optional[Dict[str, Any]]:
+        token_result = db.verify_jwt_token(raw_token)
+        if not token_result['success']:
+            error_holder['error'] = token_result['error']
+            return None
+        return token_result['payload']
+
+    payload = memoize_per_request(
+        f"main_token:{hash_token(token)}",
+        lambda: token_cache.verify('main', token, verifier)
+    )
+    if payload is None:
+        return {'success': False, 'error': error_holder.get('error', '유효하지 않은 토큰입니다')}
+    return {'success': True, 'payload': payload}
+
 def token_required(f):
     """JWT token required decorator"""
     @wraps(f)
@@ -340,7 +360,7 @@ def token_required(f):
         if not token:
             return jsonify({'error': 'Token is missing'}), 401
 
-        token_result = db.verify_jwt_token(token)
+        token_result = verify_token_cached(token)
         if not token_result['success']:
             return jsonify({'error': token_result['error']}), 401
 
@@ -359,7 +379,7 @@ def optional_auth(f):
         if auth_header:
             try:
                 token = auth_header.split(' ')[1]
-                token_result = db.verify_jwt_token(token)
+                token_result = verify_token_cached(token)
                 if token_result['success']:
                     request.current_user = token_result['payload']
             except:
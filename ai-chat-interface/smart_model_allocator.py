@@ -7,6 +7,10 @@ JSON 설정 파일을 통해 LLM 모델 조합을 유연하게 관리
 
 import json
 import os
+import copy
+import time
+import threading
+from collections import OrderedDict
 from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass
 from pathlib import Path
@@ -38,6 +42,12 @@ class ModelAllocation:
     env_keys_required: List[str]  # 필요한 환경변수 목록
     missing_env_keys: List[str]   # 누락된 환경변수 목록
 
+# 설정 파일 변경 확인 최소 간격 (초) - 요청마다 stat 호출하지 않도록 제한
+CONFIG_CHECK_INTERVAL = 2.0
+
+# 메모이즈할 최대 할당 결과 수
+ALLOCATION_CACHE_SIZE = 256
+
 class SmartModelAllocator:
     """스마트 모델 할당 시스템"""
 
@@ -46,15 +56,94 @@ class SmartModelAllocator:
         self.config_dir = Path(config_path).parent
         self.config_dir.mkdir(exist_ok=True)
 
-        self.model_config = self._load_or_create_config()
-        self.model_specs = self._parse_model_specs()
-        self.env_status = self._validate_environment_keys()
+        # 설정 교체와 할당 계산이 섞이지 않도록 보호 (할당 중 재로드 시 대기)
+        self._lock = threading.RLock()
+        self._config_signature = None
+        self._last_checked = 0.0
+        self._config_version = 0
+        self._allocation_cache: "OrderedDict[Tuple, ModelAllocation]" = OrderedDict()
+        self._stats = {'hits': 0, 'misses': 0, 'reloads': 0}
+        self.env_status = None
+
+        self._load_state()
+
+    def _get_config_signature(self) -> Optional[Tuple[float, int]]:
+        """설정 파일 (mtime, 크기) - 파일이 없으면 None"""
+        try:
+            stat = os.stat(self.config_path)
+        except OSError:
+            return None
+        return (stat.st_mtime, stat.st_size)
+
+    def _load_state(self, model_config: Optional[Dict] = None):
+        """설정 로드/파싱 후 한 번에 교체"""
+        if model_config is None:
+            model_config = self._load_or_create_config()
+        signature = self._get_config_signature()
+
+        with self._lock:
+            previous_config = self.__dict__.get('model_config')
+            self.model_config = model_config
+            try:
+                self.model_specs = self._parse_model_specs()
+            except Exception:
+                # 잘못된 설정은 반영하지 않고 기존 설정 유지
+                if previous_config is None:
+                    raise
+                self.model_config = previous_config
+                raise
+            self._config_signature = signature
+            self._last_checked = time.time()
+            self._config_version += 1
+            self._allocation_cache.clear()
+            self._refresh_env_status()
+
+    def _refresh_env_status(self):
+        """환경변수 상태 갱신 - 변경된 경우에만 출력"""
+        env_status = self._validate_environment_keys()
+        if env_status == self.env_status:
+            return
+
+        self.env_status = env_status
+        self._allocation_cache.clear()
 
         # 환경변수 상태 출력
-        if self.env_status['missing_keys']:
-            print(f"WARNING: 누락된 환경변수: {', '.join(self.env_status['missing_keys'])}")
-        if self.env_status['available_keys']:
-            print(f"OK: 사용 가능한 환경변수: {', '.join(self.env_status['available_keys'])}")
+        if env_status['missing_keys']:
+            print(f"WARNING: 누락된 환경변수: {', '.join(env_status['missing_keys'])}")
+        if env_status['available_keys']:
+            print(f"OK: 사용 가능한 환경변수: {', '.join(env_status['available_keys'])}")
+
+    def refresh_if_changed(self, force: bool = False) -> bool:
+        """
+        설정 파일이 바뀌었으면 재로드 (mtime/크기 비교, CONFIG_CHECK_INTERVAL 간격으로만 확인)
+
+        Returns:
+            bool: 재로드 여부
+        """
+        now = time.time()
+        if not force and now - self._last_checked < CONFIG_CHECK_INTERVAL:
+            return False
+
+        with self._lock:
+            self._last_checked = now
+            signature = self._get_config_signature()
+            if signature == self._config_signature or signature is None:
+                self._refresh_env_status()
+                return False
+
+            try:
+                # 편집 중인 파일을 기본 설정으로 덮어쓰지 않도록 파싱 실패 시 기존 설정 유지
+                with open(self.config_path, 'r', encoding='utf-8') as f:
+                    model_config = json.load(f)
+                self._load_state(model_config)
+            except Exception as e:
+                print(f"모델 설정 재로드 실패, 기존 설정 유지: {e}")
+                self._config_signature = signature
+                return False
+
+            self._stats['reloads'] += 1
+            print("모델 설정 파일 변경 감지 - 재로드되었습니다.")
+            return True
 
     def _load_or_create_config(self) -> Dict:
         """설정 파일 로드 또는 생성"""
@@ -325,15 +414,48 @@ class SmartModelAllocator:
 
     def reload_config(self):
         """설정 파일 재로드 (핫 리로드)"""
-        self.model_config = self._load_or_create_config()
-        self.model_specs = self._parse_model_specs()
+        self._load_state()
         print("모델 설정이 재로드되었습니다.")
 
     def allocate_models(self, agent_selection: AgentSelection,
                        analysis: RequirementAnalysis,
                        budget: str = "medium",
                        strategy: str = "balanced") -> ModelAllocation:
-        """에이전트별 최적 모델 할당"""
+        """에이전트별 최적 모델 할당 (같은 입력/설정 버전이면 메모이즈된 결과 반환)"""
+        with self._lock:
+            cache_key = self._make_allocation_key(agent_selection, analysis, budget, strategy)
+            allocation = self._allocation_cache.get(cache_key)
+            if allocation is not None:
+                self._allocation_cache.move_to_end(cache_key)
+                self._stats['hits'] += 1
+            else:
+                self._stats['misses'] += 1
+                allocation = self._compute_allocation(agent_selection, analysis, budget, strategy)
+                self._allocation_cache[cache_key] = allocation
+                while len(self._allocation_cache) > ALLOCATION_CACHE_SIZE:
+                    self._allocation_cache.popitem(last=False)
+
+        # 호출자가 결과를 수정해도 캐시가 오염되지 않도록 복사본 반환
+        return copy.deepcopy(allocation)
+
+    def _make_allocation_key(self, agent_selection: AgentSelection,
+                             analysis: RequirementAnalysis,
+                             budget: str, strategy: str) -> Tuple:
+        """할당 결과에 영향을 주는 입력만으로 구성한 캐시 키"""
+        complexity = getattr(analysis.complexity, 'value', analysis.complexity)
+        return (
+            self._config_version,
+            tuple(agent.name for agent in agent_selection.agents),
+            analysis.domain,
+            complexity,
+            budget,
+            strategy
+        )
+
+    def _compute_allocation(self, agent_selection: AgentSelection,
+                            analysis: RequirementAnalysis,
+                            budget: str, strategy: str) -> ModelAllocation:
+        """에이전트별 최적 모델 할당 계산"""
 
         # 1. 예산 및 전략 설정
         budget_limit = self.model_config["budget_constraints"]["cost_limits"][budget]
@@ -753,9 +875,11 @@ class SmartModelAllocator:
                 else:
                     base_dict[key] = value
 
-        deep_update(self.model_config, updates)
-        self._save_config(self.model_config)
-        self.reload_config()
+        with self._lock:
+            updated_config = copy.deepcopy(self.model_config)
+            deep_update(updated_config, updates)
+            self._save_config(updated_config)
+            self.reload_config()
 
     def get_available_models(self) -> List[str]:
         """사용 가능한 모델 목록"""
@@ -767,6 +891,35 @@ class SmartModelAllocator:
             return self.model_config["model_pool"][model_name]
         return None
 
+    def get_stats(self) -> Dict:
+        """할당 캐시 / 재로드 통계"""
+        with self._lock:
+            stats = dict(self._stats)
+            stats['cache_size'] = len(self._allocation_cache)
+            stats['config_version'] = self._config_version
+        return stats
+
+
+# 설정 파일 경로별 프로세스 공유 인스턴스
+_allocators: Dict[str, SmartModelAllocator] = {}
+_allocators_lock = threading.Lock()
+
+
+def get_model_allocator(config_path: str = "model_config.json") -> SmartModelAllocator:
+    """공유 SmartModelAllocator 반환 (최초 호출 시 생성, 이후 설정 파일 변경 시 자동 재로드)"""
+    key = os.path.abspath(config_path)
+    allocator = _allocators.get(key)
+    if allocator is None:
+        with _allocators_lock:
+            allocator = _allocators.get(key)
+            if allocator is None:
+                allocator = SmartModelAllocator(config_path)
+                _allocators[key] = allocator
+                return allocator
+
+    allocator.refresh_if_changed()
+    return allocator
+
 def main():
     """테스트 함수"""
     from intelligent_requirement_analyzer import IntelligentRequirementAnalyzer
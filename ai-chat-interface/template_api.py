@@ -8,16 +8,10 @@ from flask import Blueprint, request, jsonify
 from template_manager import template_manager
 from security_utils import validate_request_data, check_request_security
 from database import db
+from rate_limiter import rate_limit
 
 template_bp = Blueprint('template', __name__, url_prefix='/api/templates')
 
-# Rate limiting decorator (if available)
-def rate_limit(max_requests, window_seconds):
-    """Rate limiting decorator - simple implementation"""
-    def decorator(func):
-        return func
-    return decorator
-
 @template_bp.route('/', methods=['GET'])
 @rate_limit(30, 60)
 def get_all_templates():
@@ -77,7 +71,11 @@ def search_templates():
                 'error': '검색어가 필요합니다'
             }), 400
 
-        result = template_manager.search_templates(query)
+        result = template_manager.search_templates(
+            query,
+            category=request.args.get('category'),
+            framework=request.args.get('framework')
+        )
         return jsonify(result)
     except Exception as e:
         return jsonify({
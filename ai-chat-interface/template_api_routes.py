@@ -103,11 +103,16 @@ def search_templates():
                 'message': '검색어가 필요합니다'
             }), 400
 
-        templates = template_manager.search_templates(query)
+        templates = template_manager.search_templates(
+            query,
+            project_type=request.args.get('project_type'),
+            framework=request.args.get('framework')
+        )
         return jsonify({
             'success': True,
             'query': query,
             'templates': [t.to_dict() for t in templates],
+            'facets': template_manager.get_search_facets(query),
             'count': len(templates)
         })
     except Exception as e:
@@ -0,0 +1,264 @@
+# -*- coding: utf-8 -*-
+"""
+템플릿 검색 색인 (Template Search Index)
+템플릿 이름/설명/태그를 토큰 역색인으로 한 번만 구축 - 한글 조사 정규화, 접두어 매칭, 점수 순위, 카테고리/프레임워크 패싯
+templates/*.json 변경 시 자동 재구축
+"""
+
+import os
+import re
+import glob
+import time
+import bisect
+import threading
+import unicodedata
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+# 색인 재구축 여부 확인 주기 (초) - 검색마다 파일 stat을 하지 않도록 제한
+INDEX_CHECK_INTERVAL = 2.0
+
+# 접두어 매칭 점수 비율 (완전 일치 대비)
+PREFIX_MATCH_RATIO = 0.6
+
+# 토큰 일치 결과가 없을 때 원문 부분 문자열로 일치하는 경우의 점수 (기존 검색 결과 보존용)
+SUBSTRING_MATCH_SCORE = 0.1
+
+# 한글 토큰 끝에서 제거할 조사 (긴 것부터 검사)
+# 목적격/보조사 등은 명사 끝 글자와 겹치는 경우가 드물어 한 글자 어간까지 허용 (예: 앱을 -> 앱)
+HANGUL_PARTICLES_STRICT = ['에서', '에게', '으로', '까지', '부터', '처럼', '보다', '을', '를', '은', '는']
+# 이/가/의/로 등은 명사 끝 글자와 겹치기 쉬워 (예: 국가, 회의) 두 글자 이상 어간만 허용
+HANGUL_PARTICLES_LOOSE = ['이나', '하고', '이', '가', '의', '에', '로', '와', '과', '도', '만', '나']
+HANGUL_PARTICLES = sorted(
+    [(particle, 1) for particle in HANGUL_PARTICLES_STRICT] +
+    [(particle, 2) for particle in HANGUL_PARTICLES_LOOSE],
+    key=lambda item: len(item[0]), reverse=True
+)
+
+TOKEN_RE = re.compile(r'[0-9a-z]+|[가-힣]+|[ㄱ-ㆎ]+|[^\W_]+')
+HANGUL_SYLLABLE_RE = re.compile(r'^[가-힣]+$')
+
+
+def normalize_text(text: str) -> str:
+    """유니코드 정규화(NFKC) + 소문자 - 자모 분리 입력/전각 문자도 같은 형태로 맞춤"""
+    return unicodedata.normalize('NFKC', text or '').lower()
+
+
+def _strip_particle(token: str) -> str:
+    """한글 토큰 끝의 조사 제거 (조사별 최소 어간 길이 이상 남을 때만)"""
+    if not HANGUL_SYLLABLE_RE.match(token):
+        return token
+    for particle, min_stem in HANGUL_PARTICLES:
+        if token.endswith(particle) and len(token) - len(particle) >= min_stem:
+            return token[:-len(particle)]
+    return token
+
+
+def tokenize(text: str) -> List[str]:
+    """검색 토큰 분리 (영숫자/한글 단위, 한글 조사 제거)"""
+    tokens = []
+    for token in TOKEN_RE.findall(normalize_text(text)):
+        token = _strip_particle(token)
+        if token:
+            tokens.append(token)
+    return tokens
+
+
+class TemplateSearchIndex:
+    """
+    템플릿 토큰 역색인
+
+    documents 항목: {'id', 'fields': [(텍스트, 가중치), ...], 'facets': {패싯명: 값}}
+    """
+
+    def __init__(self, documents: Iterable[Dict[str, Any]]):
+        self.doc_ids: List[str] = []
+        # 토큰 -> {문서 위치: 가중치 합}
+        self.postings: Dict[str, Dict[int, float]] = {}
+        # 패싯명 -> 값 -> 문서 위치 집합
+        self.facets: Dict[str, Dict[str, Set[int]]] = {}
+        # 부분 문자열 검색용 원문 (문서 위치 순)
+        self.search_texts: List[str] = []
+
+        for position, document in enumerate(documents):
+            self.doc_ids.append(document['id'])
+
+            texts = []
+            for text, weight in document.get('fields', []):
+                texts.append(normalize_text(text))
+                for token in tokenize(text):
+                    postings = self.postings.setdefault(token, {})
+                    postings[position] = postings.get(position, 0.0) + weight
+            self.search_texts.append(' '.join(texts))
+
+            for facet, value in (document.get('facets') or {}).items():
+                if value is None:
+                    continue
+                key = normalize_text(str(value))
+                self.facets.setdefault(facet, {}).setdefault(key, set()).add(position)
+
+        # 접두어 검색용 정렬된 어휘 목록
+        self.vocabulary: List[str] = sorted(self.postings)
+
+    def __len__(self) -> int:
+        return len(self.doc_ids)
+
+    def _match_token(self, token: str) -> Dict[int, float]:
+        """토큰 하나와 일치하는 문서 점수 (완전 일치 + 접두어 일치)"""
+        scores = dict(self.postings.get(token, {}))
+
+        start = bisect.bisect_left(self.vocabulary, token)
+        for index in range(start, len(self.vocabulary)):
+            candidate = self.vocabulary[index]
+            if not candidate.startswith(token):
+                break
+            if candidate == token:
+                continue
+            for position, weight in self.postings[candidate].items():
+                scores[position] = max(scores.get(position, 0.0), weight * PREFIX_MATCH_RATIO)
+        return scores
+
+    def filter_positions(self, facets: Optional[Dict[str, Any]] = None) -> Optional[Set[int]]:
+        """패싯 조건을 모두 만족하는 문서 위치 (조건 없으면 None = 전체)"""
+        allowed: Optional[Set[int]] = None
+        for facet, value in (facets or {}).items():
+            if value in (None, ''):
+                continue
+            values = value if isinstance(value, (list, tuple, set)) else [value]
+            matched: Set[int] = set()
+            for item in values:
+                matched |= self.facets.get(facet, {}).get(normalize_text(str(item)), set())
+            allowed = matched if allowed is None else allowed & matched
+        return allowed
+
+    def search(self, query: str, facets: Optional[Dict[str, Any]] = None,
+               limit: Optional[int] = None) -> List[Tuple[str, float]]:
+        """
+        점수 순 검색 결과 [(템플릿 ID, 점수)]
+
+        모든 질의 토큰이 (완전/접두어) 일치해야 하며, 토큰 일치 결과가 없을 때만
+        질의 원문이 이름/설명/태그의 부분 문자열인 문서를 낮은 점수로 반환
+        """
+        allowed = self.filter_positions(facets)
+        query_tokens = tokenize(query)
+
+        scores: Dict[int, float] = {}
+        if query_tokens:
+            for index, token in enumerate(query_tokens):
+                matched = self._match_token(token)
+                if index == 0:
+                    scores = matched
+                else:
+                    scores = {
+                        position: score + matched[position]
+                        for position, score in scores.items()
+                        if position in matched
+                    }
+                if not scores:
+                    break
+
+        # 토큰 일치가 하나도 없을 때만 원문 전체를 훑음 (일반 검색은 색인만 사용)
+        query_text = normalize_text(query).strip()
+        if not scores and query_text:
+            positions = range(len(self.search_texts)) if allowed is None else sorted(allowed)
+            for position in positions:
+                if query_text in self.search_texts[position]:
+                    scores[position] = SUBSTRING_MATCH_SCORE
+
+        results = [
+            (position, score) for position, score in scores.items()
+            if allowed is None or position in allowed
+        ]
+        # 점수 내림차순, 동점이면 원래 순서 유지
+        results.sort(key=lambda item: (-item[1], item[0]))
+        if limit is not None:
+            results = results[:limit]
+        return [(self.doc_ids[position], round(score, 4)) for position, score in results]
+
+    def facet_counts(self, template_ids: Optional[Iterable[str]] = None) -> Dict[str, Dict[str, int]]:
+        """패싯 값별 문서 수 (template_ids 지정 시 해당 결과 안에서만)"""
+        positions = None
+        if template_ids is not None:
+            lookup = {doc_id: position for position, doc_id in enumerate(self.doc_ids)}
+            positions = {lookup[doc_id] for doc_id in template_ids if doc_id in lookup}
+
+        counts: Dict[str, Dict[str, int]] = {}
+        for facet, values in self.facets.items():
+            facet_counts = {}
+            for value, members in values.items():
+                count = len(members) if positions is None else len(members & positions)
+                if count:
+                    facet_counts[value] = count
+            counts[facet] = facet_counts
+        return counts
+
+
+def templates_signature(templates_dir: str) -> Tuple:
+    """templates/*.json 파일 (경로, mtime, 크기) 목록 - 변경 감지용"""
+    signature = []
+    for path in sorted(glob.glob(os.path.join(templates_dir, '*.json'))):
+        try:
+            stat = os.stat(path)
+        except OSError:
+            continue
+        signature.append((os.path.basename(path), stat.st_mtime_ns, stat.st_size))
+    return tuple(signature)
+
+
+class WatchedTemplateIndex:
+    """
+    템플릿 디렉토리 변경 시 자동 재구축되는 색인
+
+    build: 색인을 새로 만드는 함수 (템플릿 재로딩 포함 가능)
+    extra_signature: 파일 외에 재구축 조건이 되는 값 (예: 메모리 템플릿 수)
+    """
+
+    def __init__(self, templates_dir: str, build: Callable[[], TemplateSearchIndex],
+                 extra_signature: Optional[Callable[[], Any]] = None,
+                 check_interval: float = INDEX_CHECK_INTERVAL):
+        self.templates_dir = templates_dir
+        self.build = build
+        self.extra_signature = extra_signature
+        self.check_interval = check_interval
+
+        self._index: Optional[TemplateSearchIndex] = None
+        self._signature: Optional[Tuple] = None
+        self._last_check = 0.0
+        self._lock = threading.Lock()
+        self._stats = {'builds': 0, 'last_build_seconds': None}
+
+    def _current_signature(self) -> Tuple:
+        extra = self.extra_signature() if self.extra_signature else None
+        return (templates_signature(self.templates_dir), extra)
+
+    def get(self) -> TemplateSearchIndex:
+        """현재 색인 반환 (확인 주기가 지났고 파일이 바뀌었으면 재구축)"""
+        now = time.monotonic()
+        if self._index is not None and now - self._last_check < self.check_interval:
+            return self._index
+
+        with self._lock:
+            if self._index is not None and now - self._last_check < self.check_interval:
+                return self._index
+
+            signature = self._current_signature()
+            if self._index is None or signature != self._signature:
+                started = time.perf_counter()
+                self._index = self.build()
+                # 빌드 전 서명을 기록 - 빌드 중 바뀐 파일은 다음 확인 때 서명이 달라 다시 반영됨
+                self._signature = signature
+                self._stats['builds'] += 1
+                self._stats['last_build_seconds'] = round(time.perf_counter() - started, 4)
+            self._last_check = now
+            return self._index
+
+    def invalidate(self) -> None:
+        """다음 조회 시 강제 재구축"""
+        with self._lock:
+            self._signature = None
+            self._last_check = 0.0
+
+    def get_stats(self) -> Dict:
+        with self._lock:
+            stats = dict(self._stats)
+            stats['documents'] = len(self._index) if self._index is not None else 0
+        return stats
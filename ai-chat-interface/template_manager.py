@@ -9,13 +9,55 @@ import os
 from typing import Dict, List, Any, Optional
 from datetime import datetime
 
+from template_index import TemplateSearchIndex, WatchedTemplateIndex
+
 class TemplateManager:
     """프로젝트 템플릿 관리 클래스"""
 
     def __init__(self, templates_file: str = "templates/project_templates.json"):
         self.templates_file = templates_file
+        self.templates_data: Dict[str, Any] = {"templates": {}, "categories": []}
+
+        # 템플릿 파일이 바뀌면 templates_data와 검색 색인을 함께 다시 로드
+        templates_dir = os.path.dirname(os.path.join(os.path.dirname(__file__), templates_file))
+        self._index = WatchedTemplateIndex(templates_dir, self._build_index)
+        self._index.get()
+
+    def _build_index(self) -> TemplateSearchIndex:
+        """템플릿 파일 로드 후 검색 색인 구축 (이름 > 태그 > 설명 순 가중치)"""
         self.templates_data = self._load_templates()
 
+        documents = []
+        for template_id, template_data in self.templates_data.get("templates", {}).items():
+            documents.append({
+                "id": template_id,
+                "fields": [
+                    (template_data.get("name", ""), 3.0),
+                    (" ".join(template_data.get("tags", [])), 2.0),
+                    (template_data.get("description", ""), 1.0)
+                ],
+                "facets": {
+                    "category": template_data.get("category"),
+                    "framework": self._framework_of(template_data),
+                    "complexity": template_data.get("complexity")
+                }
+            })
+        return TemplateSearchIndex(documents)
+
+    @staticmethod
+    def _framework_of(template_data: Dict[str, Any]) -> Optional[str]:
+        """추천 AI 값(meta-gpt, crew-ai 등)을 프레임워크 패싯 값으로 변환"""
+        recommended_ai = template_data.get("recommended_ai", "").lower()
+        if "crew" in recommended_ai:
+            return "crewai"
+        if "meta" in recommended_ai:
+            return "metagpt"
+        return None
+
+    def _current_index(self) -> TemplateSearchIndex:
+        """최신 색인 (파일 변경 시 templates_data도 함께 갱신됨)"""
+        return self._index.get()
+
     def _load_templates(self) -> Dict[str, Any]:
         """템플릿 파일 로드"""
         try:
@@ -31,6 +73,7 @@ class TemplateManager:
 
     def get_all_templates(self) -> Dict[str, Any]:
         """모든 템플릿 조회"""
+        self._current_index()
         return {
             "success": True,
             "templates": self.templates_data.get("templates", {}),
@@ -40,6 +83,7 @@ class TemplateManager:
 
     def get_template_by_id(self, template_id: str) -> Dict[str, Any]:
         """특정 템플릿 조회"""
+        self._current_index()
         templates = self.templates_data.get("templates", {})
 
         if template_id in templates:
@@ -55,12 +99,13 @@ class TemplateManager:
 
     def get_templates_by_category(self, category: str) -> Dict[str, Any]:
         """카테고리별 템플릿 조회"""
+        index = self._current_index()
         templates = self.templates_data.get("templates", {})
-        filtered_templates = {}
-
-        for template_id, template_data in templates.items():
-            if template_data.get("category", "").lower() == category.lower():
-                filtered_templates[template_id] = template_data
+        positions = index.filter_positions({"category": category}) or set()
+        filtered_templates = {
+            index.doc_ids[position]: templates[index.doc_ids[position]]
+            for position in sorted(positions)
+        }
 
         return {
             "success": True,
@@ -69,26 +114,25 @@ class TemplateManager:
             "count": len(filtered_templates)
         }
 
-    def search_templates(self, query: str) -> Dict[str, Any]:
-        """템플릿 검색"""
-        templates = self.templates_data.get("templates", {})
-        results = {}
-        query_lower = query.lower()
+    def search_templates(self, query: str, category: Optional[str] = None,
+                         framework: Optional[str] = None, limit: Optional[int] = None) -> Dict[str, Any]:
+        """
+        템플릿 검색 (이름, 설명, 태그 - 관련도 순)
 
-        for template_id, template_data in templates.items():
-            # 이름, 설명, 태그에서 검색
-            searchable_text = (
-                template_data.get("name", "") + " " +
-                template_data.get("description", "") + " " +
-                " ".join(template_data.get("tags", []))
-            ).lower()
+        Args:
+            category / framework: 패싯 필터 (framework: crewai, metagpt)
+        """
+        index = self._current_index()
+        templates = self.templates_data.get("templates", {})
+        ranked = index.search(query, {"category": category, "framework": framework}, limit)
 
-            if query_lower in searchable_text:
-                results[template_id] = template_data
+        results = {template_id: templates[template_id] for template_id, _ in ranked}
 
         return {
             "success": True,
             "templates": results,
+            "scores": dict(ranked),
+            "facets": index.facet_counts(results.keys()),
             "query": query,
             "count": len(results)
         }
@@ -146,6 +190,7 @@ class TemplateManager:
 
     def get_template_recommendations(self, user_preferences: Dict[str, Any]) -> Dict[str, Any]:
         """사용자 선호도 기반 템플릿 추천"""
+        index = self._current_index()
         templates = self.templates_data.get("templates", {})
         recommendations = []
 
@@ -156,7 +201,20 @@ class TemplateManager:
         # 경험 수준
         experience_level = user_preferences.get("experience", "intermediate")
 
-        for template_id, template_data in templates.items():
+        # 점수를 받을 수 있는 템플릿만 패싯 색인에서 후보로 추림
+        candidate_complexities = [preferred_complexity]
+        if experience_level == "beginner":
+            candidate_complexities.append("low")
+        elif experience_level == "advanced":
+            candidate_complexities.append("high")
+
+        candidates = index.filter_positions({"complexity": candidate_complexities}) or set()
+        if preferred_categories:
+            candidates |= index.filter_positions({"category": preferred_categories}) or set()
+
+        for position in sorted(candidates):
+            template_id = index.doc_ids[position]
+            template_data = templates[template_id]
             score = 0
 
             # 복잡도 매칭
@@ -207,6 +265,7 @@ class TemplateManager:
 
     def get_template_statistics(self) -> Dict[str, Any]:
         """템플릿 통계 정보"""
+        self._current_index()
         templates = self.templates_data.get("templates", {})
         categories = self.templates_data.get("categories", [])
 
@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+검증된 JWT 캐시 테스트 (DB/네트워크 불필요)
+캐시 적중, 토큰 폐기, 사용자 토큰 전체 폐기(같은 초에 발급된 토큰 포함), 요청 단위 메모이제이션
+"""
+
+import sys
+import time
+
+from flask import Flask
+
+from auth_cache import VerifiedTokenCache, TOKEN_VERSION_CLAIM, memoize_per_request
+
+
+class CountingVerifier:
+    """토큰 문자열 -> payload 매핑으로 검증하고 호출 횟수를 기록"""
+
+    def __init__(self, payloads):
+        self.payloads = payloads
+        self.calls = 0
+
+    def __call__(self, token):
+        self.calls += 1
+        return self.payloads.get(token)
+
+
+def _payload(user_id, version=None, **extra):
+    now = int(time.time())
+    payload = {'user_id': user_id, 'iat': now, 'exp': now + 3600}
+    if version is not None:
+        payload[TOKEN_VERSION_CLAIM] = version
+    payload.update(extra)
+    return payload
+
+
+def test_verified_payload_is_cached():
+    """검증 성공한 토큰은 만료 전까지 verifier를 다시 호출하지 않음"""
+    cache = VerifiedTokenCache()
+    verifier = CountingVerifier({'token-a': _payload('u1')})
+    assert cache.verify('main', 'token-a', verifier)['user_id'] == 'u1'
+    assert cache.verify('main', 'token-a', verifier)['user_id'] == 'u1'
+    assert verifier.calls == 1
+
+    # 네임스페이스가 다르면 결과를 공유하지 않음
+    cache.verify('admin', 'token-a', verifier)
+    assert verifier.calls == 2
+
+    # 실패한 검증은 캐시하지 않음
+    assert cache.verify('main', 'unknown', verifier) is None
+    assert cache.verify('main', 'unknown', verifier) is None
+    assert verifier.calls == 4
+
+
+def test_expired_entry_is_verified_again():
+    """만료 시각이 지난 캐시 항목은 다시 검증"""
+    cache = VerifiedTokenCache()
+    verifier = CountingVerifier({'token-a': _payload('u1', exp=time.time() - 1)})
+    cache.verify('main', 'token-a', verifier)
+    cache.verify('main', 'token-a', verifier)
+    assert verifier.calls == 2
+
+
+def test_revoked_token_is_rejected():
+    """로그아웃 등으로 폐기한 토큰은 캐시 여부와 관계없이 거부"""
+    cache = VerifiedTokenCache()
+    verifier = CountingVerifier({'token-a': _payload('u1'), 'token-b': _payload('u1')})
+    cache.verify('main', 'token-a', verifier)
+    cache.revoke('token-a')
+    assert cache.verify('main', 'token-a', verifier) is None
+    assert cache.verify('main', 'token-b', verifier) is not None
+
+
+def test_revoke_subject_rejects_tokens_issued_in_same_second():
+    """사용자 토큰 전체 폐기 - 폐기 직전 같은 초에 발급된 토큰도 거부, 이후 발급 토큰은 허용"""
+    cache = VerifiedTokenCache()
+    before = _payload('u1', version=cache.token_version('u1'))
+    verifier = CountingVerifier({'before': before})
+
+    # 폐기 전 검증되어 캐시된 토큰
+    assert cache.verify('main', 'before', verifier) is not None
+
+    cache.revoke_subject('u1')
+    after = _payload('u1', version=cache.token_version('u1'))
+    assert after['iat'] == before['iat'] or after['iat'] == before['iat'] + 1
+    verifier.payloads['after'] = after
+    verifier.payloads['before-uncached'] = dict(before)
+
+    assert cache.verify('main', 'before', verifier) is None            # 캐시 적중 경로
+    assert cache.verify('main', 'before-uncached', verifier) is None   # 검증 경로
+    assert cache.verify('main', 'after', verifier) is not None
+
+    # 버전 클레임이 없는 (폐기 기능 이전에 발급된) 토큰도 거부
+    verifier.payloads['legacy'] = _payload('u1')
+    assert cache.verify('main', 'legacy', verifier) is None
+
+    # 다른 사용자에는 영향 없음
+    verifier.payloads['other'] = _payload('u2')
+    assert cache.verify('main', 'other', verifier) is not None
+
+
+def test_revoke_subject_twice_requires_latest_version():
+    """여러 번 폐기하면 가장 최근 버전의 토큰만 유효"""
+    cache = VerifiedTokenCache()
+    cache.revoke_subject('admin')
+    first = {'username': 'admin', TOKEN_VERSION_CLAIM: cache.token_version('admin')}
+    cache.revoke_subject('admin')
+    second = {'username': 'admin', TOKEN_VERSION_CLAIM: cache.token_version('admin')}
+    verifier = CountingVerifier({'first': first, 'second': second})
+    assert cache.verify('admin', 'first', verifier) is None
+    assert cache.verify('admin', 'second', verifier) is not None
+
+
+def test_lru_eviction():
+    """최대 항목 수를 넘으면 가장 오래 사용하지 않은 토큰부터 제거"""
+    cache = VerifiedTokenCache(max_entries=2)
+    verifier = CountingVerifier({name: _payload(name) for name in ('a', 'b', 'c')})
+    for name in ('a', 'b', 'a', 'c'):
+        cache.verify('main', name, verifier)
+    calls = verifier.calls
+    cache.verify('main', 'a', verifier)
+    cache.verify('main', 'b', verifier)
+    assert verifier.calls == calls + 1
+    assert cache.get_stats()['size'] == 2
+
+
+def test_memoize_per_request():
+    """요청 컨텍스트 안에서는 한 번만 계산, 밖에서는 매번 계산"""
+    calls = []
+
+    def loader():
+        calls.append(1)
+        return len(calls)
+
+    assert memoize_per_request('key', loader) == 1
+    assert memoize_per_request('key', loader) == 2
+
+    app = Flask(__name__)
+    with app.test_request_context('/'):
+        assert memoize_per_request('key', loader) == 3
+        assert memoize_per_request('key', loader) == 3
+    with app.test_request_context('/'):
+        assert memoize_per_request('key', loader) == 4
+
+
+if __name__ == "__main__":
+    tests = [value for name, value in list(globals().items()) if name.startswith('test_') and callable(value)]
+    failed = 0
+    for test in tests:
+        try:
+            test()
+            print(f"OK: {test.__name__}")
+        except AssertionError as e:
+            failed += 1
+            print(f"FAIL: {test.__name__} - {e}")
+    print(f"결론: {len(tests) - failed}/{len(tests)} 통과")
+    sys.exit(1 if failed else 0)
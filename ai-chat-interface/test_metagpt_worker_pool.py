@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+MetaGPT 워커 풀 테스트 (MetaGPT 설치 불필요 - 임시 스크립트를 상주 워커에서 실행)
+세션 상태 유지/격리, 모르는 세션 거부, 워커 재시작 후 세션 유실, 실행 중 워커 대기 제한, 유휴 워커 배정
+"""
+
+import os
+import sys
+import json
+import time
+import tempfile
+import threading
+import subprocess
+
+from metagpt_worker_pool import (
+    MetaGPTWorkerPool, MetaGPTSessionLostError, MetaGPTWorkerBusyError, new_session_id
+)
+
+# 요구사항이 'sleep:<초>'이면 그만큼 멈춘 뒤 응답, 세션별 실행 횟수를 METAGPT_SESSION에 누적
+STEP_SCRIPT = '''
+import sys, json, time
+requirement, step = sys.argv[1], int(sys.argv[2])
+if requirement.startswith('sleep:'):
+    time.sleep(float(requirement.split(':', 1)[1]))
+METAGPT_SESSION['runs'] = METAGPT_SESSION.get('runs', 0) + 1
+print(json.dumps({'step': step, 'runs': METAGPT_SESSION['runs']}))
+'''
+
+
+def _make_pool(size=1, busy_wait=5.0):
+    script_dir = tempfile.mkdtemp()
+    script_path = os.path.join(script_dir, 'run_step_by_step.py')
+    with open(script_path, 'w', encoding='utf-8') as f:
+        f.write(STEP_SCRIPT)
+    return MetaGPTWorkerPool(script_path, size=size, busy_wait=busy_wait)
+
+
+def _runs(result):
+    assert result.returncode == 0, result.stderr
+    return json.loads(result.stdout)['runs']
+
+
+def _wait_until(predicate, timeout=10.0):
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        assert time.monotonic() < deadline, '대기 시간 초과'
+        time.sleep(0.01)
+
+
+def test_session_state_survives_steps():
+    """같은 세션의 다음 단계는 이전 단계의 METAGPT_SESSION을 이어받고, 다른 세션과 섞이지 않음"""
+    pool = _make_pool()
+    try:
+        first, second = new_session_id(), new_session_id()
+        assert _runs(pool.run_step(first, 'req', 1, timeout=30)) == 1
+        assert _runs(pool.run_step(first, 'req', 2, timeout=30, require_session=True)) == 2
+        assert _runs(pool.run_step(second, 'req', 1, timeout=30)) == 1
+        assert pool.get_stats()['workers'][0]['starts'] == 1
+    finally:
+        pool.shutdown()
+
+
+def test_unknown_session_is_rejected():
+    """이전 단계를 이어가는 요청인데 풀이 모르는 세션이면 워커를 실행하지 않음"""
+    pool = _make_pool()
+    try:
+        try:
+            pool.run_step(new_session_id(), 'req', 2, timeout=30, require_session=True)
+            assert False, 'MetaGPTSessionLostError가 발생해야 함'
+        except MetaGPTSessionLostError:
+            pass
+        stats = pool.get_stats()
+        assert stats['sessions_lost'] == 1
+        assert stats['active_sessions'] == 0
+        assert stats['workers'][0]['starts'] == 0
+    finally:
+        pool.shutdown()
+
+
+def test_worker_restart_loses_session():
+    """단계 타임아웃으로 워커가 재시작되면 그 워커의 기존 세션은 유실로 보고"""
+    pool = _make_pool()
+    try:
+        kept, slow = new_session_id(), new_session_id()
+        assert _runs(pool.run_step(kept, 'req', 1, timeout=30)) == 1
+        try:
+            pool.run_step(slow, 'sleep:5', 1, timeout=0.5)
+            assert False, 'TimeoutExpired가 발생해야 함'
+        except subprocess.TimeoutExpired:
+            pass
+        try:
+            pool.run_step(kept, 'req', 2, timeout=30, require_session=True)
+            assert False, 'MetaGPTSessionLostError가 발생해야 함'
+        except MetaGPTSessionLostError:
+            pass
+    finally:
+        pool.shutdown()
+
+
+def test_busy_worker_fails_fast():
+    """세션의 워커가 실행 중이면 busy_wait만 기다리고 실패하며, 세션은 유지됨"""
+    pool = _make_pool(busy_wait=0.2)
+    try:
+        session_id = new_session_id()
+        assert _runs(pool.run_step(session_id, 'req', 1, timeout=30)) == 1
+
+        worker = pool.workers[0]
+        runner = threading.Thread(target=pool.run_step, args=(new_session_id(), 'sleep:1.5', 1), kwargs={'timeout': 30})
+        runner.start()
+        _wait_until(worker.is_busy)
+
+        started = time.monotonic()
+        try:
+            pool.run_step(session_id, 'req', 2, timeout=30, require_session=True)
+            assert False, 'MetaGPTWorkerBusyError가 발생해야 함'
+        except MetaGPTWorkerBusyError:
+            pass
+        assert time.monotonic() - started < 1.0
+        runner.join()
+
+        assert _runs(pool.run_step(session_id, 'req', 2, timeout=30, require_session=True)) == 2
+        assert pool.get_stats()['workers'][0]['busy_rejections'] == 1
+    finally:
+        pool.shutdown()
+
+
+def test_lock_wait_counts_against_timeout():
+    """워커 대기 시간은 단계 제한 시간에 포함 - 제한 시간이 대기보다 짧으면 그 안에 실패"""
+    pool = _make_pool(busy_wait=30.0)
+    try:
+        worker = pool.workers[0]
+        runner = threading.Thread(target=pool.run_step, args=(new_session_id(), 'sleep:1.5', 1), kwargs={'timeout': 30})
+        runner.start()
+        _wait_until(worker.is_busy)
+
+        started = time.monotonic()
+        try:
+            pool.run_step(new_session_id(), 'req', 1, timeout=0.3)
+            assert False, '대기 시간 안에 실패해야 함'
+        except (MetaGPTWorkerBusyError, subprocess.TimeoutExpired):
+            pass
+        assert time.monotonic() - started < 1.0
+        runner.join()
+        # 대기만 하다 실패했으므로 실행 중이던 워커는 재시작되지 않음
+        assert worker.stats['timeouts'] == 0
+        assert worker.stats['starts'] == 1
+    finally:
+        pool.shutdown()
+
+
+def test_new_session_goes_to_idle_worker():
+    """새 세션은 세션 수보다 유휴 여부를 먼저 보고 배정"""
+    pool = _make_pool(size=2)
+    try:
+        # 워커 0에 세션 2개, 워커 1에 세션 1개 배정 후 워커 1의 세션으로 다음 단계를 실행
+        sessions = [new_session_id() for _ in range(3)]
+        for session_id in sessions:
+            pool.run_step(session_id, 'req', 1, timeout=30)
+        assert [pool._sessions[session_id][0] for session_id in sessions] == [0, 1, 0]
+        runner = threading.Thread(target=pool.run_step, args=(sessions[1], 'sleep:1.5', 2), kwargs={'timeout': 30})
+        runner.start()
+        _wait_until(pool.workers[1].is_busy)
+
+        session_id = new_session_id()
+        pool.run_step(session_id, 'req', 1, timeout=30)
+        runner.join()
+        assert pool._sessions[session_id][0] == 0
+    finally:
+        pool.shutdown()
+
+
+if __name__ == "__main__":
+    tests = [value for name, value in list(globals().items()) if name.startswith('test_') and callable(value)]
+    failed = 0
+    for test in tests:
+        try:
+            test()
+            print(f"OK: {test.__name__}")
+        except AssertionError as e:
+            failed += 1
+            print(f"FAIL: {test.__name__} - {e}")
+    print(f"결론: {len(tests) - failed}/{len(tests)} 통과")
+    sys.exit(1 if failed else 0)
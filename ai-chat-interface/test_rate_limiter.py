@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+요청 속도 제한 테스트 (DB/네트워크 불필요)
+슬라이딩 윈도우 경계, 신뢰하지 않는 피어의 X-Forwarded-For 위조, 메모리/SQLite 백엔드 결과 일치
+"""
+
+import os
+import sys
+import tempfile
+
+from rate_limiter import MemoryBackend, SQLiteBackend, RateLimiter
+
+WINDOW = 10
+LIMIT = 3
+
+# (시각, 기대 허용 여부) - 윈도우 [100, 110), [110, 120), [130, 140)
+HIT_SEQUENCE = [
+    (100.0, True), (101.0, True), (102.0, True),
+    (109.9, False),   # 같은 윈도우에서 한도 초과
+    (110.0, False),   # 새 윈도우 시작 직후: 이전 윈도우 3회가 가중치 1.0으로 남음
+    (115.0, True),    # 이전 윈도우 가중치 0.5 -> 추정 1.5
+    (116.0, True),    # 추정 1.4 + 1
+    (117.0, True),    # 추정 0.9 + 2 = 2.9 < 3 -> 허용
+    (118.0, False),   # 추정 0.6 + 3 = 3.6 -> 거부
+    (130.0, True),    # 두 윈도우 이후: 이전 카운트 초기화
+]
+
+
+def _run_sequence(backend):
+    return [backend.hit('client', LIMIT, WINDOW, now)[0] for now, _ in HIT_SEQUENCE]
+
+
+def test_memory_window_boundary():
+    """메모리 백엔드 슬라이딩 윈도우 경계"""
+    results = _run_sequence(MemoryBackend())
+    assert results == [expected for _, expected in HIT_SEQUENCE], results
+
+
+def test_sqlite_matches_memory():
+    """SQLite 백엔드가 메모리 백엔드와 같은 판정을 내리는지"""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        sqlite_backend = SQLiteBackend(os.path.join(temp_dir, 'rate_limits.db'))
+        assert _run_sequence(sqlite_backend) == _run_sequence(MemoryBackend())
+
+        # 다른 연결(다른 워커)에서도 같은 카운터를 이어서 사용
+        other_worker = SQLiteBackend(os.path.join(temp_dir, 'rate_limits.db'))
+        assert other_worker.hit('client', LIMIT, WINDOW, 131.0)[0] is True
+        assert sqlite_backend.hit('client', LIMIT, WINDOW, 132.0)[0] is True
+        assert other_worker.hit('client', LIMIT, WINDOW, 133.0)[0] is False
+        sqlite_backend._connect().close()
+        other_worker._connect().close()
+
+
+def test_sqlite_prunes_idle_keys():
+    """SQLite 백엔드는 1000회마다 오래된 키부터 max_keys를 넘는 만큼 삭제"""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        backend = SQLiteBackend(os.path.join(temp_dir, 'rate_limits.db'), max_keys=5)
+        for index in range(1000):
+            backend.hit(f'client-{index}', LIMIT, WINDOW, 100.0 + index * 0.001)
+        conn = backend._connect()
+        keys = [row[0] for row in conn.execute("SELECT rate_key FROM rate_limits ORDER BY last_seen")]
+        assert keys == [f'client-{index}' for index in range(995, 1000)], keys
+        conn.close()
+
+
+def test_memory_evicts_least_recent_key():
+    """메모리 백엔드 키 수 제한 (가장 오래 사용되지 않은 키 제거)"""
+    backend = MemoryBackend(max_keys=2)
+    backend.hit('a', LIMIT, WINDOW, 100.0)
+    backend.hit('b', LIMIT, WINDOW, 100.0)
+    backend.hit('a', LIMIT, WINDOW, 100.5)
+    backend.hit('c', LIMIT, WINDOW, 101.0)
+    assert list(backend._counters) == ['a', 'c']
+
+
+def test_untrusted_peer_cannot_spoof_forwarded_for():
+    """신뢰 프록시가 아닌 피어가 보낸 X-Forwarded-For는 무시"""
+    limiter = RateLimiter(MemoryBackend(), trusted_proxies=['10.0.0.0/8'])
+    environ = {'REMOTE_ADDR': '203.0.113.7', 'HTTP_X_FORWARDED_FOR': '198.51.100.1'}
+    assert limiter.get_client_ip(environ) == '203.0.113.7'
+
+    # 신뢰 프록시 목록이 비어 있으면 항상 직접 연결 주소
+    assert RateLimiter(MemoryBackend()).get_client_ip(
+        {'REMOTE_ADDR': '10.0.0.1', 'HTTP_X_FORWARDED_FOR': '198.51.100.1'}
+    ) == '10.0.0.1'
+
+
+def test_trusted_proxy_uses_rightmost_untrusted_hop():
+    """신뢰 프록시 뒤에서는 오른쪽부터 신뢰 프록시를 건너뛴 첫 주소 (왼쪽 위조 값 무시)"""
+    limiter = RateLimiter(MemoryBackend(), trusted_proxies=['10.0.0.0/8', '127.0.0.1'])
+    environ = {
+        'REMOTE_ADDR': '10.0.0.1',
+        'HTTP_X_FORWARDED_FOR': '1.1.1.1, 198.51.100.9, 10.0.0.2'
+    }
+    assert limiter.get_client_ip(environ) == '198.51.100.9'
+
+    # 잘못된 형식의 값은 신뢰하지 않으므로 그대로 클라이언트로 간주
+    environ = {'REMOTE_ADDR': '127.0.0.1', 'HTTP_X_FORWARDED_FOR': 'not-an-ip, 10.0.0.3'}
+    assert limiter.get_client_ip(environ) == 'not-an-ip'
+
+    # 헤더가 없으면 직접 연결 주소
+    assert limiter.get_client_ip({'REMOTE_ADDR': '10.0.0.1'}) == '10.0.0.1'
+
+
+def test_backend_error_allows_request():
+    """백엔드 장애 시 요청 허용 (서비스 전체 차단 방지)"""
+    class BrokenBackend:
+        def hit(self, *args):
+            raise RuntimeError('backend down')
+
+    allowed, remaining, retry_after = RateLimiter(BrokenBackend()).hit('client', LIMIT, WINDOW)
+    assert (allowed, remaining, retry_after) == (True, LIMIT, 0)
+
+
+if __name__ == "__main__":
+    tests = [value for name, value in list(globals().items()) if name.startswith('test_') and callable(value)]
+    failed = 0
+    for test in tests:
+        try:
+            test()
+            print(f"OK: {test.__name__}")
+        except AssertionError as e:
+            failed += 1
+            print(f"FAIL: {test.__name__} - {e}")
+    print(f"결론: {len(tests) - failed}/{len(tests)} 통과")
+    sys.exit(1 if failed else 0)
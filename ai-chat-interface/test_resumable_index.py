@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+재개 가능 프로젝트 색인 테스트 (임시 디렉토리 사용)
+최초 조회 시 구축, 상태 갱신 반영, 삭제된 프로젝트 정리, 여러 인스턴스 공유, SQLite 실패 시 스캔 대체
+"""
+
+import os
+import sys
+import json
+import shutil
+import tempfile
+
+from resumable_index import INDEX_FILENAME, STATUS_FILENAME, ResumableProjectIndex
+
+
+def _status(name, updated_at, can_resume=True, resume_point='step_2'):
+    return {'project_name': name, 'updated_at': updated_at, 'can_resume': can_resume,
+            'resume_point': resume_point, 'status': 'paused' if can_resume else 'completed'}
+
+
+def _write_project(base_dir, project_id, status_data):
+    project_path = os.path.join(base_dir, project_id)
+    os.makedirs(project_path, exist_ok=True)
+    with open(os.path.join(project_path, STATUS_FILENAME), 'w', encoding='utf-8') as f:
+        json.dump(status_data, f)
+    return project_path
+
+
+def _ids(projects):
+    return [project['id'] for project in projects]
+
+
+def test_first_lookup_builds_from_existing_projects():
+    """색인 이전에 만들어진 프로젝트도 최초 조회 때 한 번 스캔해 포함 (재개 불가 제외)"""
+    with tempfile.TemporaryDirectory() as base_dir:
+        _write_project(base_dir, 'old', _status('Old', '2026-01-01T00:00:00'))
+        _write_project(base_dir, 'new', _status('New', '2026-03-01T00:00:00'))
+        _write_project(base_dir, 'done', _status('Done', '2026-04-01T00:00:00', can_resume=False))
+        os.makedirs(os.path.join(base_dir, 'empty'))
+
+        index = ResumableProjectIndex(base_dir)
+        assert _ids(index.list_resumable()) == ['new', 'old']
+        assert _ids(index.list_resumable()) == ['new', 'old']
+        stats = index.get_stats()
+        assert stats['rebuilds'] == 1
+        assert stats['sqlite_path'] == os.path.join(base_dir, INDEX_FILENAME)
+
+
+def test_update_adds_and_removes_entries():
+    """상태 저장 시 재개 가능하면 추가/갱신, 재개 불가가 되면 제거"""
+    with tempfile.TemporaryDirectory() as base_dir:
+        index = ResumableProjectIndex(base_dir)
+        assert index.list_resumable() == []
+
+        os.makedirs(os.path.join(base_dir, 'alpha'))
+        index.update('alpha', _status('Alpha', '2026-01-01T00:00:00'))
+        assert index.list_resumable()[0]['resume_point'] == 'step_2'
+
+        index.update('alpha', _status('Alpha', '2026-01-02T00:00:00', resume_point='step_4'))
+        assert index.list_resumable()[0]['resume_point'] == 'step_4'
+
+        index.update('alpha', _status('Alpha', '2026-01-03T00:00:00', can_resume=False))
+        assert index.list_resumable() == []
+
+
+def test_deleted_project_is_pruned():
+    """색인 이후 삭제된 프로젝트 디렉토리는 조회 때 색인에서도 제거"""
+    with tempfile.TemporaryDirectory() as base_dir:
+        _write_project(base_dir, 'alpha', _status('Alpha', '2026-01-01T00:00:00'))
+        beta_path = _write_project(base_dir, 'beta', _status('Beta', '2026-01-02T00:00:00'))
+        index = ResumableProjectIndex(base_dir)
+        assert _ids(index.list_resumable()) == ['beta', 'alpha']
+
+        shutil.rmtree(beta_path)
+        assert _ids(index.list_resumable()) == ['alpha']
+        assert _ids(index.list_resumable()) == ['alpha']
+        assert index.get_stats()['stale_removed'] == 1
+
+
+def test_index_is_shared_between_instances():
+    """다른 인스턴스(다른 프로세스 대신)가 갱신한 내용도 같은 색인 파일에서 보임"""
+    with tempfile.TemporaryDirectory() as base_dir:
+        writer = ResumableProjectIndex(base_dir)
+        reader = ResumableProjectIndex(base_dir)
+        assert reader.list_resumable() == []
+
+        os.makedirs(os.path.join(base_dir, 'alpha'))
+        writer.update('alpha', _status('Alpha', '2026-01-01T00:00:00'))
+        assert _ids(reader.list_resumable()) == ['alpha']
+        assert reader.get_stats()['rebuilds'] == 1
+
+
+def test_falls_back_to_scan_without_sqlite():
+    """색인 파일을 만들 수 없으면 매 조회마다 디렉토리 스캔"""
+    with tempfile.TemporaryDirectory() as base_dir:
+        _write_project(base_dir, 'alpha', _status('Alpha', '2026-01-01T00:00:00'))
+        # 색인 파일 자리에 디렉토리가 있으면 SQLite 연결 실패
+        os.makedirs(os.path.join(base_dir, INDEX_FILENAME))
+
+        index = ResumableProjectIndex(base_dir)
+        assert index.sqlite_path is None
+        assert _ids(index.list_resumable()) == ['alpha']
+
+        index.update('beta', _status('Beta', '2026-01-02T00:00:00'))
+        _write_project(base_dir, 'beta', _status('Beta', '2026-01-02T00:00:00'))
+        assert _ids(index.list_resumable()) == ['beta', 'alpha']
+
+
+if __name__ == "__main__":
+    tests = [value for name, value in list(globals().items()) if name.startswith('test_') and callable(value)]
+    failed = 0
+    for test in tests:
+        try:
+            test()
+            print(f"OK: {test.__name__}")
+        except AssertionError as e:
+            failed += 1
+            print(f"FAIL: {test.__name__} - {e}")
+    print(f"결론: {len(tests) - failed}/{len(tests)} 통과")
+    sys.exit(1 if failed else 0)
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+템플릿 검색 색인 테스트 (DB/네트워크 불필요)
+한글 조사 정규화, 접두어 점수, 패싯 필터, 부분 문자열 대체 검색, 파일 변경 시 재구축
+"""
+
+import os
+import sys
+import json
+import tempfile
+
+from template_index import (
+    PREFIX_MATCH_RATIO, SUBSTRING_MATCH_SCORE,
+    TemplateSearchIndex, WatchedTemplateIndex, tokenize
+)
+
+DOCUMENTS = [
+    {'id': 'web', 'fields': [('React 웹 앱', 3.0), ('쇼핑몰 프론트엔드', 1.0)],
+     'facets': {'category': 'web', 'framework': 'React'}},
+    {'id': 'api', 'fields': [('FastAPI 백엔드', 3.0), ('REST API 서버', 1.0)],
+     'facets': {'category': 'backend', 'framework': 'FastAPI'}},
+    {'id': 'mobile', 'fields': [('Flutter 모바일 앱', 3.0), ('react-native 대안', 1.0)],
+     'facets': {'category': 'mobile', 'framework': 'Flutter'}},
+    {'id': 'gateway', 'fields': [('FastAPI 게이트웨이', 3.0)],
+     'facets': {'category': 'backend', 'framework': 'FastAPI'}},
+]
+
+
+def test_tokenize_strips_particles():
+    """조사는 제거하되 명사 끝 글자와 겹치는 짧은 어간은 보존"""
+    assert tokenize('웹앱을 만들고') == ['웹앱', '만들고']
+    assert tokenize('국가') == ['국가']
+    assert tokenize('ＲＥＡＣＴ') == ['react']
+
+
+def test_exact_match_outranks_prefix():
+    """완전 일치는 가중치 그대로, 접두어 일치는 비율만큼 낮은 점수"""
+    index = TemplateSearchIndex(DOCUMENTS)
+    results = dict(index.search('react'))
+    assert results['web'] == 3.0
+    assert results['mobile'] == 1.0  # react-native -> 'react' 토큰
+
+    prefix = dict(index.search('reac'))
+    assert prefix['web'] == round(3.0 * PREFIX_MATCH_RATIO, 4)
+
+
+def test_all_tokens_must_match():
+    """질의 토큰이 모두 일치하는 문서만 반환"""
+    index = TemplateSearchIndex(DOCUMENTS)
+    assert [doc_id for doc_id, _ in index.search('앱 flutter')] == ['mobile']
+
+
+def test_facet_filter():
+    """패싯 조건은 결과를 좁히기만 함"""
+    index = TemplateSearchIndex(DOCUMENTS)
+    assert [doc_id for doc_id, _ in index.search('앱', facets={'category': 'web'})] == ['web']
+    assert index.search('앱', facets={'framework': ['fastapi']}) == []
+
+
+def test_substring_fallback_only_without_token_match():
+    """토큰 일치가 있으면 부분 문자열 결과를 섞지 않음"""
+    index = TemplateSearchIndex(DOCUMENTS)
+    # 'api'는 api 문서와 토큰 일치 -> gateway 문서의 'fastapi'를 부분 문자열로 추가하지 않음
+    assert index.search('api') == [('api', 1.0)]
+
+    # 토큰 경계에 걸친 질의는 부분 문자열로만 일치
+    assert index.search('pi 백') == [('api', SUBSTRING_MATCH_SCORE)]
+
+
+def test_substring_fallback_respects_facets():
+    """대체 검색도 패싯 조건 안에서만 수행"""
+    index = TemplateSearchIndex(DOCUMENTS)
+    assert index.search('t 웹', facets={'category': 'web'}) == [('web', SUBSTRING_MATCH_SCORE)]
+    assert index.search('t 웹', facets={'category': 'backend'}) == []
+
+
+def test_watched_index_rebuilds_on_file_change():
+    """templates/*.json 파일이 바뀌면 다음 확인 때 재구축"""
+    with tempfile.TemporaryDirectory() as templates_dir:
+        path = os.path.join(templates_dir, 'one.json')
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({'name': 'one'}, f)
+
+        builds = []
+
+        def build():
+            builds.append(1)
+            return TemplateSearchIndex(DOCUMENTS[:len(builds)])
+
+        watched = WatchedTemplateIndex(templates_dir, build, check_interval=0.0)
+        assert len(watched.get()) == 1
+        assert len(watched.get()) == 1
+        assert len(builds) == 1
+
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({'name': 'one', 'description': 'changed'}, f)
+        assert len(watched.get()) == 2
+        assert watched.get_stats()['builds'] == 2
+
+
+if __name__ == "__main__":
+    tests = [value for name, value in list(globals().items()) if name.startswith('test_') and callable(value)]
+    failed = 0
+    for test in tests:
+        try:
+            test()
+            print(f"OK: {test.__name__}")
+        except AssertionError as e:
+            failed += 1
+            print(f"FAIL: {test.__name__} - {e}")
+    print(f"결론: {len(tests) - failed}/{len(tests)} 통과")
+    sys.exit(1 if failed else 0)
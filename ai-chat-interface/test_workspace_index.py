@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+MetaGPT workspace 프로젝트 색인 테스트 (임시 디렉토리 사용)
+단계 파일 수집, 바뀐 프로젝트만 재스캔, 제자리 메타데이터 수정 감지, 삭제 반영, 페이지, 경로 검증
+"""
+
+import os
+import sys
+import json
+import tempfile
+
+from workspace_index import METADATA_FILENAME, WorkspaceProjectIndex, scan_project
+
+
+def _write_project(workspace_dir, name, created_at, steps=(), requirement='req'):
+    project_path = os.path.join(workspace_dir, name)
+    os.makedirs(project_path, exist_ok=True)
+    with open(os.path.join(project_path, METADATA_FILENAME), 'w', encoding='utf-8') as f:
+        json.dump({'project_name': name, 'created_at': created_at, 'requirement': requirement}, f)
+    for step in steps:
+        with open(os.path.join(project_path, f'step_{step}_result.md'), 'w', encoding='utf-8') as f:
+            f.write(f'step {step}')
+    return project_path
+
+
+def _bump_mtime(path, seconds=10):
+    """파일시스템 mtime 해상도와 무관하게 변경을 확실히 표시"""
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + seconds * 1_000_000_000))
+
+
+def test_scan_project_collects_step_files():
+    """step_<번호>_* 중 범위 안 번호만, 같은 단계는 이름순 첫 파일"""
+    with tempfile.TemporaryDirectory() as workspace_dir:
+        project_path = _write_project(workspace_dir, 'alpha', '2026-01-01', steps=(1, 2))
+        for name in ('step_1_a.md', 'step_9_result.md', 'step_x_result.md'):
+            open(os.path.join(project_path, name), 'w').close()
+
+        project = scan_project('alpha', project_path)
+        assert project['step_files'] == {1: 'step_1_a.md', 2: 'step_2_result.md'}
+        assert project['summary']['completed_steps'] == 2
+        assert project['summary']['status'] == '2/5 단계 진행 중'
+
+        os.remove(os.path.join(project_path, METADATA_FILENAME))
+        assert scan_project('alpha', project_path) is None
+
+
+def test_refresh_rescans_only_changed_projects():
+    """변경 없는 프로젝트는 다시 읽지 않고, 제자리 메타데이터 수정은 감지"""
+    with tempfile.TemporaryDirectory() as workspace_dir:
+        _write_project(workspace_dir, 'alpha', '2026-01-01')
+        beta_path = _write_project(workspace_dir, 'beta', '2026-02-01')
+
+        index = WorkspaceProjectIndex(workspace_dir, check_interval=0.0)
+        projects, total = index.list_projects()
+        assert total == 2
+        assert [project['project_name'] for project in projects] == ['beta', 'alpha']
+        assert index.get_stats()['project_scans'] == 2
+
+        index.list_projects()
+        assert index.get_stats()['project_scans'] == 2
+
+        # 메타데이터를 덮어써도 디렉토리 mtime은 그대로 - 파일 mtime으로 감지
+        metadata_path = os.path.join(beta_path, METADATA_FILENAME)
+        with open(metadata_path, 'w', encoding='utf-8') as f:
+            json.dump({'project_name': 'beta', 'created_at': '2025-12-01', 'requirement': 'changed'}, f)
+        _bump_mtime(metadata_path)
+
+        projects, _ = index.list_projects()
+        assert index.get_stats()['project_scans'] == 3
+        assert [project['project_name'] for project in projects] == ['alpha', 'beta']
+        assert projects[1]['requirement'] == 'changed'
+
+
+def test_removed_project_disappears():
+    """삭제된 프로젝트 디렉토리는 다음 확인 때 목록에서 빠짐"""
+    with tempfile.TemporaryDirectory() as workspace_dir:
+        alpha_path = _write_project(workspace_dir, 'alpha', '2026-01-01')
+        _write_project(workspace_dir, 'beta', '2026-02-01')
+        index = WorkspaceProjectIndex(workspace_dir, check_interval=0.0)
+        assert index.list_projects()[1] == 2
+
+        os.remove(os.path.join(alpha_path, METADATA_FILENAME))
+        os.rmdir(alpha_path)
+        projects, total = index.list_projects()
+        assert total == 1
+        assert projects[0]['project_name'] == 'beta'
+
+
+def test_list_projects_pages():
+    """offset/limit 페이지와 전체 수"""
+    with tempfile.TemporaryDirectory() as workspace_dir:
+        for day in range(1, 6):
+            _write_project(workspace_dir, f'p{day}', f'2026-01-0{day}')
+        index = WorkspaceProjectIndex(workspace_dir, check_interval=0.0)
+
+        page, total = index.list_projects(offset=1, limit=2)
+        assert total == 5
+        assert [project['project_name'] for project in page] == ['p4', 'p3']
+        assert index.list_projects(offset=10, limit=2) == ([], 5)
+
+
+def test_get_project_rejects_paths_and_sees_new_steps():
+    """상세 조회는 디렉토리 이름만 허용하고, 새 단계 파일은 확인 주기와 무관하게 반영"""
+    with tempfile.TemporaryDirectory() as workspace_dir:
+        project_path = _write_project(workspace_dir, 'alpha', '2026-01-01', steps=(1,))
+        index = WorkspaceProjectIndex(workspace_dir, check_interval=3600.0)
+
+        for name in ('', '.', '..', 'alpha/../alpha', os.path.join('..', 'alpha')):
+            assert index.get_project(name) is None
+        assert index.get_project('missing') is None
+
+        assert sorted(index.get_project('alpha')['step_files']) == [1]
+        open(os.path.join(project_path, 'step_2_result.md'), 'w').close()
+        _bump_mtime(project_path)
+        assert sorted(index.get_project('alpha')['step_files']) == [1, 2]
+
+
+if __name__ == "__main__":
+    tests = [value for name, value in list(globals().items()) if name.startswith('test_') and callable(value)]
+    failed = 0
+    for test in tests:
+        try:
+            test()
+            print(f"OK: {test.__name__}")
+        except AssertionError as e:
+            failed += 1
+            print(f"FAIL: {test.__name__} - {e}")
+    print(f"결론: {len(tests) - failed}/{len(tests)} 통과")
+    sys.exit(1 if failed else 0)
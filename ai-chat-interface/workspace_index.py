@@ -0,0 +1,191 @@
+# -*- coding: utf-8 -*-
+"""
+MetaGPT workspace 프로젝트 색인 (Workspace Project Index)
+프로젝트 디렉토리마다 os.scandir 한 번으로 메타데이터/단계 파일을 수집해 캐시하고,
+디렉토리·메타데이터 mtime이 바뀐 프로젝트만 다시 읽음 - 정렬된 목록을 페이지 단위로 제공
+"""
+
+import os
+import json
+import time
+import threading
+from typing import Dict, List, Optional, Tuple
+
+METADATA_FILENAME = 'project_metadata.json'
+TOTAL_STEPS = 5
+
+# 변경 확인 주기 (초) - 요청마다 workspace 전체를 stat 하지 않도록 제한
+INDEX_CHECK_INTERVAL = 2.0
+
+
+def _stat_mtime(path: str) -> Optional[int]:
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
+def scan_project(project_dir: str, project_path: str) -> Optional[Dict]:
+    """
+    프로젝트 디렉토리 1회 스캔 - 메타데이터와 단계별 결과 파일 (메타데이터 없으면 None)
+
+    단계 파일은 step_<번호>_* 형식, 같은 단계에 여러 파일이 있으면 이름순 첫 파일 사용
+    """
+    step_files: Dict[int, str] = {}
+    has_metadata = False
+    with os.scandir(project_path) as entries:
+        for entry in entries:
+            name = entry.name
+            if name == METADATA_FILENAME:
+                has_metadata = True
+            elif name.startswith('step_'):
+                number, _, _ = name[5:].partition('_')
+                if number.isdigit() and 1 <= int(number) <= TOTAL_STEPS:
+                    step = int(number)
+                    if step not in step_files or name < step_files[step]:
+                        step_files[step] = name
+
+    if not has_metadata:
+        return None
+
+    with open(os.path.join(project_path, METADATA_FILENAME), 'r', encoding='utf-8') as f:
+        metadata = json.load(f)
+
+    completed_steps = len(step_files)
+    return {
+        'metadata': metadata,
+        'step_files': step_files,
+        'summary': {
+            'project_name': metadata.get('project_name', project_dir),
+            'project_id': metadata.get('project_id', project_dir),
+            'requirement': metadata.get('requirement', ''),
+            'created_at': metadata.get('created_at', ''),
+            'current_step': metadata.get('current_step', 1),
+            'completed_steps': completed_steps,
+            'total_steps': TOTAL_STEPS,
+            'progress_percentage': (completed_steps / TOTAL_STEPS) * 100,
+            'workspace_path': project_path,
+            'status': '완료' if completed_steps >= TOTAL_STEPS else f'{completed_steps}/{TOTAL_STEPS} 단계 진행 중'
+        }
+    }
+
+
+class WorkspaceProjectIndex:
+    """
+    workspace 하위 프로젝트 색인
+
+    프로젝트별 (디렉토리 mtime, 메타데이터 mtime)을 기억해 바뀐 프로젝트만 재스캔하며,
+    목록 정렬(생성일 최신순)은 색인이 바뀐 경우에만 다시 수행
+    """
+
+    def __init__(self, workspace_dir: str, check_interval: float = INDEX_CHECK_INTERVAL):
+        self.workspace_dir = workspace_dir
+        self.check_interval = check_interval
+
+        # 디렉토리명 -> (디렉토리 mtime, 메타데이터 mtime, 스캔 결과 또는 None)
+        self._projects: Dict[str, Tuple[Optional[int], Optional[int], Optional[Dict]]] = {}
+        self._sorted: Optional[List[Dict]] = None
+        self._last_check = 0.0
+        self._lock = threading.Lock()
+        self._stats = {'refreshes': 0, 'project_scans': 0, 'last_refresh_seconds': None}
+
+    def exists(self) -> bool:
+        return os.path.isdir(self.workspace_dir)
+
+    def refresh(self, force: bool = False) -> None:
+        """확인 주기가 지났으면 변경된 프로젝트만 다시 스캔"""
+        now = time.monotonic()
+        if not force and now - self._last_check < self.check_interval:
+            return
+
+        with self._lock:
+            if not force and now - self._last_check < self.check_interval:
+                return
+            started = time.perf_counter()
+
+            seen = set()
+            changed = False
+            try:
+                entries = list(os.scandir(self.workspace_dir))
+            except OSError:
+                entries = []
+
+            for entry in entries:
+                try:
+                    if not entry.is_dir():
+                        continue
+                    dir_mtime = entry.stat().st_mtime_ns
+                except OSError:
+                    continue
+
+                seen.add(entry.name)
+                # 메타데이터를 제자리에서 덮어쓰면 디렉토리 mtime은 바뀌지 않으므로 파일 mtime도 확인
+                meta_mtime = _stat_mtime(os.path.join(entry.path, METADATA_FILENAME))
+                cached = self._projects.get(entry.name)
+                if cached is not None and cached[0] == dir_mtime and cached[1] == meta_mtime:
+                    continue
+
+                try:
+                    project = scan_project(entry.name, entry.path)
+                except Exception as e:
+                    print(f"프로젝트 메타데이터 읽기 실패: {entry.name} - {e}")
+                    project = None
+                self._projects[entry.name] = (dir_mtime, meta_mtime, project)
+                self._stats['project_scans'] += 1
+                changed = True
+
+            for name in [name for name in self._projects if name not in seen]:
+                del self._projects[name]
+                changed = True
+
+            if changed or self._sorted is None:
+                projects = [cached[2] for cached in self._projects.values() if cached[2] is not None]
+                # 최신 순으로 정렬
+                projects.sort(key=lambda project: str(project['summary']['created_at']), reverse=True)
+                self._sorted = projects
+
+            self._last_check = now
+            self._stats['refreshes'] += 1
+            self._stats['last_refresh_seconds'] = round(time.perf_counter() - started, 4)
+
+    def list_projects(self, offset: int = 0, limit: Optional[int] = None) -> Tuple[List[Dict], int]:
+        """정렬된 프로젝트 요약 한 페이지와 전체 수"""
+        self.refresh()
+        projects = self._sorted or []
+        offset = max(0, offset)
+        end = None if limit is None else offset + max(0, limit)
+        return [project['summary'] for project in projects[offset:end]], len(projects)
+
+    def get_project(self, project_dir: str) -> Optional[Dict]:
+        """
+        프로젝트 한 개 (메타데이터 + 단계 파일 목록)
+
+        상세 조회는 최신 상태가 중요하므로 확인 주기와 무관하게 해당 프로젝트 mtime만 확인
+        """
+        if project_dir in ('', '.', '..') or os.sep in project_dir or '/' in project_dir:
+            return None
+        project_path = os.path.join(self.workspace_dir, project_dir)
+        dir_mtime = _stat_mtime(project_path)
+        if dir_mtime is None or not os.path.isdir(project_path):
+            return None
+        meta_mtime = _stat_mtime(os.path.join(project_path, METADATA_FILENAME))
+
+        with self._lock:
+            cached = self._projects.get(project_dir)
+            if cached is not None and cached[0] == dir_mtime and cached[1] == meta_mtime:
+                return cached[2]
+
+            project = scan_project(project_dir, project_path)
+            self._projects[project_dir] = (dir_mtime, meta_mtime, project)
+            self._stats['project_scans'] += 1
+            # 목록 정렬은 다음 목록 조회 때 다시 수행
+            self._sorted = None
+            self._last_check = 0.0
+            return project
+
+    def get_stats(self) -> Dict:
+        with self._lock:
+            stats = dict(self._stats)
+            stats['projects'] = sum(1 for cached in self._projects.values() if cached[2] is not None)
+        stats['workspace_dir'] = self.workspace_dir
+        return stats